@@ -0,0 +1,116 @@
+"""Parsing of bulk property uploads (POST /v1/properties/bulk).
+
+Accepted bodies, by Content-Type (or, for a multipart `file` upload, by the part's type or extension):
+
+- application/json: a list of PropertyCreate objects
+- application/x-ndjson: one PropertyCreate object per line
+- text/csv: a header row naming the PropertyCreate fields, `picture_urls` separated by spaces
+
+Rows are returned raw, one entry per input row: a dict to validate, or the reason it couldn't be read,
+so one malformed line is reported in the per-row results instead of failing the whole upload.
+"""
+import csv
+import io
+import json
+from typing import List, Union
+from fastapi import HTTPException, Request, status
+from app.core.config import settings
+
+JSON_MEDIA_TYPE = "application/json"
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+CSV_MEDIA_TYPE = "text/csv"
+
+# multipart uploads sent as application/octet-stream are recognised by their file name
+EXTENSION_MEDIA_TYPES = {".json": JSON_MEDIA_TYPE, ".ndjson": NDJSON_MEDIA_TYPES[0], ".jsonl": NDJSON_MEDIA_TYPES[0], ".csv": CSV_MEDIA_TYPE}
+
+RawRow = Union[dict, str]
+
+
+def _media_type(content_type: str) -> str:
+    return content_type.split(";")[0].strip().lower()
+
+
+def _bad_request(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+def _decode(content: bytes) -> str:
+    try:
+        return content.decode("utf-8-sig") # Excel prefixes its CSV exports with a BOM
+    except UnicodeDecodeError:
+        raise _bad_request("The upload must be UTF-8 encoded.")
+
+
+def _json_rows(text: str) -> List[RawRow]:
+    try:
+        rows = json.loads(text)
+    except ValueError:
+        raise _bad_request("Invalid JSON body.")
+    if not isinstance(rows, list):
+        raise _bad_request("Expected a JSON list of properties.")
+    return [row if isinstance(row, dict) else "Expected a JSON object." for row in rows]
+
+
+def _ndjson_rows(text: str) -> List[RawRow]:
+    rows = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            rows.append("Invalid JSON line.")
+            continue
+        rows.append(row if isinstance(row, dict) else "Expected a JSON object.")
+    return rows
+
+
+def _csv_rows(text: str) -> List[RawRow]:
+    rows = []
+    for record in csv.DictReader(io.StringIO(text, newline="")):
+        if None in record: # more cells than header columns
+            rows.append("Too many columns.")
+            continue
+        row = {field: value for field, value in record.items() if value not in (None, "")}
+        # empty cells are missing values: latitude/longitude default to None, required fields fail validation
+        row["picture_urls"] = (record.get("picture_urls") or "").split()
+        rows.append(row)
+    return rows
+
+
+def parse_rows(content: bytes, content_type: str) -> List[RawRow]:
+    media_type = _media_type(content_type)
+    if media_type == JSON_MEDIA_TYPE:
+        rows = _json_rows(_decode(content))
+    elif media_type in NDJSON_MEDIA_TYPES:
+        rows = _ndjson_rows(_decode(content))
+    elif media_type == CSV_MEDIA_TYPE:
+        rows = _csv_rows(_decode(content))
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Upload a JSON list, NDJSON or CSV."
+        )
+    if len(rows) > settings.bulk_import_max_rows:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.bulk_import_max_rows} properties per import."
+        )
+    return rows
+
+
+async def read_upload(request: Request) -> List[RawRow]:
+    """The raw rows of a bulk upload: the request body itself, or the `file` field of a multipart form."""
+    content_type = request.headers.get("content-type", "")
+    if _media_type(content_type) != "multipart/form-data":
+        return parse_rows(await request.body(), content_type)
+
+    form = await request.form()
+    upload = form.get("file")
+    if upload is None or isinstance(upload, str):
+        raise _bad_request("Attach the properties as a 'file' field.")
+    media_type = _media_type(upload.content_type or "")
+    if media_type not in (JSON_MEDIA_TYPE, CSV_MEDIA_TYPE, *NDJSON_MEDIA_TYPES):
+        extension = "." + (upload.filename or "").rsplit(".", 1)[-1].lower()
+        media_type = EXTENSION_MEDIA_TYPES.get(extension, media_type)
+    return parse_rows(await upload.read(), media_type)
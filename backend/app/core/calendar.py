@@ -0,0 +1,148 @@
+"""Availability calendars: occupied nights of a property as compact bitmaps.
+
+A month is an int bitmask (bit d - 1 set = night of day d is booked), built from booking_nights with a
+primary-key range scan. Windows spanning several months are stitched from the month masks and sent
+to the client as a base64 bitmap plus run-length encoded runs (see GET /v1/properties/{id}/calendar).
+
+Month masks are cached per property in the process (LRU over properties, TTL per month, at most
+CALENDAR_CACHE_MONTHS per property).
+create_booking and delete_property invalidate what they change; a booking made through another
+worker is seen at the latest after CALENDAR_CACHE_TTL_SECONDS.
+"""
+import base64
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.core.config import settings
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+def next_month(month: date) -> date:
+    if month.year == date.max.year and month.month == 12:
+        # the first day of year 10000 isn't a date: date.max stands in for it (no night reaches it,
+        # a booking's date_out can't go past date.max)
+        return date.max
+    return (month.replace(day=1) + timedelta(days=32)).replace(day=1)
+
+def days_after(day: date, days: int) -> date:
+    # day + days, stopping at date.max instead of overflowing
+    return day + timedelta(days=min(days, (date.max - day).days))
+
+def months_between(start: date, end: date) -> List[date]:
+    # first days of the months holding at least one night of [start, end)
+    months = []
+    month = month_start(start)
+    while month < end:
+        months.append(month)
+        month = next_month(month)
+    return months
+
+def month_masks(nights: Iterable[date], months: Iterable[date]) -> Dict[date, int]:
+    masks = {month: 0 for month in months}
+    for night in nights:
+        masks[month_start(night)] |= 1 << (night.day - 1)
+    return masks
+
+def window_mask(masks: Dict[date, int], start: date, end: date) -> int:
+    # bit i set = night start + i is booked, for the nights of [start, end)
+    bits = 0
+    for month in months_between(start, end):
+        offset = (month - start).days # negative for the month `start` falls in
+        bits |= masks[month] << offset if offset >= 0 else masks[month] >> -offset
+    return bits & ((1 << (end - start).days) - 1)
+
+def encode_bitmap(bits: int, days: int) -> str:
+    # byte 0 holds nights 0-7, least significant bit first
+    return base64.b64encode(bits.to_bytes((days + 7) // 8, "little")).decode()
+
+def runs(bits: int) -> List[Tuple[int, int]]:
+    # (offset, length) of each stretch of booked nights
+    found = []
+    offset = 0
+    while bits:
+        skipped = (bits & -bits).bit_length() - 1 # free nights before the next booked one
+        bits >>= skipped
+        offset += skipped
+        length = (~bits & (bits + 1)).bit_length() - 1 # booked nights in a row
+        found.append((offset, length))
+        bits >>= length
+        offset += length
+    return found
+
+
+CALENDAR_CACHE_MONTHS = 24 # two calendar windows of CALENDAR_MAX_DAYS
+
+
+class CalendarCache:
+    """Month masks per property: LRU over `max_properties`, each month cached for `ttl_seconds`,
+    at most `max_months` per property (the least recently stored go first)."""
+
+    def __init__(self, max_properties: int, ttl_seconds: float, max_months: int = CALENDAR_CACHE_MONTHS):
+        self.max_properties = max_properties
+        self.ttl_seconds = ttl_seconds
+        self.max_months = max_months
+        self._entries = OrderedDict() # property_id -> {month: (mask, expires_at)}, in the order they were stored
+        self._lock = threading.Lock()
+
+    def get(self, property_id: int, months: Iterable[date]) -> Dict[date, int]:
+        """The cached masks among `months`, the missing ones are left out."""
+        if self.max_properties <= 0:
+            return {}
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            entry = self._entries.get(property_id)
+            if entry is None:
+                return found
+            self._entries.move_to_end(property_id)
+            for month in months:
+                cached = entry.get(month)
+                if cached is None:
+                    continue
+                if cached[1] <= now:
+                    del entry[month]
+                    continue
+                found[month] = cached[0]
+        return found
+
+    def put(self, property_id: int, masks: Dict[date, int]):
+        if self.max_properties <= 0:
+            return
+        now = time.monotonic()
+        expires_at = now + self.ttl_seconds
+        with self._lock:
+            entry = self._entries.setdefault(property_id, {})
+            for month, mask in masks.items():
+                entry.pop(month, None) # stored again: moves to the end
+                entry[month] = (mask, expires_at)
+            # stored order is expiry order: drop the expired months, then the oldest above the cap
+            while entry and (len(entry) > self.max_months or next(iter(entry.values()))[1] <= now):
+                del entry[next(iter(entry))]
+            self._entries.move_to_end(property_id)
+            while len(self._entries) > self.max_properties:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, property_id: int, months: Optional[Iterable[date]] = None):
+        # every month of the property when `months` is None (deleted property, its id can be reused)
+        with self._lock:
+            if months is None:
+                self._entries.pop(property_id, None)
+                return
+            entry = self._entries.get(property_id)
+            if entry is not None:
+                for month in months:
+                    entry.pop(month, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+calendar_cache = CalendarCache(settings.calendar_cache_size, settings.calendar_cache_ttl_seconds)
@@ -1,13 +1,46 @@
 from pydantic_settings import BaseSettings
+from typing import Optional
 import os
 
 class Settings(BaseSettings):
     frontend_url: str
-    database_url: str
+    database_url: str # search uses FTS5 on SQLite; elsewhere a per-worker in-memory index, rebuilt when another worker writes (see app.core.search)
+    database_async: bool = False # async engine + AsyncSession instead of a sync engine run in the threadpool
+    database_echo: bool = False # log every SQL statement (dev only, it is synchronous and verbose)
+    database_pool_size: int = 5 # connections kept open in the pool
+    database_max_overflow: int = 10 # extra connections allowed under load, closed when returned
+    database_pool_timeout: float = 30 # seconds to wait for a connection before failing the request
+    database_pool_recycle: int = -1 # seconds after which a connection is replaced (-1 = never)
+    database_pool_pre_ping: bool = False # test connections on checkout (survives server-side disconnects)
+    database_slow_query_ms: float = 200 # statements slower than this are logged with their parameters (0 disables)
+    query_stats_enabled: bool = True # per-request query count and DB time: Server-Timing header + log line (see app.core.db)
     environment: str = "development"
     secret_key: str
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    token_cache_size: int = 10000 # verified tokens kept in memory by get_current_user (0 disables the cache)
+    token_cache_ttl_seconds: int = 300 # upper bound on how long a verified token is trusted without re-checking
+    property_cache_backend: str = "memory" # PropertyRead card cache: memory, redis or none (see app.core.property_cache)
+    property_cache_url: str = "redis://localhost:6379/0" # only used by the redis backend
+    property_cache_size: int = 10000 # cards kept by the memory backend
+    property_cache_ttl_seconds: int = 60 # also bounds how stale another worker's memory cache can be
+    calendar_cache_size: int = 10000 # properties whose month bitmaps are kept in memory (0 disables the cache)
+    calendar_cache_ttl_seconds: int = 60 # bounds how stale a calendar can be after a booking made through another worker
+    calendar_default_days: int = 90 # GET /{property_id}/calendar window when ?to= is omitted
+    calendar_max_days: int = 366
+    max_stay_nights: int = 365 # longest booking accepted: each night is a booking_nights row written in one transaction
+    fast_json_responses: bool = False # write list/detail responses with orjson, skipping response_model re-validation (see app.core.responses)
+    export_batch_size: int = 1000 # rows fetched per round-trip by the NDJSON export endpoints
+    bulk_import_max_rows: int = 100000 # rows accepted by one POST /v1/properties/bulk
+    bulk_import_chunk_size: int = 1000 # rows per multi-row INSERT of a bulk import
+    request_profiling: bool = False # opt in (staging, development): profile a request flagged with ?profile=1 / X-Profile: 1 (never in production, see app.core.profiling)
+    request_profiling_dir: Optional[str] = None # also keep each profile there as a .prof file
+    internal_token: Optional[str] = None # bearer token of /metrics and /internal/* (unset: open outside production, hidden in production)
+    metrics_enabled: bool = True # per-route request counts and latency histograms on GET /metrics (see app.core.metrics)
+    default_page_size: int = 20
+    max_page_size: int = 100
+    list_max_pictures: Optional[int] = None # default ?max_pictures= of list views (None = every picture)
+    max_search_radius_km: float = 100 # bounds the number of grid cells a radius search can scan
     
     class Config:
         env_file = ".env.test" if os.getenv("ENVIRONMENT") == "test" else ".env" # use 'ENVIRONMENT=test pytest' when testing
@@ -16,4 +49,8 @@ class Settings(BaseSettings):
     def is_testing(self) -> bool:
         return self.environment == "test"    
 
+    @property
+    def is_production(self) -> bool:
+        return self.environment == "production"
+
 settings = Settings()
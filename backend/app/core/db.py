@@ -1,21 +1,300 @@
-from sqlmodel import SQLModel, create_engine, Session
+import asyncio
+import logging
+import weakref
+from contextlib import AsyncExitStack, asynccontextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.concurrency import run_in_threadpool
 from .config import settings
+from .migrations import run_migrations
+from .pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool
+from .startup import startup_timer
 
-# Explicitly importing the models into memory so we can create our tables with create_all()
-from app.models.user import User
-from app.models.property import Property
-from app.models.booking import Booking
+# The models are not imported here: importing any of them loads the whole app.models package
+# (so their string relationships resolve), and the migrations load it when create_all() needs them
 
-engine = create_engine(
-    settings.database_url,
-    echo=True  # echo logs SQL statements, good for dev (set to False in production)
-)
+# async drivers for the sync URLs we accept in DATABASE_URL
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
 
-def create_db_and_tables():
-    SQLModel.metadata.create_all(engine)
+def async_database_url(database_url: str) -> str:
+    url = make_url(database_url)
+    return url.set(drivername=ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername)).render_as_string(hide_password=False)
+
+def engine_connect_args(database_url: str) -> dict:
+    # sessions may be used from a different thread than the one that opened the connection
+    # (threadpool in sync mode, aiosqlite worker threads in async mode)
+    return {"check_same_thread": False} if make_url(database_url).get_backend_name() == "sqlite" else {}
+
+def engine_options(database_url: str, async_mode: bool = False) -> dict:
+    """create_engine() keyword arguments from Settings (echo, pool sizing, timeouts)."""
+    options = {
+        "echo": settings.database_echo, # good for dev, keep it off in production
+        "connect_args": engine_connect_args(database_url),
+    }
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return options # in-memory SQLite uses a single shared connection, pool sizing does not apply
+    options.update({
+        "poolclass": InstrumentedAsyncQueuePool if async_mode else InstrumentedQueuePool,
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_timeout": settings.database_pool_timeout,
+        "pool_recycle": settings.database_pool_recycle,
+        "pool_pre_ping": settings.database_pool_pre_ping,
+    })
+    return options
+
+
+query_logger = logging.getLogger("app.db")
+
+
+class QueryStats:
+    """Statements run and time spent in the database by one request."""
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.seconds * 1000:.2f};desc="{self.count} queries"'
+
+
+# set per request by QueryStatsMiddleware; the threadpool (sync mode) and SQLAlchemy's greenlets
+# (async mode) run with a copy of the request's context, so the engine events below see it too
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("current_query_stats", default=None)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started = perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = perf_counter() - context._query_started
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+    if 0 < settings.database_slow_query_ms <= elapsed * 1000:
+        params = repr(parameters)
+        query_logger.warning(
+            "slow query: %.1fms %s params=%s", elapsed * 1000, statement, params[:1000],
+            extra={"event": "slow_query", "duration_ms": round(elapsed * 1000, 2), "statement": statement, "parameters": params[:1000]},
+        )
+
+def track_queries(sync_engine):
+    """Attribute the engine's statements to the current request (QueryStats) and log the slow ones."""
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    return sync_engine
+
+
+class QueryStatsMiddleware:
+    """Pure ASGI middleware: per-request query count and DB time in a Server-Timing header and a log line.
+
+    The header covers what ran before the response started; the log line is written once the body is
+    sent, so it also counts what a streaming body queried.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [*message.get("headers", ()), (b"server-timing", stats.server_timing().encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_query_stats.reset(token)
+            query_logger.info(
+                "%s %s status=%d queries=%d db_ms=%.2f", scope["method"], scope["path"], status_code, stats.count, stats.seconds * 1000,
+                extra={"event": "request_queries", "method": scope["method"], "path": scope["path"], "status": status_code,
+                       "queries": stats.count, "db_ms": round(stats.seconds * 1000, 2)},
+            )
+
+
+with startup_timer.phase("engines"):
+    # the sync engine is always available: migrations, scripts and tests use it
+    engine = track_queries(create_engine(settings.database_url, **engine_options(settings.database_url)))
+
+    # the async engine only exists when the app runs in async mode (DATABASE_ASYNC=true)
+    async_engine = create_async_engine(
+        async_database_url(settings.database_url),
+        **engine_options(settings.database_url, async_mode=True)
+    ) if settings.database_async else None
+    if async_engine is not None:
+        track_queries(async_engine.sync_engine)
+
+def migrate_database():
+    # versioned migrations instead of a bare create_all(), so schema changes (e.g. new indexes)
+    # are applied to existing databases too
+    run_migrations(engine)
 
 # @contextmanager -> not needed because FastAPI sees the yield and treat it like a dependency generator 
 # This happens because we are calling Depends() on get_session
 def get_session():
     with Session(engine) as session:
-        yield session
\ No newline at end of file
+        yield session
+
+
+class ThreadpoolSession:
+    """AsyncSession-compatible facade over a blocking Session.
+
+    Every database round-trip runs in Starlette's threadpool, so the routes are written once
+    against the AsyncSession API and still work on the sync engine (DATABASE_ASYNC=false).
+    """
+
+    def __init__(self, session: Session):
+        self.sync_session = session
+
+    def add(self, instance):
+        self.sync_session.add(instance)
+
+    def add_all(self, instances):
+        self.sync_session.add_all(instances)
+
+    async def exec(self, statement, **kwargs):
+        # buffer the rows like AsyncSession does, so iterating the result never touches the connection
+        kwargs.setdefault("execution_options", {"prebuffer_rows": True})
+        return await run_in_threadpool(self.sync_session.exec, statement, **kwargs)
+
+    async def execute(self, statement, *args, **kwargs):
+        kwargs.setdefault("execution_options", {"prebuffer_rows": True})
+        return await run_in_threadpool(self.sync_session.execute, statement, *args, **kwargs)
+
+    async def stream(self, statement, **kwargs):
+        # not buffered: rows are fetched batch by batch while iterating (yield_per / server-side cursor)
+        kwargs.setdefault("execution_options", {"stream_results": True})
+        return ThreadpoolResult(await run_in_threadpool(self.sync_session.exec, statement, **kwargs))
+
+    async def get(self, entity, ident, **kwargs):
+        return await run_in_threadpool(self.sync_session.get, entity, ident, **kwargs)
+
+    async def flush(self):
+        await run_in_threadpool(self.sync_session.flush)
+
+    async def commit(self):
+        await run_in_threadpool(self.sync_session.commit)
+
+    async def rollback(self):
+        await run_in_threadpool(self.sync_session.rollback)
+
+    async def refresh(self, instance):
+        await run_in_threadpool(self.sync_session.refresh, instance)
+
+    async def delete(self, instance):
+        await run_in_threadpool(self.sync_session.delete, instance)
+
+    async def close(self):
+        await run_in_threadpool(self.sync_session.close)
+
+
+class ThreadpoolResult:
+    """AsyncResult-compatible facade over a streaming Result (see ThreadpoolSession.stream)."""
+
+    def __init__(self, result):
+        self.result = result
+
+    async def partitions(self, size: Optional[int] = None):
+        partitions = self.result.partitions(size)
+        while (partition := await run_in_threadpool(next, partitions, None)) is not None:
+            yield partition
+
+    async def close(self):
+        await run_in_threadpool(self.result.close)
+
+
+def pool_capacity(engine) -> Optional[int]:
+    """Max connections the engine's pool hands out at once (None when unbounded or not an engine)."""
+    pool = getattr(engine, "pool", None)
+    if isinstance(pool, QueuePool) and pool._max_overflow >= 0:
+        return pool.size() + pool._max_overflow
+    return None
+
+
+class SessionSlots:
+    """Caps the number of open ThreadpoolSessions at the pool capacity.
+
+    A ThreadpoolSession keeps its connection between awaits. Without this cap, threadpool workers
+    could all be blocked waiting for a connection while the sessions holding the connections wait
+    for a free worker (deadlock until the pool timeout). Waiting happens here, on the event loop.
+    One semaphore per event loop, since asyncio primitives can't be shared across loops.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def acquire(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.capacity)
+        return semaphore
+
+
+def session_factory(sync_engine, async_engine=None):
+    """Build `open_session()`, the async context manager behind the routes' sessions.
+
+    Yields an AsyncSession when an async engine is given, a ThreadpoolSession over the sync engine otherwise.
+    expire_on_commit=False in both modes: attributes stay readable after commit without implicit IO.
+    A connection already in a transaction can stand in for an engine (the tests' rolled-back
+    transaction): commits then only release a SAVEPOINT.
+    """
+    if async_engine is not None:
+        @asynccontextmanager
+        async def open_session():
+            async with AsyncSession(async_engine, expire_on_commit=False, join_transaction_mode="create_savepoint") as session:
+                yield session
+    else:
+        capacity = pool_capacity(sync_engine)
+        slots = SessionSlots(capacity) if capacity is not None else None
+
+        @asynccontextmanager
+        async def open_session():
+            async with AsyncExitStack() as stack:
+                if slots is not None:
+                    await stack.enter_async_context(slots.acquire())
+                session = ThreadpoolSession(Session(sync_engine, expire_on_commit=False, join_transaction_mode="create_savepoint"))
+                try:
+                    yield session
+                finally:
+                    await session.close()
+    return open_session
+
+
+def session_dependency(open_session):
+    """The session dependency used by the routes (one session per request)."""
+    async def get_async_session():
+        async with open_session() as session:
+            yield session
+    return get_async_session
+
+open_async_session = session_factory(engine, async_engine)
+get_async_session = session_dependency(open_async_session)
+
+def get_session_factory():
+    # for StreamingResponse bodies: they run after the request's dependencies (and their session)
+    # are closed, so the body opens its own session with this
+    return open_async_session
@@ -1,12 +1,23 @@
-from fastapi import Depends, HTTPException, status
+import hmac
+from typing import Optional
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
+from app.core.config import settings
 from app.core.security import decode_access_token
+from app.core.token_cache import VerifiedTokenCache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/v1/users/login")
 
-def get_current_user(token: str = Depends(oauth2_scheme)) -> dict:
-    payload = decode_access_token(token)
+# the same token comes back on every request of a browsing session: verify its signature once
+token_cache = VerifiedTokenCache(settings.token_cache_size, settings.token_cache_ttl_seconds)
+
+# async: decoding the token is pure CPU work, no need to hop to the threadpool for it
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> dict:
+    payload = token_cache.get(token)
+    if payload is None:
+        payload = decode_access_token(token) # raises 401 if invalid or expired
+        token_cache.put(token, payload)
 
     user_id = payload.get("sub") # sub = subject (who the token is about)
     role = payload.get("role")
@@ -22,3 +33,20 @@ def get_current_user(token: str = Depends(oauth2_scheme)) -> dict:
         "user_id": int(user_id),
         "role": role
     }
+
+
+# Operational endpoints (/metrics, /internal/*): INTERNAL_TOKEN as a bearer token when it is set.
+# Without one they are open outside production (local runs, tests) and not served in production.
+def require_internal_access(authorization: Optional[str] = Header(default=None)):
+    expected = settings.internal_token
+    if expected is None:
+        if settings.is_production:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+        return
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), expected.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid internal token.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
@@ -0,0 +1,59 @@
+"""Strong ETags and conditional GET (If-None-Match -> 304 Not Modified).
+
+Versions come from the database, not from process memory, so every worker agrees on them:
+- the properties catalog has a row in catalog_versions, bumped by create_property and delete_property
+- each property stores the catalog version it was created with (properties.version), which stays
+  unique even if the database reuses the id of a deleted property
+"""
+from typing import Optional
+from fastapi import Response, status
+from sqlalchemy import insert, select, update
+from app.models.catalog_version import CatalogVersion
+
+PROPERTIES_CATALOG = "properties"
+
+# revalidate on every use, and only in the user's own cache (responses depend on the token)
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses the weak comparison: W/ prefixes are ignored, "*" matches anything."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def set_etag(response: Response, etag: str):
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+async def catalog_version(session, name: str = PROPERTIES_CATALOG) -> int:
+    version = (await session.exec(select(CatalogVersion.version).where(CatalogVersion.name == name))).scalar_one_or_none()
+    return version or 0
+
+
+async def bump_catalog_version(session, name: str = PROPERTIES_CATALOG) -> int:
+    """Increment the version inside the caller's transaction and return the new value."""
+    version = (await session.exec(
+        update(CatalogVersion)
+        .where(CatalogVersion.name == name)
+        .values(version=CatalogVersion.version + 1)
+        .returning(CatalogVersion.version)
+    )).scalar_one_or_none()
+    if version is None:
+        version = 2 # row missing (emptied table): restart above the version 0 reported for it
+        await session.exec(insert(CatalogVersion).values(name=name, version=version))
+    return version
@@ -0,0 +1,66 @@
+"""City/state facet counts ("Lisbon (1,240) · Porto (830)") for the browse UI.
+
+The counts live in the property_facets table, one row per (state, city). Every write to properties
+adjusts them in its own transaction (create_property, delete_property, the bulk import), so
+GET /v1/properties/facets reads a handful of rows whatever the catalog size.
+
+Those writes all bump the catalog version first (app.core.etag), which serializes them on the
+catalog_versions row: the update-then-insert below can't race with another writer.
+
+Rows written behind the routes' back (SQL scripts, restores) leave the counts stale until a rebuild:
+`python -m app.core.facets`.
+"""
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+from sqlalchemy import Connection, delete, func, insert, select, update
+from app.models.property import Property
+from app.models.property_facet import PropertyFacet
+
+FacetKey = Tuple[str, str] # (state, city)
+
+
+def facet_deltas(locations: Iterable[FacetKey], sign: int = 1) -> Dict[FacetKey, int]:
+    return {location: sign * count for location, count in Counter(locations).items()}
+
+
+async def adjust_facets(session, deltas: Dict[FacetKey, int]):
+    """Add `deltas` to the counts inside the caller's transaction; locations left empty are dropped."""
+    emptied = False
+    for (state, city), delta in deltas.items():
+        if delta == 0:
+            continue
+        count = (await session.exec(
+            update(PropertyFacet)
+            .where(PropertyFacet.state == state, PropertyFacet.city == city)
+            .values(count=PropertyFacet.count + delta)
+            .returning(PropertyFacet.count)
+        )).scalar_one_or_none()
+        if count is None:
+            count = delta
+            await session.exec(insert(PropertyFacet).values(state=state, city=city, count=count))
+        emptied = emptied or count <= 0
+    if emptied:
+        await session.exec(delete(PropertyFacet).where(PropertyFacet.count <= 0))
+
+
+async def facet_counts(session) -> List[Tuple[str, str, int]]:
+    # (state, city, count) rows
+    return (await session.exec(select(PropertyFacet.state, PropertyFacet.city, PropertyFacet.count))).all()
+
+
+def rebuild_facets(conn: Connection) -> int:
+    """Recount every (state, city) from properties; returns the number of locations."""
+    conn.execute(delete(PropertyFacet))
+    conn.execute(insert(PropertyFacet).from_select(
+        ["state", "city", "count"],
+        select(Property.state, Property.city, func.count()).group_by(Property.state, Property.city)
+    ))
+    return conn.execute(select(func.count()).select_from(PropertyFacet)).scalar_one()
+
+
+if __name__ == "__main__":
+    from app.core.db import engine
+
+    with engine.begin() as conn:
+        locations = rebuild_facets(conn)
+    print(f"property facets rebuilt: {locations} locations")
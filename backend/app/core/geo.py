@@ -0,0 +1,53 @@
+"""Grid-cell spatial index helpers for radius searches.
+
+The globe is cut into CELL_DEGREES x CELL_DEGREES cells and every property stores the id of its cell
+(`properties.geo_cell`, indexed). Cell ids grow with longitude inside a latitude row, so the cells
+covering a bounding box are one contiguous id range per latitude row, i.e. a handful of index range scans.
+"""
+from math import asin, cos, floor, radians, sin, sqrt
+from typing import List, Optional, Tuple
+
+CELL_DEGREES = 0.1 # ~11 km of latitude
+LATITUDE_ROWS = int(180 / CELL_DEGREES)
+LONGITUDE_COLUMNS = int(360 / CELL_DEGREES)
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.32 # one degree of latitude (and of longitude at the equator)
+
+def _row(latitude: float) -> int:
+    return min(int(floor((latitude + 90) / CELL_DEGREES)), LATITUDE_ROWS - 1)
+
+def _column(longitude: float) -> int:
+    return int(floor((longitude + 180) / CELL_DEGREES)) % LONGITUDE_COLUMNS
+
+def cell_id(latitude: Optional[float], longitude: Optional[float]) -> Optional[int]:
+    if latitude is None or longitude is None:
+        return None
+    return _row(latitude) * LONGITUDE_COLUMNS + _column(longitude)
+
+def cell_ranges(latitude: float, longitude: float, radius_km: float) -> List[Tuple[int, int]]:
+    """Inclusive cell id ranges covering the bounding box of the circle."""
+    delta_latitude = radius_km / KM_PER_DEGREE
+    min_row = _row(max(latitude - delta_latitude, -90.0))
+    max_row = _row(min(latitude + delta_latitude, 90.0))
+
+    # widest longitude span of the circle is at the latitude closest to a pole
+    widest_latitude = min(abs(latitude) + delta_latitude, 89.9)
+    delta_longitude = radius_km / (KM_PER_DEGREE * cos(radians(widest_latitude)))
+    if delta_longitude >= 180:
+        columns = [(0, LONGITUDE_COLUMNS - 1)]
+    else:
+        first, last = _column(longitude - delta_longitude), _column(longitude + delta_longitude)
+        # wrap around the antimeridian
+        columns = [(first, last)] if first <= last else [(first, LONGITUDE_COLUMNS - 1), (0, last)]
+
+    return [
+        (row * LONGITUDE_COLUMNS + start, row * LONGITUDE_COLUMNS + end)
+        for row in range(min_row, max_row + 1)
+        for start, end in columns
+    ]
+
+def haversine_km(latitude_a: float, longitude_a: float, latitude_b: float, longitude_b: float) -> float:
+    d_latitude = radians(latitude_b - latitude_a)
+    d_longitude = radians(longitude_b - longitude_a)
+    a = sin(d_latitude / 2) ** 2 + cos(radians(latitude_a)) * cos(radians(latitude_b)) * sin(d_longitude / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * asin(sqrt(a))
@@ -0,0 +1,118 @@
+"""Per-route request metrics, exposed in the Prometheus text format on GET /metrics.
+
+MetricsMiddleware times every HTTP request and records it under its route template
+(`/v1/properties/{property_id}`, not the raw path, so ids don't explode the number of series):
+a request counter per status class and a latency histogram.
+
+Recording is kept to a few microseconds: each (method, route) series is created once with its
+histogram buckets preallocated, then a request costs a dict lookup, a bisect and a few integer
+increments. The middleware runs on the event loop thread, so increments need no lock; the lock is
+only taken to create a series.
+
+Counters are per process: with several workers, scrape each one (or aggregate in Prometheus).
+With INTERNAL_TOKEN set, the scraper sends it as a bearer token (see require_internal_access).
+"""
+import threading
+from bisect import bisect_left
+from time import perf_counter
+from typing import Dict, Sequence, Tuple
+
+# upper bounds in seconds (Prometheus client defaults), +Inf is implicit
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+STATUS_CLASSES = ("1xx", "2xx", "3xx", "4xx", "5xx")
+# requests no route matched (404s, CORS preflights): one series instead of one per raw path
+UNMATCHED_ROUTE = "<unmatched>"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class RouteSeries:
+    __slots__ = ("bucket_counts", "status_counts", "total_seconds", "count")
+
+    def __init__(self, buckets: int):
+        self.bucket_counts = [0] * (buckets + 1) # not cumulative, the last one is +Inf
+        self.status_counts = [0] * len(STATUS_CLASSES)
+        self.total_seconds = 0.0
+        self.count = 0
+
+
+class RouteMetrics:
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple[str, str], RouteSeries] = {}
+        self._lock = threading.Lock()
+
+    def _create(self, key: Tuple[str, str]) -> RouteSeries:
+        with self._lock:
+            return self._series.setdefault(key, RouteSeries(len(self.buckets)))
+
+    def record(self, method: str, route: str, status_code: int, seconds: float):
+        series = self._series.get((method, route)) or self._create((method, route))
+        series.bucket_counts[bisect_left(self.buckets, seconds)] += 1
+        series.status_counts[min(max(status_code // 100, 1), 5) - 1] += 1
+        series.total_seconds += seconds
+        series.count += 1
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> str:
+        requests = [
+            "# HELP http_requests_total HTTP requests by route template, method and status class.",
+            "# TYPE http_requests_total counter",
+        ]
+        durations = [
+            "# HELP http_request_duration_seconds HTTP request latency by route template and method.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        bounds = [repr(bound) for bound in self.buckets] + ["+Inf"]
+        for (method, route), series in sorted(self._series.items()):
+            labels = f'method="{_escape(method)}",route="{_escape(route)}"'
+            for status_class, count in zip(STATUS_CLASSES, series.status_counts):
+                if count:
+                    requests.append(f'http_requests_total{{{labels},status="{status_class}"}} {count}')
+            cumulative = 0
+            for bound, count in zip(bounds, series.bucket_counts):
+                cumulative += count
+                durations.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            durations.append(f"http_request_duration_seconds_sum{{{labels}}} {series.total_seconds!r}")
+            durations.append(f"http_request_duration_seconds_count{{{labels}}} {series.count}")
+        return "\n".join(requests + durations) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware (no BaseHTTPMiddleware task/stream overhead), timing up to the last body byte."""
+
+    def __init__(self, app, registry: RouteMetrics = None):
+        self.app = app
+        self.registry = registry if registry is not None else route_metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = perf_counter()
+        status_code = 500 # unless a response starts: the app raised
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # the router has put the matched route in the scope by now
+            route = scope.get("route")
+            self.registry.record(
+                scope["method"], getattr(route, "path", UNMATCHED_ROUTE), status_code, perf_counter() - start
+            )
+
+
+route_metrics = RouteMetrics()
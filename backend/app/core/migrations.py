@@ -0,0 +1,269 @@
+"""Versioned schema migrations.
+
+Each migration is a (version, description, function) entry in MIGRATIONS and is applied once,
+in order, inside a transaction. Applied versions are recorded in the `schema_migrations` table,
+so new indexes/columns reach a live database without recreating it.
+
+The transaction holds the migration lock (BEGIN IMMEDIATE on SQLite, an advisory lock on
+PostgreSQL) and the version is re-checked under it, so workers booting together apply each
+migration once and the others wait. On SQLite the driver's own transaction handling is bypassed
+for it (pysqlite only BEGINs before DML, leaving DDL autocommitted): a migration that fails
+halfway, DDL included, is rolled back as a whole.
+
+- fresh database: create_all() builds the latest model schema, it is stamped at the baseline and
+  the remaining migrations run on top of it (they must be idempotent, e.g. CREATE ... IF NOT EXISTS),
+  which also covers objects the models don't describe (FTS tables, triggers)
+- database created before migrations existed (tables but no schema_migrations): stamped at the
+  baseline (version 1) and the remaining migrations are applied
+
+A database already at LATEST_VERSION costs one version lookup on a single connection (every
+worker runs this at boot); the models are only imported when create_all() needs them.
+
+Run them by hand with `python -m app.core.migrations`.
+"""
+import json
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterator, List, Tuple
+from sqlalchemy import Connection, Date, Engine, column, insert, inspect, select, table, text
+from sqlmodel import SQLModel
+
+def _baseline(conn: Connection):
+    # users, properties and bookings as originally created by SQLModel.metadata.create_all
+    pass
+
+def _hot_path_indexes(conn: Connection):
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_properties_city_state ON properties (city, state, property_id)"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_properties_host ON properties (host_id, property_id)"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_bookings_property_dates ON bookings (property_id, date_in, date_out)"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_bookings_guest_date ON bookings (guest_id, date_in)"))
+
+def _booking_nights(conn: Connection):
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS booking_nights ("
+        "property_id INTEGER NOT NULL REFERENCES properties (property_id), "
+        "night DATE NOT NULL, "
+        "booking_id INTEGER NOT NULL REFERENCES bookings (booking_id), "
+        "PRIMARY KEY (property_id, night))"
+    ))
+
+    # Backfill the claims of existing bookings. Nights already claimed by an earlier booking
+    # (double bookings made before this table existed) are skipped instead of failing the migration.
+    # Bookings are read per property, so only one property's claims are held to spot those, and the
+    # rows are inserted in batches of 5000: memory doesn't grow with the nights of the whole database.
+    bookings = table("bookings", column("booking_id"), column("property_id"), column("date_in", Date), column("date_out", Date))
+    booking_nights = table("booking_nights", column("property_id"), column("night", Date), column("booking_id"))
+    current_property = None
+    claimed = set()
+    rows = []
+    statement = select(bookings).order_by(bookings.c.property_id, bookings.c.booking_id).execution_options(yield_per=5000)
+    for booking_id, property_id, date_in, date_out in conn.execute(statement):
+        if property_id != current_property:
+            current_property, claimed = property_id, set()
+        for offset in range((date_out - date_in).days):
+            night = date_in + timedelta(days=offset)
+            if night not in claimed:
+                claimed.add(night)
+                rows.append({"property_id": property_id, "night": night, "booking_id": booking_id})
+            if len(rows) == 5000:
+                conn.execute(insert(booking_nights), rows)
+                rows = []
+    if rows:
+        conn.execute(insert(booking_nights), rows)
+
+def _properties_fts(conn: Connection):
+    # FTS5 only exists on SQLite; other databases use the in-memory index of app.core.search
+    if conn.dialect.name != "sqlite":
+        return
+    conn.execute(text(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS properties_fts USING fts5("
+        "title, city, state, content='properties', content_rowid='property_id', "
+        "tokenize='unicode61 remove_diacritics 2', prefix='2 3')" # prefix indexes for search-as-you-type
+    ))
+    conn.execute(text(
+        "CREATE TRIGGER IF NOT EXISTS properties_fts_insert AFTER INSERT ON properties BEGIN "
+        "INSERT INTO properties_fts (rowid, title, city, state) VALUES (new.property_id, new.title, new.city, new.state); "
+        "END"
+    ))
+    conn.execute(text(
+        "CREATE TRIGGER IF NOT EXISTS properties_fts_delete AFTER DELETE ON properties BEGIN "
+        "INSERT INTO properties_fts (properties_fts, rowid, title, city, state) VALUES ('delete', old.property_id, old.title, old.city, old.state); "
+        "END"
+    ))
+    conn.execute(text(
+        "CREATE TRIGGER IF NOT EXISTS properties_fts_update AFTER UPDATE OF title, city, state ON properties BEGIN "
+        "INSERT INTO properties_fts (properties_fts, rowid, title, city, state) VALUES ('delete', old.property_id, old.title, old.city, old.state); "
+        "INSERT INTO properties_fts (rowid, title, city, state) VALUES (new.property_id, new.title, new.city, new.state); "
+        "END"
+    ))
+    # index the rows that already exist
+    conn.execute(text("INSERT INTO properties_fts (properties_fts) VALUES ('rebuild')"))
+
+def _property_coordinates(conn: Connection):
+    existing = {column["name"] for column in inspect(conn).get_columns("properties")}
+    for name, type_ in (("latitude", "FLOAT"), ("longitude", "FLOAT"), ("geo_cell", "INTEGER")):
+        if name not in existing:
+            conn.execute(text(f"ALTER TABLE properties ADD COLUMN {name} {type_}"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_properties_geo_cell ON properties (geo_cell)"))
+
+def _catalog_versions(conn: Connection):
+    existing = {column["name"] for column in inspect(conn).get_columns("properties")}
+    if "version" not in existing:
+        conn.execute(text("ALTER TABLE properties ADD COLUMN version INTEGER NOT NULL DEFAULT 1"))
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS catalog_versions ("
+        "name VARCHAR NOT NULL PRIMARY KEY, "
+        "version INTEGER NOT NULL)"
+    ))
+    if conn.execute(text("SELECT 1 FROM catalog_versions WHERE name = 'properties'")).first() is None:
+        conn.execute(text("INSERT INTO catalog_versions (name, version) VALUES ('properties', 1)"))
+
+def _property_pictures(conn: Connection):
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS property_pictures ("
+        "property_id INTEGER NOT NULL REFERENCES properties (property_id), "
+        "position INTEGER NOT NULL, "
+        "url VARCHAR NOT NULL, "
+        "PRIMARY KEY (property_id, position))"
+    ))
+    if "picture_urls" not in {column["name"] for column in inspect(conn).get_columns("properties")}:
+        return
+
+    # Move the JSON strings of properties.picture_urls into rows, in batches of properties
+    properties = table("properties", column("property_id"), column("picture_urls"))
+    property_pictures = table("property_pictures", column("property_id"), column("position"), column("url"))
+    last_id = 0
+    while True:
+        batch = conn.execute(
+            select(properties).where(properties.c.property_id > last_id).order_by(properties.c.property_id).limit(5000)
+        ).all()
+        if not batch:
+            break
+        rows = []
+        for property_id, picture_urls in batch:
+            try:
+                urls = json.loads(picture_urls or "[]")
+            except ValueError:
+                urls = [] # unreadable value: the property keeps no pictures rather than failing the migration
+            rows += [{"property_id": property_id, "position": position, "url": url} for position, url in enumerate(urls)]
+        if rows:
+            conn.execute(insert(property_pictures), rows)
+        last_id = batch[-1][0]
+    conn.execute(text("ALTER TABLE properties DROP COLUMN picture_urls"))
+
+def _property_facets(conn: Connection):
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS property_facets ("
+        "state VARCHAR NOT NULL, "
+        "city VARCHAR NOT NULL, "
+        "count INTEGER NOT NULL, "
+        "PRIMARY KEY (state, city))"
+    ))
+    # count the properties that already exist (later writes keep it up to date, see app.core.facets)
+    conn.execute(text("DELETE FROM property_facets"))
+    conn.execute(text(
+        "INSERT INTO property_facets (state, city, count) "
+        "SELECT state, city, COUNT(*) FROM properties GROUP BY state, city"
+    ))
+
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "baseline schema", _baseline),
+    (2, "indexes for browse, /mine, /my-bookings and booking overlap checks", _hot_path_indexes),
+    (3, "booking_nights claim table", _booking_nights),
+    (4, "properties_fts full-text index", _properties_fts),
+    (5, "property coordinates and geo_cell index", _property_coordinates),
+    (6, "catalog_versions and properties.version for ETags", _catalog_versions),
+    (7, "property_pictures table, moved out of properties.picture_urls", _property_pictures),
+    (8, "property_facets counts per state and city", _property_facets),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+def _ensure_version_table(conn: Connection):
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS schema_migrations ("
+        "version INTEGER PRIMARY KEY, "
+        "description VARCHAR NOT NULL, "
+        "applied_at VARCHAR NOT NULL)"
+    ))
+
+def _stamp(conn: Connection, version: int, description: str):
+    conn.execute(
+        text("INSERT INTO schema_migrations (version, description, applied_at) VALUES (:version, :description, :applied_at)"),
+        {"version": version, "description": description, "applied_at": datetime.now(timezone.utc).isoformat()}
+    )
+
+def current_version(conn: Connection) -> int:
+    if not inspect(conn).has_table("schema_migrations"):
+        return 0
+    return conn.execute(text("SELECT COALESCE(MAX(version), 0) FROM schema_migrations")).scalar_one()
+
+# pg_advisory_xact_lock key of the migrations: any constant every worker agrees on ("migr" in ASCII)
+MIGRATION_LOCK_KEY = 0x6D696772
+# how long a booting SQLite worker waits for another one's migration before giving up
+SQLITE_LOCK_TIMEOUT_MS = 300_000
+
+@contextmanager
+def migration_transaction(engine: Engine) -> Iterator[Connection]:
+    """A transaction holding the migration lock, committed on success and rolled back on error."""
+    with engine.connect() as conn:
+        if conn.dialect.name != "sqlite":
+            with conn.begin():
+                if conn.dialect.name == "postgresql":
+                    conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+                yield conn
+            return
+
+        driver = conn.connection.driver_connection
+        isolation_level = driver.isolation_level
+        busy_timeout = conn.exec_driver_sql("PRAGMA busy_timeout").scalar()
+        driver.isolation_level = None # BEGIN/COMMIT are ours, DDL included
+        conn.exec_driver_sql(f"PRAGMA busy_timeout = {SQLITE_LOCK_TIMEOUT_MS}")
+        try:
+            conn.exec_driver_sql("BEGIN IMMEDIATE") # the write lock, taken before reading the version
+            try:
+                yield conn
+            except BaseException:
+                conn.exec_driver_sql("ROLLBACK")
+                raise
+            conn.exec_driver_sql("COMMIT")
+        finally:
+            conn.exec_driver_sql(f"PRAGMA busy_timeout = {busy_timeout}")
+            driver.isolation_level = isolation_level
+
+def register_models():
+    # create_all() builds the tables registered on SQLModel.metadata: the package loads every model
+    import app.models  # noqa: F401
+
+def run_migrations(engine: Engine) -> List[int]:
+    """Bring the database up to LATEST_VERSION and return the versions applied."""
+    with engine.connect() as conn:
+        if current_version(conn) == LATEST_VERSION:
+            return []
+
+    with migration_transaction(engine) as conn:
+        inspector = inspect(conn)
+        if not inspector.has_table("schema_migrations"):
+            legacy_database = inspector.has_table("users")
+            _ensure_version_table(conn)
+            if not legacy_database:
+                register_models()
+                SQLModel.metadata.create_all(conn)
+            _stamp(conn, *MIGRATIONS[0][:2])
+
+    applied = []
+    for version, description, migrate in MIGRATIONS:
+        with migration_transaction(engine) as conn:
+            if version <= current_version(conn):
+                continue
+            migrate(conn)
+            _stamp(conn, version, description)
+            applied.append(version)
+    return applied
+
+if __name__ == "__main__":
+    from app.core.db import engine
+
+    applied = run_migrations(engine)
+    print(f"applied migrations: {applied}" if applied else "database already up to date")
+    print(f"schema version: {LATEST_VERSION}")
@@ -0,0 +1,49 @@
+import base64
+import binascii
+import math
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
+from fastapi import HTTPException, status
+from app.core.config import settings
+
+T = TypeVar("T")
+
+# Cursors are opaque to clients: they only carry the last key seen on the previous page,
+# so deep pages cost the same as the first one (WHERE key > cursor ORDER BY key LIMIT n).
+# Composite keys (e.g. distance, property_id) are supported: decode with one type per key.
+def encode_cursor(*last_key: Any) -> str:
+    raw = ":".join(repr(part) if isinstance(part, float) else str(part) for part in last_key)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, *types: type) -> Any:
+    types = types or (int,)
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        parts = base64.urlsafe_b64decode(padded.encode()).decode().split(":")
+        if len(parts) != len(types):
+            raise ValueError(cursor)
+        values = tuple(cast(part) for cast, part in zip(types, parts))
+        if any(isinstance(value, int) and value < 0 for value in values):
+            raise ValueError(cursor) # ids and offsets are never negative
+        if any(isinstance(value, float) and not math.isfinite(value) for value in values):
+            raise ValueError(cursor) # float("nan") / float("inf") parse, but compare with nothing
+        return values[0] if len(values) == 1 else values
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor."
+        )
+
+def clamp_page_size(limit: int) -> int:
+    # the server has the last word on page size, whatever the client asks for
+    return max(1, min(limit, settings.max_page_size))
+
+def paginate(rows: Sequence[T], limit: int, key: Callable[[T], Any]) -> Tuple[List[T], Optional[str]]:
+    """Split a `limit + 1` result set into the page and the cursor of the next one.
+
+    `key` returns the sort key of a row: a single value or a tuple for composite keys.
+    """
+    page = list(rows[:limit])
+    if len(rows) <= limit:
+        return page, None
+    last_key = key(page[-1])
+    return page, encode_cursor(*last_key) if isinstance(last_key, tuple) else encode_cursor(last_key)
@@ -0,0 +1,87 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# upper bounds (ms) of the checkout wait histogram, the last bucket catches everything above
+WAIT_BUCKETS_MS = [0.1, 1, 5, 10, 50, 100, 500, 1000, 5000]
+
+
+class PoolMetrics:
+    """Checkout wait times of one connection pool (thread-safe, fixed memory)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def record_wait(self, wait_ms: float, timed_out: bool = False):
+        bucket = bisect_left(WAIT_BUCKETS_MS, wait_ms)
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+            self.wait_buckets[bucket] += 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            waits = self.checkouts + self.timeouts
+            labels = [f"<={bound}ms" for bound in WAIT_BUCKETS_MS] + [f">{WAIT_BUCKETS_MS[-1]}ms"]
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "mean_wait_ms": self.total_wait_ms / waits if waits else 0.0,
+                "max_wait_ms": self.max_wait_ms,
+                "wait_histogram": dict(zip(labels, self.wait_buckets)),
+            }
+
+
+class _TimedCheckoutMixin:
+    # _do_get is where QueuePool blocks when every connection is checked out
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_wait((time.perf_counter() - start) * 1000, timed_out=True)
+            raise
+        self.metrics.record_wait((time.perf_counter() - start) * 1000)
+        return connection
+
+
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_stats(engine) -> Dict:
+    pool = engine.pool
+    stats = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "in_use": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+        })
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        stats.update(metrics.snapshot())
+    return stats
@@ -0,0 +1,103 @@
+"""On-demand profile of a single request, for staging and development.
+
+Off unless REQUEST_PROFILING=true. Then add `?profile=1` or an `X-Profile: 1` header to any request: it runs under cProfile and the
+response is replaced by the profile, a call-tree summary sorted by cumulative time
+(`?profile=tottime` / `X-Profile: tottime` sorts by own time instead). The original status and
+content type come back in X-Profiled-Status and X-Profiled-Content-Type.
+
+With REQUEST_PROFILING_DIR set, the raw profile is also written there as a .prof file
+(`python -m pstats` or snakeviz open it) and its path returned in X-Profile-File.
+
+cProfile follows the event loop thread: work handed to the threadpool (the sync database mode,
+sync endpoints) shows up as time spent awaiting it, not as its own frames. Other requests served
+concurrently by the loop are profiled too, so profile on a quiet instance. One profile at a time.
+
+The middleware is never installed when ENVIRONMENT=production, so requests there pay nothing.
+Elsewhere it reads REQUEST_PROFILING on each request: off, a request pays that attribute read;
+on, unprofiled requests pay a header scan.
+"""
+import cProfile
+import io
+import os
+import pstats
+import threading
+import time
+from urllib.parse import parse_qsl
+from starlette.responses import JSONResponse, PlainTextResponse
+from app.core.config import settings
+
+SORT_KEYS = {"1": "cumulative", "true": "cumulative", "cumulative": "cumulative", "tottime": "tottime"}
+TOP_FUNCTIONS = 60
+
+
+def profile_flag(scope) -> str:
+    """The sort key asked for by the request, "" when it isn't to be profiled."""
+    for name, value in scope["headers"]:
+        if name == b"x-profile":
+            return SORT_KEYS.get(value.decode("latin-1").lower(), "")
+    if b"profile=" in scope["query_string"]:
+        for name, value in parse_qsl(scope["query_string"].decode("latin-1")):
+            if name == "profile":
+                return SORT_KEYS.get(value.lower(), "")
+    return ""
+
+
+def render_profile(profiler: cProfile.Profile, sort_key: str, title: str) -> str:
+    out = io.StringIO()
+    out.write(f"{title}\n\n")
+    pstats.Stats(profiler, stream=out).strip_dirs().sort_stats(sort_key).print_stats(TOP_FUNCTIONS)
+    return out.getvalue()
+
+
+class ProfilingMiddleware:
+    """Pure ASGI middleware: profile the flagged requests and answer with the profile instead of the response."""
+
+    def __init__(self, app, profile_dir: str = None):
+        self.app = app
+        self.profile_dir = profile_dir # None: REQUEST_PROFILING_DIR
+        self._busy = threading.Lock()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.request_profiling:
+            await self.app(scope, receive, send)
+            return
+        sort_key = profile_flag(scope)
+        if not sort_key:
+            await self.app(scope, receive, send)
+            return
+        if not self._busy.acquire(blocking=False):
+            await JSONResponse({"detail": "A request is already being profiled."}, status_code=409)(scope, receive, send)
+            return
+
+        started = {"status": 500, "headers": []}
+
+        async def capture(message):
+            # the profile replaces the response: nothing of it is sent to the client
+            if message["type"] == "http.response.start":
+                started.update(message)
+
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        try:
+            profiler.enable()
+            try:
+                await self.app(scope, receive, capture)
+            finally:
+                profiler.disable()
+        finally:
+            self._busy.release()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        title = f"{scope['method']} {scope['path']} -> {started['status']} in {elapsed_ms:.1f}ms"
+        headers = {"X-Profiled-Status": str(started["status"])}
+        for name, value in started["headers"]:
+            if name == b"content-type":
+                headers["X-Profiled-Content-Type"] = value.decode("latin-1")
+        profile_dir = self.profile_dir or settings.request_profiling_dir
+        if profile_dir:
+            os.makedirs(profile_dir, exist_ok=True)
+            route = scope["path"].strip("/").replace("/", "_") or "root"
+            path = os.path.join(profile_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-{scope['method']}-{route}.prof")
+            profiler.dump_stats(path)
+            headers["X-Profile-File"] = path
+        await PlainTextResponse(render_profile(profiler, sort_key, title), headers=headers)(scope, receive, send)
@@ -0,0 +1,207 @@
+"""Read-through cache of built PropertyRead cards, keyed by property_id.
+
+The routes ask the cache first and only load the misses from the database (app.routes.property),
+so a hot listing page costs one index-only id query and no JSON decoding or host lookups.
+create_property, delete_property and the bulk import invalidate their ids explicitly.
+
+Backends (PROPERTY_CACHE_BACKEND):
+- memory (default): LRU + TTL in the process. Each worker has its own copy, so a write made
+  through another worker is seen at the latest after PROPERTY_CACHE_TTL_SECONDS.
+- redis: shared by every worker, through any client with the redis.asyncio API
+  (mget / set(ex=) / delete / scan_iter). Needs `pip install redis`.
+- none: disabled.
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, NamedTuple
+from app.core.config import settings
+from app.schemas.property import PropertyRead
+
+
+class CachedProperty(NamedTuple):
+    version: int # properties.version, for the ETag (see app.core.etag)
+    card: PropertyRead # shared between requests: never mutate it
+
+
+class CacheStats:
+    """Hit/miss/eviction counters, to size the cache against real traffic."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0 # dropped to make room (LRU)
+        self.expirations = 0 # dropped because the TTL ran out
+
+    def record(self, hits: int = 0, misses: int = 0, evictions: int = 0, expirations: int = 0):
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            self.evictions += evictions
+            self.expirations += expirations
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+class InMemoryPropertyCache:
+    """Bounded LRU of cards; an entry lives at most `ttl_seconds`."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._entries = OrderedDict() # property_id -> (CachedProperty, expires_at)
+        self._lock = threading.Lock()
+
+    async def get_many(self, property_ids: Iterable[int]) -> Dict[int, CachedProperty]:
+        found = {}
+        misses = expired = 0
+        now = time.monotonic()
+        with self._lock:
+            for property_id in property_ids:
+                entry = self._entries.get(property_id)
+                if entry is None:
+                    misses += 1
+                elif entry[1] <= now:
+                    del self._entries[property_id]
+                    misses += 1
+                    expired += 1
+                else:
+                    self._entries.move_to_end(property_id)
+                    found[property_id] = entry[0]
+        self.stats.record(hits=len(found), misses=misses, expirations=expired)
+        return found
+
+    async def set_many(self, entries: Dict[int, CachedProperty]):
+        if self.max_entries <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        evicted = 0
+        with self._lock:
+            for property_id, entry in entries.items():
+                self._entries[property_id] = (entry, expires_at)
+                self._entries.move_to_end(property_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        self.stats.record(evictions=evicted)
+
+    async def invalidate(self, property_id: int):
+        with self._lock:
+            self._entries.pop(property_id, None)
+
+    async def invalidate_many(self, property_ids: Iterable[int]):
+        with self._lock:
+            for property_id in property_ids:
+                self._entries.pop(property_id, None)
+
+    async def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ExternalPropertyCache:
+    """Cards stored as JSON in an external key-value store shared by all workers.
+
+    The store expires entries itself (and evicts under memory pressure, which it doesn't report),
+    so only hits and misses are counted here.
+    """
+
+    def __init__(self, client, ttl_seconds: float, prefix: str = "property-card:"):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+        self.stats = CacheStats()
+
+    def _key(self, property_id: int) -> str:
+        return f"{self.prefix}{property_id}"
+
+    async def get_many(self, property_ids: Iterable[int]) -> Dict[int, CachedProperty]:
+        property_ids = list(property_ids)
+        if not property_ids:
+            return {}
+        values = await self.client.mget([self._key(property_id) for property_id in property_ids])
+        found = {}
+        for property_id, value in zip(property_ids, values):
+            if value is not None:
+                data = json.loads(value)
+                found[property_id] = CachedProperty(data["version"], PropertyRead.model_validate(data["card"]))
+        self.stats.record(hits=len(found), misses=len(property_ids) - len(found))
+        return found
+
+    async def set_many(self, entries: Dict[int, CachedProperty]):
+        items = list(entries.items())
+        ttl = max(1, int(self.ttl_seconds))
+        for start in range(0, len(items), 1000): # SET ... EX pipelined, one round-trip per 1000 cards
+            async with self.client.pipeline(transaction=False) as pipeline:
+                for property_id, entry in items[start:start + 1000]:
+                    value = json.dumps({"version": entry.version, "card": entry.card.model_dump(mode="json")})
+                    pipeline.set(self._key(property_id), value, ex=ttl)
+                await pipeline.execute()
+
+    async def invalidate(self, property_id: int):
+        await self.client.delete(self._key(property_id))
+
+    async def invalidate_many(self, property_ids: Iterable[int]):
+        keys = [self._key(property_id) for property_id in property_ids]
+        for start in range(0, len(keys), 1000): # one round-trip per 1000 keys
+            await self.client.delete(*keys[start:start + 1000])
+
+    async def clear(self):
+        keys = [key async for key in self.client.scan_iter(match=f"{self.prefix}*")]
+        if keys:
+            await self.client.delete(*keys)
+
+
+class NullPropertyCache:
+    """PROPERTY_CACHE_BACKEND=none: every lookup is a miss."""
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    async def get_many(self, property_ids: Iterable[int]) -> Dict[int, CachedProperty]:
+        self.stats.record(misses=len(list(property_ids)))
+        return {}
+
+    async def set_many(self, entries: Dict[int, CachedProperty]):
+        pass
+
+    async def invalidate(self, property_id: int):
+        pass
+
+    async def invalidate_many(self, property_ids: Iterable[int]):
+        pass
+
+    async def clear(self):
+        pass
+
+
+def create_property_cache(backend: str):
+    if backend == "memory":
+        return InMemoryPropertyCache(settings.property_cache_size, settings.property_cache_ttl_seconds)
+    if backend == "redis":
+        try:
+            from redis.asyncio import Redis
+        except ImportError as error:
+            raise RuntimeError("PROPERTY_CACHE_BACKEND=redis needs the redis package (pip install redis)") from error
+        return ExternalPropertyCache(Redis.from_url(settings.property_cache_url), settings.property_cache_ttl_seconds)
+    if backend == "none":
+        return NullPropertyCache()
+    raise ValueError(f"Unknown PROPERTY_CACHE_BACKEND: {backend!r} (expected memory, redis or none)")
+
+
+property_cache = create_property_cache(settings.property_cache_backend)
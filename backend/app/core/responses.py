@@ -0,0 +1,87 @@
+"""Fast JSON responses (opt-in with FAST_JSON_RESPONSES=true).
+
+By default a route's return value is validated against its response_model, converted by
+jsonable_encoder and then dumped by JSONResponse: for a list endpoint that is a second full pass
+over objects that were already built and validated (PropertyRead cards, page models).
+With the fast mode on, `json_response()` hands the content to FastJSONResponse instead, which
+writes it straight to bytes with orjson: models, dicts, lists and plain row tuples.
+
+The bytes are the same as the default path (tests/integration/test_fast_json.py): same key
+order, compact separators, UTF-8 without escaping. orjson formats some floats differently from
+Python (1e-05 vs 0.00001, 1e+16 vs 1e16); those rare bodies are re-encoded with the standard
+library, as is everything when orjson isn't installed.
+
+`ndjson()` uses the same encoder for the streaming exports (one JSON document per line).
+"""
+import json
+import re
+from datetime import date
+from typing import Any, Optional
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from app.core.config import settings
+
+try:
+    import orjson
+except ImportError: # pragma: no cover - optional speedup
+    orjson = None
+
+# Number formats where orjson and Python disagree: exponents (Python pads and signs them: 1e-05,
+# 1e+16) and the positional form orjson uses for some small values (0.00001). Substring tests are
+# a cheap filter (text like "one-bed" passes it), then the regex only looks at numbers, i.e.
+# values after ":", "," or "[". A false positive only means re-encoding with the standard library.
+_DIGITS_AS_ZERO = bytes.maketrans(b"123456789", b"000000000")
+_FLOAT_FORMAT_MISMATCH = re.compile(rb"[:,\[]-?(?:\d+(?:\.\d+)?e|0\.0000)")
+
+
+def _float_format_mismatch(body: bytes) -> bool:
+    maybe = b"e-" in body or b"0.0000" in body or b"e0" in body.translate(_DIGITS_AS_ZERO)
+    return maybe and _FLOAT_FORMAT_MISMATCH.search(body) is not None
+
+
+def _to_builtin(value: Any):
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """JSON bytes of `content`, exactly as starlette's JSONResponse would write them."""
+    if orjson is not None:
+        body = orjson.dumps(content, default=_to_builtin)
+        if not _float_format_mismatch(body):
+            return body
+    # same arguments as starlette's JSONResponse.render
+    return json.dumps(
+        content, default=_to_builtin, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def ndjson(rows) -> bytes:
+    return b"".join(dumps(row) + b"\n" for row in rows)
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def json_response(content: Any, response: Optional[Response] = None):
+    """Return value of a route: `content` itself (validated and serialized by FastAPI against the
+    response_model), or with FAST_JSON_RESPONSES a FastJSONResponse carrying over the headers set
+    on the route's injected `response`.
+    """
+    if not settings.fast_json_responses:
+        return content
+    fast = FastJSONResponse(content)
+    if response is not None:
+        for name, value in response.headers.items():
+            if name not in ("content-length", "content-type"):
+                fast.headers.append(name, value)
+    return fast
@@ -0,0 +1,178 @@
+"""Full-text search over property title, city and state.
+
+- SQLite: an FTS5 index (`properties_fts`, created by migration 4) kept in sync by triggers on `properties`,
+  ranked with bm25.
+- Other databases: an inverted index held in memory by each worker, built from the table on first
+  use and updated by create_property / delete_property. Every search first reads the catalog
+  version (app.core.etag, one primary-key lookup): when it moved past the writes this worker
+  applied itself (another worker's write, a bulk import, a script that bumped it), the index is
+  rebuilt from the table. Fine for catalogs that fit in memory and are written much less often
+  than searched; each write made elsewhere costs one full rebuild per worker.
+"""
+import re
+import threading
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+from heapq import nsmallest
+from math import log
+from typing import Dict, List, Optional, Set
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlmodel import select
+from app.core.config import settings
+from app.core.etag import catalog_version
+from app.models.property import Property
+
+# ranking weight of a match in each field (a title match counts more than a state match)
+FIELD_WEIGHTS = {"title": 3.0, "city": 2.0, "state": 1.0}
+
+def tokenize(value: str) -> List[str]:
+    # lower case, accents removed ("São Paulo" -> ["sao", "paulo"]), like FTS5's unicode61 tokenizer
+    normalized = unicodedata.normalize("NFKD", value.lower())
+    return re.findall(r"\w+", "".join(c for c in normalized if not unicodedata.combining(c)))
+
+
+class Fts5SearchIndex:
+    """SQLite FTS5: the triggers keep the index in sync, so add/remove are no-ops."""
+
+    def add(self, property: Property, version: int):
+        pass
+
+    def remove(self, property_id: int, version: int):
+        pass
+
+    def invalidate(self):
+        pass
+
+    async def search(self, session, query: str, limit: int, offset: int = 0) -> List[int]:
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        # every term must match, the last one as a prefix (search-as-you-type); quoting neutralizes FTS5 syntax
+        match = " ".join(f'"{token}"' for token in tokens[:-1]) + f' "{tokens[-1]}"*'
+        weights = ", ".join(str(weight) for weight in FIELD_WEIGHTS.values())
+        rows = await session.exec(
+            text(
+                f"SELECT rowid FROM properties_fts WHERE properties_fts MATCH :match "
+                f"ORDER BY bm25(properties_fts, {weights}), rowid LIMIT :limit OFFSET :offset"
+            ),
+            params={"match": match.strip(), "limit": limit, "offset": offset}
+        )
+        return [row[0] for row in rows]
+
+
+class InMemorySearchIndex:
+    """Inverted index: token -> {property_id: field weight}, plus a sorted vocabulary for prefix matches.
+
+    `version` is the catalog version the index reflects (None: not built yet). The routes pass the
+    version their write bumped the catalog to: the index keeps up without a rebuild as long as
+    those come in order, any gap means another writer and a rebuild on the next search.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        self._documents: Dict[int, Set[str]] = {}
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+        self.version: Optional[int] = None
+        self._lock = threading.RLock()
+
+    def _index(self, property_id: int, title: str, city: str, state: str):
+        tokens = set()
+        for field, value in (("title", title), ("city", city), ("state", state)):
+            for token in tokenize(value):
+                posting = self._postings[token]
+                posting[property_id] = posting.get(property_id, 0.0) + FIELD_WEIGHTS[field]
+                tokens.add(token)
+        self._documents[property_id] = tokens
+        self._vocabulary_dirty = True
+
+    def _advance(self, version: int):
+        # only a write that directly follows the index's version keeps it current
+        if self.version is not None and version == self.version + 1:
+            self.version = version
+
+    def add(self, property: Property, version: int):
+        with self._lock:
+            if self.version is not None:
+                self._unindex(property.property_id)
+                self._index(property.property_id, property.title, property.city, property.state)
+                self._advance(version)
+
+    def remove(self, property_id: int, version: int):
+        with self._lock:
+            if self.version is not None:
+                self._unindex(property_id)
+                self._advance(version)
+
+    def _unindex(self, property_id: int):
+        for token in self._documents.pop(property_id, ()):
+            posting = self._postings[token]
+            posting.pop(property_id, None)
+            if not posting:
+                del self._postings[token]
+                self._vocabulary_dirty = True
+
+    def invalidate(self):
+        # rows were written behind the routes' back (bulk loads): rebuild on next search
+        with self._lock:
+            self.version = None
+
+    async def _load(self, session, version: int):
+        # rows read after the version: at worst they are newer, and the next search rebuilds again
+        rows = (await session.exec(select(Property.property_id, Property.title, Property.city, Property.state))).all()
+        with self._lock:
+            self._postings.clear()
+            self._documents.clear()
+            for row in rows:
+                self._index(*row)
+            self.version = version
+
+    def _expand(self, prefix: str) -> List[str]:
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        start = bisect_left(self._vocabulary, prefix)
+        matches = []
+        for token in self._vocabulary[start:]:
+            if not token.startswith(prefix):
+                break
+            matches.append(token)
+        return matches
+
+    async def search(self, session, query: str, limit: int, offset: int = 0) -> List[int]:
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        version = await catalog_version(session)
+        if version != self.version:
+            await self._load(session, version)
+
+        with self._lock:
+            total = max(len(self._documents), 1)
+            scores = None
+            for position, token in enumerate(tokens):
+                candidates = self._expand(token) if position == len(tokens) - 1 else [token]
+                term_scores: Dict[int, float] = {}
+                for candidate in candidates:
+                    posting = self._postings.get(candidate, {})
+                    idf = log(1 + total / (1 + len(posting)))
+                    for property_id, weight in posting.items():
+                        term_scores[property_id] = max(term_scores.get(property_id, 0.0), weight * idf)
+                if scores is None:
+                    scores = term_scores
+                else: # every term must match
+                    scores = {pid: score + term_scores[pid] for pid, score in scores.items() if pid in term_scores}
+                if not scores:
+                    return []
+
+        # partial sort: only the requested page needs ordering
+        ranked = nsmallest(offset + limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [property_id for property_id, _ in ranked[offset:]]
+
+
+def create_search_index(database_url: str):
+    return Fts5SearchIndex() if make_url(database_url).get_backend_name() == "sqlite" else InMemorySearchIndex()
+
+search_index = create_search_index(settings.database_url)
@@ -0,0 +1,45 @@
+"""Cold start breakdown: how long a worker spends in each phase before serving its first request.
+
+Phases are timed where they happen (imports and router registration in app.main, engine creation
+in app.core.db, the schema check in the lifespan) and logged once on the `app.startup` logger when
+the lifespan is done, e.g.
+
+    startup 412.3ms: imports=301.2ms engines=38.5ms routers=12.9ms schema=1.4ms
+
+The same numbers are served on GET /internal/startup.
+"""
+import logging
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Dict
+
+startup_logger = logging.getLogger("app.startup")
+
+
+class StartupTimer:
+    def __init__(self):
+        self.phases: Dict[str, float] = {} # name -> seconds, in the order they ran
+
+    @contextmanager
+    def phase(self, name: str):
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, perf_counter() - start)
+
+    def record(self, name: str, seconds: float):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def snapshot(self) -> Dict[str, float]:
+        phases = {f"{name}_ms": round(seconds * 1000, 2) for name, seconds in self.phases.items()}
+        return {"total_ms": round(sum(self.phases.values()) * 1000, 2), **phases}
+
+    def log(self):
+        phases = " ".join(f"{name}={seconds * 1000:.1f}ms" for name, seconds in self.phases.items())
+        startup_logger.info(
+            "startup %.1fms: %s", sum(self.phases.values()) * 1000, phases, extra={"event": "startup", **self.snapshot()}
+        )
+
+
+startup_timer = StartupTimer()
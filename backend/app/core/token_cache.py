@@ -0,0 +1,61 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+
+class VerifiedTokenCache:
+    """Bounded LRU cache of verified JWT claims.
+
+    Keys are SHA-256 digests of the token (the raw token is never kept in memory longer than the request).
+    An entry lives at most `ttl_seconds` and never past the token's own `exp` claim,
+    so a cached token can't be accepted after it expires. Oldest entries are evicted beyond `max_entries`.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict() # digest -> (claims, expires_at)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        if self.max_entries <= 0:
+            return None
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            claims, expires_at = entry
+            if time.time() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return claims
+
+    def put(self, token: str, claims: dict):
+        if self.max_entries <= 0:
+            return
+        expires_at = time.time() + self.ttl_seconds
+        if "exp" in claims:
+            expires_at = min(expires_at, float(claims["exp"]))
+        if expires_at <= time.time():
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (claims, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
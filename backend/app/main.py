@@ -1,22 +1,38 @@
-from fastapi import FastAPI
+from time import perf_counter
+_imports_started = perf_counter() # cold start breakdown, see app.core.startup
+
+from fastapi import Depends, FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.core.config import settings
-from app.core.db import create_db_and_tables
+from app.core.dependencies import require_internal_access
+from app.core.db import QueryStatsMiddleware, async_engine, engine, migrate_database
+from app.core.metrics import CONTENT_TYPE, MetricsMiddleware, route_metrics
+from app.core.pool import pool_stats
+from app.core.profiling import ProfilingMiddleware
+from app.core.property_cache import property_cache
 from app.routes.user import router as users_router
 from app.routes.property import router as properties_router
 from app.routes.booking import router as bookings_router
+from app.core.startup import startup_timer
+
+# engines are created (and timed) while app.core.db is imported
+startup_timer.record("imports", perf_counter() - _imports_started - startup_timer.phases.get("engines", 0.0))
 
 
 # for now we dont need the "async" because there are no async operations on startup or shutdown
 # However, when scaling the app we will definitely have some, so we are future-proofing it.
 @asynccontextmanager 
 async def lifespan(app: FastAPI):
-    create_db_and_tables() # sync operation but okay to be inside async since it is really light
+    with startup_timer.phase("schema"):
+        migrate_database() # sync operation but okay to be inside async since it is really light (a version lookup when up to date)
+    startup_timer.log()
     yield
     
 app = FastAPI(lifespan=lifespan)
 
+_routers_started = perf_counter()
 app.include_router(users_router, prefix="/v1/users", tags=["users"])
 app.include_router(properties_router, prefix="/v1/properties", tags=["properties"])
 app.include_router(bookings_router, prefix="/v1/bookings", tags=["Bookings"])
@@ -28,9 +44,42 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if settings.query_stats_enabled:
+    app.add_middleware(QueryStatsMiddleware)
+# added last so it wraps CORS too: preflights and CORS rejections are counted and timed
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+# outermost: profiled requests (slowed down, answered with their profile) stay out of the metrics
+# (REQUEST_PROFILING switches it on and off, see app.core.profiling)
+if not settings.is_production:
+    app.add_middleware(ProfilingMiddleware)
+
+startup_timer.record("routers", perf_counter() - _routers_started) # routers and middleware
 
 # Health check endpoint (simple /ping)
 @app.get("/ping")
 def ping():
     return {"message": "pong"}
 
+# Connection pool stats (in use / idle connections, checkout wait times), to size the pool against real traffic
+@app.get("/internal/pool", include_in_schema=False, dependencies=[Depends(require_internal_access)])
+def pool_status():
+    stats = {"sync": pool_stats(engine)}
+    if async_engine is not None:
+        stats["async"] = pool_stats(async_engine.sync_engine)
+    return stats
+
+# Property card cache counters (hits, misses, evictions), to size PROPERTY_CACHE_SIZE / TTL
+@app.get("/internal/cache", include_in_schema=False, dependencies=[Depends(require_internal_access)])
+def cache_status():
+    return {"property_cards": property_cache.stats.snapshot()}
+
+# Per-route request counts and latency histograms, in the Prometheus text format
+@app.get("/metrics", include_in_schema=False, dependencies=[Depends(require_internal_access)])
+def metrics():
+    return PlainTextResponse(route_metrics.render(), media_type=CONTENT_TYPE)
+
+# Cold start breakdown of this worker (imports, engines, routers, schema check)
+@app.get("/internal/startup", include_in_schema=False, dependencies=[Depends(require_internal_access)])
+def startup_status():
+    return startup_timer.snapshot()
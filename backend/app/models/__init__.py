@@ -0,0 +1,9 @@
+# Every model is loaded with the package, whichever one is imported first: relationships name
+# their targets as strings ("User", "Booking"), which only resolve once those classes are registered
+from .user import User
+from .property import Property
+from .booking import Booking
+from .booking_night import BookingNight
+from .catalog_version import CatalogVersion
+from .property_picture import PropertyPicture
+from .property_facet import PropertyFacet
@@ -2,12 +2,19 @@ from __future__ import annotations
 
 from sqlmodel import Field
 from typing import Optional, ClassVar, Any
+from sqlalchemy import Index
 from sqlalchemy.orm import relationship
 from .base import SQLModelBase
 from datetime import date
 
 class Booking(SQLModelBase, table=True):
     __tablename__ = "bookings"
+    __table_args__ = (
+        # overlap checks: property_id equality, then a range on the dates
+        Index("ix_bookings_property_dates", "property_id", "date_in", "date_out"),
+        # GET /v1/bookings/my-bookings (ordered by check-in)
+        Index("ix_bookings_guest_date", "guest_id", "date_in"),
+    )
 
     booking_id: Optional[int] = Field(default=None, primary_key=True)
     guest_id: int = Field(foreign_key="users.user_id")
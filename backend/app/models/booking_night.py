@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from sqlmodel import Field
+from typing import List
+from .base import SQLModelBase
+from datetime import date, timedelta
+
+
+class BookingNight(SQLModelBase, table=True):
+    """One row per night a property is booked.
+
+    The composite primary key (property_id, night) is what makes booking creation race-free:
+    two concurrent bookings that share a night cannot both commit their claims.
+    """
+    __tablename__ = "booking_nights"
+
+    property_id: int = Field(foreign_key="properties.property_id", primary_key=True)
+    night: date = Field(primary_key=True)
+    booking_id: int = Field(foreign_key="bookings.booking_id")
+
+
+def nights_between(date_in: date, date_out: date) -> List[date]:
+    # the check-out day is free for the next guest
+    return [date_in + timedelta(days=offset) for offset in range((date_out - date_in).days)]
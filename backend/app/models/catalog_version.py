@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from sqlmodel import Field
+from .base import SQLModelBase
+
+
+class CatalogVersion(SQLModelBase, table=True):
+    """Change counter of a collection, bumped in the same transaction as every write to it.
+
+    Drives the ETags of the read endpoints (see app.core.etag): clients revalidate against it
+    instead of downloading a payload that didn't change.
+    """
+    __tablename__ = "catalog_versions"
+
+    name: str = Field(primary_key=True)
+    version: int = 1
@@ -2,12 +2,19 @@ from __future__ import annotations
 
 from sqlmodel import Field
 from typing import Optional, ClassVar, Any
+from sqlalchemy import Index
 from sqlalchemy.orm import relationship
 from .base import SQLModelBase
 
 
 class Property(SQLModelBase, table=True):
     __tablename__ = "properties"
+    __table_args__ = (
+        # location filters on browse, ordered by the pagination key
+        Index("ix_properties_city_state", "city", "state", "property_id"),
+        # GET /v1/properties/mine
+        Index("ix_properties_host", "host_id", "property_id"),
+    )
 
     property_id: Optional[int] = Field(default=None, primary_key=True)
     host_id: int = Field(foreign_key="users.user_id")
@@ -15,7 +22,11 @@ class Property(SQLModelBase, table=True):
     address: str
     city: str
     state: str
-    picture_urls: str  # JSON serialized list of URLs
+    # pictures live in property_pictures (app.models.property_picture)
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    geo_cell: Optional[int] = Field(default=None, index=True)  # grid cell of (latitude, longitude), see app.core.geo
+    version: int = Field(default=1, sa_column_kwargs={"server_default": "1"})  # ETag of the details, see app.core.etag
 
     # Define relationships using SQLAlchemy's relationship directly
     host: ClassVar[Any] = relationship("User", back_populates="properties")
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from sqlmodel import Field
+from .base import SQLModelBase
+
+
+class PropertyFacet(SQLModelBase, table=True):
+    """Number of properties per (state, city), kept up to date by the writes to properties.
+
+    GET /v1/properties/facets reads these few rows instead of a GROUP BY over the whole catalog
+    (see app.core.facets, which also rebuilds the table from scratch).
+    """
+    __tablename__ = "property_facets"
+
+    state: str = Field(primary_key=True)
+    city: str = Field(primary_key=True)
+    count: int = 0
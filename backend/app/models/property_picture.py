@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from sqlmodel import Field
+from .base import SQLModelBase
+
+
+class PropertyPicture(SQLModelBase, table=True):
+    """One row per picture of a property, in display order.
+
+    The primary key (property_id, position) keeps a property's pictures together and sorted,
+    so a page of properties gets its pictures from one range scan per property, and
+    `position < n` returns just the first n (thumbnails).
+    """
+    __tablename__ = "property_pictures"
+
+    property_id: int = Field(foreign_key="properties.property_id", primary_key=True)
+    position: int = Field(primary_key=True)
+    url: str
@@ -1,21 +1,35 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from app.models.booking import Booking
+from app.models.booking_night import BookingNight, nights_between
 from app.models.property import Property
+from app.models.property_picture import PropertyPicture
+from app.models.user import User
 from app.schemas.booking import BookingCreate, BookingRead
-from app.core.db import get_session
+from app.core.calendar import calendar_cache, months_between
+from app.core.config import settings
+from app.core.db import get_async_session, get_session_factory
 from app.core.dependencies import get_current_user
-from sqlmodel import Session, select
-from typing import List
+from app.core.responses import NDJSON_MEDIA_TYPE, json_response, ndjson
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.exc import IntegrityError, OperationalError
+from typing import List, Optional
 from app.schemas.booking import BookingWithProperty
-import json
+import asyncio
+import random
 
 
 router = APIRouter()
 
+# Retries when the database is busy with other writers (SQLite "database is locked")
+BOOKING_WRITE_ATTEMPTS = 5
+BOOKING_RETRY_BACKOFF_SECONDS = 0.02
+
 @router.post("", response_model=BookingRead)
-def create_booking(
+async def create_booking(
     booking: BookingCreate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     current_user: dict = Depends(get_current_user)
 ):
     # 1. Authorization: Only guests
@@ -31,44 +45,80 @@ def create_booking(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Check-in date must be before check-out date."
         )
+    if (booking.date_out - booking.date_in).days > settings.max_stay_nights:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Stays are limited to {settings.max_stay_nights} nights."
+        )
 
     # 3. Check if property exists
-    property_obj = session.get(Property, booking.property_id)
+    property_obj = await session.get(Property, booking.property_id)
     if not property_obj:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Property not found."
         )
 
-    # 4. Check for overlapping bookings
+    # 4. Check for overlapping bookings (fast path for the common case, step 5 is what guarantees it)
     statement = select(Booking).where(
         Booking.property_id == booking.property_id,
         Booking.date_in < booking.date_out,
         Booking.date_out > booking.date_in
     )
-    overlapping_booking = session.exec(statement).first()
+    overlapping_booking = (await session.exec(statement)).first()
     if overlapping_booking:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Property already booked for the selected dates."
         )
 
-    # 5. Create the booking
-    new_booking = Booking(
-        guest_id=current_user["user_id"],
-        property_id=booking.property_id,
-        date_in=booking.date_in,
-        date_out=booking.date_out
-    )
-    session.add(new_booking)
-    session.commit()
-    session.refresh(new_booking)
+    # 5. Create the booking and claim its nights in the same transaction.
+    # booking_nights is keyed by (property_id, night): if a concurrent request claimed one of
+    # these nights after our check above, the primary key rejects our claim and nothing is committed.
+    # Correctness comes from the constraint, not from an application lock, so the endpoint is never serialized.
+    for attempt in range(BOOKING_WRITE_ATTEMPTS):
+        new_booking = Booking(
+            guest_id=current_user["user_id"],
+            property_id=booking.property_id,
+            date_in=booking.date_in,
+            date_out=booking.date_out
+        )
+        try:
+            session.add(new_booking)
+            await session.flush() # assigns booking_id
+            session.add_all([
+                BookingNight(property_id=booking.property_id, night=night, booking_id=new_booking.booking_id)
+                for night in nights_between(booking.date_in, booking.date_out)
+            ])
+            await session.commit()
+            break
+        except IntegrityError:
+            await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Property already booked for the selected dates."
+            )
+        except OperationalError:
+            await session.rollback()
+            if attempt == BOOKING_WRITE_ATTEMPTS - 1:
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Too many concurrent bookings, please try again."
+                )
+            # exponential backoff with jitter so retries don't collide again
+            await asyncio.sleep(BOOKING_RETRY_BACKOFF_SECONDS * (2 ** attempt) * random.uniform(0.5, 1.5))
+
+    # the calendar months holding these nights are stale now
+    calendar_cache.invalidate(booking.property_id, months_between(booking.date_in, booking.date_out))
+    await session.refresh(new_booking)
 
     return new_booking
 
 @router.get("/my-bookings", response_model=List[BookingWithProperty])
-def get_my_bookings(
-    session: Session = Depends(get_session),
+async def get_my_bookings(
+    response: Response,
+    max_pictures: Optional[int] = Query(default=settings.list_max_pictures, ge=0, description="only the first n picture_urls of each property (thumbnails)"),
+    session: AsyncSession = Depends(get_async_session),
     current_user: dict = Depends(get_current_user)
 ):
     """Get all bookings for the current user with property details"""
@@ -79,31 +129,71 @@ def get_my_bookings(
             detail="Only guests can view their bookings."
         )
 
-    # Get all bookings for this user with property details
+    # Get all bookings for this user with property details, host name and pictures in a single query
+    # (no lazy loads of booking.property / property.host per row): one row per picture, in display order
+    pictures_join = PropertyPicture.property_id == Property.property_id
+    if max_pictures is not None:
+        pictures_join &= PropertyPicture.position < max_pictures
     statement = (
-        select(Booking)
-        .join(Property)
+        select(Booking, Property, User.name, PropertyPicture.url)
+        .join(Property, Booking.property_id == Property.property_id)
+        .join(User, Property.host_id == User.user_id)
+        .outerjoin(PropertyPicture, pictures_join)
         .where(Booking.guest_id == current_user["user_id"])
-        .order_by(Booking.date_in.desc())
+        .order_by(Booking.date_in.desc(), Booking.booking_id, PropertyPicture.position)
     )
-    bookings = session.exec(statement).all()
+    rows = (await session.exec(statement)).all()
     
-    # Transform the bookings to include property details with parsed picture_urls
-    result = []
-    for booking in bookings:
-        property_data = booking.property
-        result.append({
-            "booking_id": booking.booking_id,
-            "date_in": booking.date_in,
-            "date_out": booking.date_out,
-            "property": {
-                "property_id": property_data.property_id,
-                "title": property_data.title,
-                "city": property_data.city,
-                "state": property_data.state,
-                "picture_urls": json.loads(property_data.picture_urls),
-                "host_name": property_data.host.name
+    # Transform the bookings to include property details, grouping the picture rows
+    result = {}
+    for booking, property_data, host_name, url in rows:
+        if booking.booking_id not in result:
+            result[booking.booking_id] = {
+                "booking_id": booking.booking_id,
+                "date_in": booking.date_in,
+                "date_out": booking.date_out,
+                "property": {
+                    "property_id": property_data.property_id,
+                    "title": property_data.title,
+                    "city": property_data.city,
+                    "state": property_data.state,
+                    "picture_urls": [],
+                    "host_name": host_name
+                }
             }
-        })
+        if url is not None:
+            result[booking.booking_id]["property"]["picture_urls"].append(url)
     
-    return result
+    return json_response(list(result.values()), response)
+
+async def _export_host_bookings(open_session, host_id: int):
+    # streamed from a server-side cursor, yield_per rows at a time (see export_properties)
+    statement = (
+        select(Booking.booking_id, Booking.guest_id, Booking.property_id, Booking.date_in, Booking.date_out)
+        .join(Property, Booking.property_id == Property.property_id)
+        .where(Property.host_id == host_id)
+        .order_by(Booking.booking_id)
+        .execution_options(yield_per=settings.export_batch_size)
+    )
+    async with open_session() as session:
+        result = await session.stream(statement)
+        try:
+            async for partition in result.partitions():
+                # BookingResponse field order
+                yield ndjson(row._asdict() for row in partition)
+        finally:
+            await result.close()
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_host_bookings(
+    open_session = Depends(get_session_factory),
+    current_user: dict = Depends(get_current_user)
+):
+    """All bookings of the current host's properties as NDJSON, one BookingResponse per line."""
+    if current_user["role"] != "host":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only hosts can export their bookings."
+        )
+
+    return StreamingResponse(_export_host_bookings(open_session, current_user["user_id"]), media_type=NDJSON_MEDIA_TYPE)
@@ -1,13 +1,33 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
-from app.core.db import get_session
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import and_, case, delete, exists, func, insert, or_
+from pydantic import ValidationError
+from math import cos, radians
+from datetime import date, timedelta
+from app.core.bulk_import import read_upload
+from app.core.calendar import calendar_cache, days_after, encode_bitmap, month_masks, months_between, next_month, runs, window_mask
+from app.core.config import settings
+from app.core.db import get_async_session, get_session_factory
+from app.core.etag import bump_catalog_version, catalog_version, etag_matches, make_etag, not_modified, set_etag
+from app.core.facets import adjust_facets, facet_counts, facet_deltas
+from app.core.geo import KM_PER_DEGREE, cell_id, cell_ranges, haversine_km
+from app.core.pagination import clamp_page_size, decode_cursor, encode_cursor, paginate
+from app.core.property_cache import CachedProperty, property_cache
+from app.core.responses import NDJSON_MEDIA_TYPE, json_response, ndjson
+from app.core.search import search_index
 from app.models.property import Property
-from app.schemas.property import PropertyCreate, PropertyRead
-import json
+from app.models.property_picture import PropertyPicture
+from app.schemas.property import (
+    BulkImportResult, BulkImportRow, CalendarRun, CityFacet, PropertyCalendar, PropertyCreate, PropertyFacets,
+    PropertyRead, PropertyPage, NearbyProperty, NearbyPropertyPage, StateFacet
+)
+from collections import defaultdict
 from app.core.dependencies import get_current_user
-from typing import List
-from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Tuple
 from app.models.booking import Booking
+from app.models.booking_night import BookingNight
 from app.models.user import User
 from app.schemas.booking import BookingResponse
 
@@ -15,10 +35,71 @@ from app.schemas.booking import BookingResponse
 router = APIRouter()
 
 
+def _to_property_read(property: Property, host_name: str, picture_urls: List[str]) -> PropertyRead:
+    # host_name and picture_urls are projected by the query (JOIN users, property_pictures) instead of
+    # lazy-loading property.host, which would cost one extra SELECT per row (N+1)
+    return PropertyRead(
+        property_id=property.property_id,
+        title=property.title,
+        address=property.address,
+        city=property.city,
+        state=property.state,
+        picture_urls=picture_urls,
+        host_name=host_name,
+        latitude=property.latitude,
+        longitude=property.longitude
+    )
+
+
+async def _property_entries(session: AsyncSession, property_ids: List[int]) -> Dict[int, CachedProperty]:
+    # read-through: cards come from property_cache, the misses are built from one query and cached
+    entries = await property_cache.get_many(property_ids)
+    missing = [property_id for property_id in property_ids if property_id not in entries]
+    if missing:
+        # one row per picture (or one with url NULL when there is none), pictures in display order
+        rows = (await session.exec(
+            select(Property, User.name, PropertyPicture.url)
+            .join(User, Property.host_id == User.user_id)
+            .outerjoin(PropertyPicture, PropertyPicture.property_id == Property.property_id)
+            .where(Property.property_id.in_(missing))
+            .order_by(Property.property_id, PropertyPicture.position)
+        )).all()
+        properties = {}
+        pictures = defaultdict(list)
+        for property, host_name, url in rows:
+            properties[property.property_id] = (property, host_name)
+            if url is not None:
+                pictures[property.property_id].append(url)
+        loaded = {
+            property_id: CachedProperty(property.version, _to_property_read(property, host_name, pictures[property_id]))
+            for property_id, (property, host_name) in properties.items()
+        }
+        await property_cache.set_many(loaded)
+        entries.update(loaded)
+    return entries
+
+
+async def _property_cards(session: AsyncSession, property_ids: List[int]) -> List[PropertyRead]:
+    # in the order of property_ids; ids deleted in the meantime are skipped
+    entries = await _property_entries(session, property_ids)
+    return [entries[property_id].card for property_id in property_ids if property_id in entries]
+
+
+def _first_pictures(cards: List[PropertyRead], max_pictures: Optional[int]) -> List[PropertyRead]:
+    # list views can ask for thumbnails only; cached cards are shared, so trimmed ones are copies
+    if max_pictures is None:
+        return cards
+    return [
+        card if len(card.picture_urls) <= max_pictures
+        else card.model_copy(update={"picture_urls": card.picture_urls[:max_pictures]})
+        for card in cards
+    ]
+
+
 @router.post("", response_model=PropertyRead)
-def create_property(
+async def create_property(
     property_in: PropertyCreate, 
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     current_user: dict = Depends(get_current_user)
     ):
 
@@ -30,15 +111,21 @@ def create_property(
             detail="Only hosts can create properties."
         ) 
 
+    if (property_in.latitude is None) != (property_in.longitude is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Both latitude and longitude are required to set a location."
+        )
+
     # Check for duplicate properties
-    existing_property = session.exec(
+    existing_property = (await session.exec(
         select(Property)
         .where(
             Property.host_id == host_id,
             Property.title == property_in.title,
             Property.address == property_in.address
         )
-    ).first()
+    )).first()
 
     if existing_property:
         raise HTTPException(
@@ -46,73 +133,368 @@ def create_property(
             detail="A property with this title and address already exists."
         )
 
-    # Ensure picture_urls is stored as a JSON string
     property = Property(
         title=property_in.title,
         address=property_in.address,
         city=property_in.city,
         state=property_in.state,
-        picture_urls=json.dumps(property_in.picture_urls),
         host_id=host_id,
+        latitude=property_in.latitude,
+        longitude=property_in.longitude,
+        geo_cell=cell_id(property_in.latitude, property_in.longitude),
     )
+    # same transaction as the insert: the catalog ETag changes exactly when the listing does
+    property.version = await bump_catalog_version(session)
+    await adjust_facets(session, facet_deltas([(property.state, property.city)]))
 
     session.add(property)
-    session.commit()
-    session.refresh(property)
+    await session.flush() # assigns property_id for the pictures
+    session.add_all([
+        PropertyPicture(property_id=property.property_id, position=position, url=url)
+        for position, url in enumerate(property_in.picture_urls)
+    ])
+    await session.commit()
+    await session.refresh(property)
+    search_index.add(property, property.version)
+    # SQLite can reuse the id of a deleted property: never serve a card cached under it
+    await property_cache.invalidate(property.property_id)
 
     # Create PropertyRead instance with host_name
-    property_read = PropertyRead(
-        property_id=property.property_id,
-        title=property.title,
-        address=property.address,
-        city=property.city,
-        state=property.state,
-        picture_urls=json.loads(property.picture_urls),  # Deserialize for response
-        host_name=property.host.name
+    host_name = (await session.exec(select(User.name).where(User.user_id == host_id))).one()
+
+    return _to_property_read(property, host_name, property_in.picture_urls)
+
+
+def _validation_detail(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}" for detail in error.errors()
     )
 
-    return property_read
 
+@router.post("/bulk", response_model=BulkImportResult)
+async def bulk_import_properties(
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: dict = Depends(get_current_user)
+):
+    """Create many properties from a JSON list, NDJSON or CSV upload (see app.core.bulk_import).
+
+    Invalid rows and duplicates (same title and address as a listing of the host, or as an earlier row)
+    are skipped and reported; the other rows are all created in one transaction.
+    """
+    host_id = current_user["user_id"]
 
-@router.get("/mine", response_model=List[PropertyRead])
-def list_my_properties(
-    session: Session = Depends(get_session),
+    if current_user["role"] != "host":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only hosts can import properties."
+        )
+
+    raw_rows = await read_upload(request)
+
+    # set-based duplicate check: the host's (title, address) pairs in one query, not one SELECT per row
+    seen = {
+        (title, address)
+        for title, address in await session.exec(select(Property.title, Property.address).where(Property.host_id == host_id))
+    }
+    results: List[BulkImportRow] = []
+    to_create: List[Tuple[BulkImportRow, PropertyCreate]] = []
+    for number, raw in enumerate(raw_rows, start=1):
+        result = BulkImportRow(row=number, status="invalid")
+        results.append(result)
+        if isinstance(raw, str): # the row couldn't be read at all
+            result.detail = raw
+            continue
+        try:
+            property_in = PropertyCreate.model_validate(raw)
+        except ValidationError as error:
+            result.detail = _validation_detail(error)
+            continue
+        if (property_in.latitude is None) != (property_in.longitude is None):
+            result.detail = "Both latitude and longitude are required to set a location."
+            continue
+        if (property_in.title, property_in.address) in seen:
+            result.status = "duplicate"
+            result.detail = "A property with this title and address already exists."
+            continue
+        seen.add((property_in.title, property_in.address))
+        to_create.append((result, property_in))
+
+    created_ids = []
+    if to_create:
+        # one catalog change for the whole import, in its transaction
+        version = await bump_catalog_version(session)
+        chunk_size = settings.bulk_import_chunk_size
+        properties, pictures = Property.__table__, PropertyPicture.__table__ # Core inserts: no ORM objects per row
+        for start in range(0, len(to_create), chunk_size):
+            chunk = to_create[start:start + chunk_size]
+            # multi-row INSERT ... RETURNING, no flush/refresh per object. The returned rows aren't
+            # guaranteed to come back in parameter order, so they're matched on (title, address),
+            # unique within the import after the duplicate check.
+            inserted = (await session.exec(
+                insert(properties).returning(properties.c.property_id, properties.c.title, properties.c.address),
+                params=[
+                    {
+                        "title": property_in.title,
+                        "address": property_in.address,
+                        "city": property_in.city,
+                        "state": property_in.state,
+                        "host_id": host_id,
+                        "latitude": property_in.latitude,
+                        "longitude": property_in.longitude,
+                        "geo_cell": cell_id(property_in.latitude, property_in.longitude),
+                        "version": version,
+                    }
+                    for _, property_in in chunk
+                ]
+            )).all()
+            property_ids = {(title, address): property_id for property_id, title, address in inserted}
+            picture_rows = []
+            for result, property_in in chunk:
+                result.status = "created"
+                result.property_id = property_ids[(property_in.title, property_in.address)]
+                picture_rows.extend(
+                    {"property_id": result.property_id, "position": position, "url": url}
+                    for position, url in enumerate(property_in.picture_urls)
+                )
+                created_ids.append(result.property_id)
+            if picture_rows:
+                await session.exec(insert(pictures), params=picture_rows)
+        await adjust_facets(session, facet_deltas((property_in.state, property_in.city) for _, property_in in to_create))
+        await session.commit()
+        # rows written without going through search_index.add: the in-memory index rebuilds on next search
+        search_index.invalidate()
+        # SQLite can reuse the ids of deleted properties: never serve a card cached under them
+        await property_cache.invalidate_many(created_ids)
+
+    created = len(created_ids)
+    duplicates = sum(1 for result in results if result.status == "duplicate")
+    return json_response(
+        BulkImportResult(created=created, duplicates=duplicates, invalid=len(results) - created - duplicates, rows=results),
+        response
+    )
+
+
+@router.get("/mine", response_model=PropertyPage)
+async def list_my_properties(
+    response: Response,
+    limit: int = Query(default=settings.default_page_size, ge=1),
+    max_pictures: Optional[int] = Query(default=settings.list_max_pictures, ge=0, description="only the first n picture_urls of each property (thumbnails)"),
+    cursor: Optional[str] = None,
+    session: AsyncSession = Depends(get_async_session),
     current_user: dict = Depends(get_current_user)
 ):
     if current_user["role"] != "host":
         raise HTTPException(status_code=403, detail="Only hosts can view their properties.")
 
-    # Query properties with a more specific distinct clause
-    properties = session.exec(
-        select(Property)
+    limit = clamp_page_size(limit)
+
+    # Keyset pagination: fetch one extra row to know if there is a next page.
+    # Only the ids are queried (served by ix_properties_host), the cards come from the cache.
+    statement = (
+        select(Property.property_id)
         .where(Property.host_id == current_user["user_id"])
-        .distinct(Property.property_id)  # Ensure distinct by property_id
-        .order_by(Property.property_id)  # Add ordering for consistent results
-    ).all()
-
-    # Convert to PropertyRead objects
-    result = []
-    seen_ids = set()  # Track seen property IDs to prevent duplicates
-    for property in properties:
-        if property.property_id not in seen_ids:
-            seen_ids.add(property.property_id)
-            property_read = PropertyRead(
-                property_id=property.property_id,
-                title=property.title,
-                address=property.address,
-                city=property.city,
-                state=property.state,
-                picture_urls=json.loads(property.picture_urls),
-                host_name=property.host.name
-            )
-            result.append(property_read)
+        .order_by(Property.property_id)
+        .limit(limit + 1)
+    )
+    if cursor is not None:
+        statement = statement.where(Property.property_id > decode_cursor(cursor))
+
+    property_ids, next_cursor = paginate((await session.exec(statement)).all(), limit, key=lambda property_id: property_id)
+
+    result = _first_pictures(await _property_cards(session, property_ids), max_pictures)
+
+    return json_response(PropertyPage(items=result, next_cursor=next_cursor), response)
+
+
+@router.get("/search", response_model=PropertyPage)
+async def search_properties(
+    response: Response,
+    q: str = Query(min_length=1, description="words to look for in title, city and state"),
+    limit: int = Query(default=settings.default_page_size, ge=1),
+    max_pictures: Optional[int] = Query(default=settings.list_max_pictures, ge=0, description="only the first n picture_urls of each property (thumbnails)"),
+    cursor: Optional[str] = None,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: dict = Depends(get_current_user)
+):
+    # Authorization: only guests can search, like browse
+    if current_user["role"] != "guest":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only guests can search properties."
+        )
+
+    limit = clamp_page_size(limit)
+
+    # Results are ordered by relevance, not by id, so the cursor carries the rank offset
+    offset = decode_cursor(cursor) if cursor is not None else 0
+    property_ids = await search_index.search(session, q, limit + 1, offset)
+    page_ids = property_ids[:limit]
+    next_cursor = encode_cursor(offset + limit) if len(property_ids) > limit else None
+
+    result = _first_pictures(await _property_cards(session, page_ids), max_pictures)
+
+    return json_response(PropertyPage(items=result, next_cursor=next_cursor), response)
+
+
+@router.get("/nearby", response_model=NearbyPropertyPage)
+async def nearby_properties(
+    response: Response,
+    lat: float = Query(ge=-90, le=90),
+    lng: float = Query(ge=-180, le=180),
+    radius_km: float = Query(default=10, gt=0, le=settings.max_search_radius_km),
+    limit: int = Query(default=settings.default_page_size, ge=1),
+    max_pictures: Optional[int] = Query(default=settings.list_max_pictures, ge=0, description="only the first n picture_urls of each property (thumbnails)"),
+    cursor: Optional[str] = None,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: dict = Depends(get_current_user)
+):
+    # Authorization: only guests can search, like browse
+    if current_user["role"] != "guest":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only guests can search properties."
+        )
+
+    limit = clamp_page_size(limit)
+
+    # Equirectangular distance in squared degrees: no trigonometry in SQL, accurate at city scale.
+    # cos(lat) is computed once here, so the database only does arithmetic.
+    # The longitude difference goes the short way round: 179.99 and -179.99 are 0.02 degrees apart.
+    longitude_scale = cos(radians(lat))
+    longitude_gap = func.abs(Property.longitude - lng)
+    longitude_gap = case((longitude_gap > 180, 360 - longitude_gap), else_=longitude_gap) * longitude_scale
+    squared_distance = (Property.latitude - lat) * (Property.latitude - lat) + longitude_gap * longitude_gap
+
+    # The geo_cell index narrows the scan to the cells of the bounding box, then the exact radius applies
+    statement = (
+        select(Property.property_id, squared_distance)
+        .where(or_(*(Property.geo_cell.between(first, last) for first, last in cell_ranges(lat, lng, radius_km))))
+        .where(squared_distance <= (radius_km / KM_PER_DEGREE) ** 2)
+        .order_by(squared_distance, Property.property_id)
+        .limit(limit + 1)
+    )
+    # Keyset pagination on (distance, property_id)
+    if cursor is not None:
+        last_distance, last_id = decode_cursor(cursor, float, int)
+        statement = statement.where(or_(
+            squared_distance > last_distance,
+            and_(squared_distance == last_distance, Property.property_id > last_id)
+        ))
+
+    rows, next_cursor = paginate((await session.exec(statement)).all(), limit, key=lambda row: (row[1], row[0]))
+
+    result = [
+        NearbyProperty(
+            **card.model_dump(),
+            distance_km=round(haversine_km(lat, lng, card.latitude, card.longitude), 3)
+        )
+        for card in _first_pictures(await _property_cards(session, [property_id for property_id, _ in rows]), max_pictures)
+    ]
+
+    return json_response(NearbyPropertyPage(items=result, next_cursor=next_cursor), response)
+
+
+async def _export_properties(open_session):
+    # One streaming query (properties + host name + pictures in display order), read yield_per rows
+    # at a time from a server-side cursor: memory stays flat whatever the catalog size.
+    # Columns, not entities, so nothing accumulates in the session identity map.
+    statement = (
+        select(
+            Property.property_id, Property.title, Property.address, Property.city, Property.state,
+            User.name, Property.latitude, Property.longitude, PropertyPicture.url
+        )
+        .join(User, Property.host_id == User.user_id)
+        .outerjoin(PropertyPicture, PropertyPicture.property_id == Property.property_id)
+        .order_by(Property.property_id, PropertyPicture.position)
+        .execution_options(yield_per=settings.export_batch_size)
+    )
+    async with open_session() as session:
+        result = await session.stream(statement)
+        try:
+            current = None # the property being assembled, its pictures may continue in the next batch
+            async for partition in result.partitions():
+                done = []
+                for property_id, title, address, city, state, host_name, latitude, longitude, url in partition:
+                    if current is None or current["property_id"] != property_id:
+                        if current is not None:
+                            done.append(current)
+                        # PropertyRead field order
+                        current = {
+                            "property_id": property_id, "title": title, "address": address, "city": city, "state": state,
+                            "picture_urls": [], "host_name": host_name, "latitude": latitude, "longitude": longitude
+                        }
+                    if url is not None:
+                        current["picture_urls"].append(url)
+                if done:
+                    yield ndjson(done)
+            if current is not None:
+                yield ndjson([current])
+        finally:
+            await result.close()
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_properties(
+    open_session = Depends(get_session_factory),
+    current_user: dict = Depends(get_current_user)
+):
+    """The whole catalog as NDJSON, one PropertyRead per line, streamed as it is read."""
+    if current_user["role"] not in ["guest", "host"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only guests and hosts can export properties."
+        )
+
+    # the body runs after this function returns (and after the request's session is closed): it opens its own
+    return StreamingResponse(_export_properties(open_session), media_type=NDJSON_MEDIA_TYPE)
 
-    return result
 
+@router.get("/facets", response_model=PropertyFacets)
+async def get_property_facets(
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+    session: AsyncSession = Depends(get_async_session),
+    current_user: dict = Depends(get_current_user)
+):
+    """Number of properties per state and per city, largest first, from the maintained counts (app.core.facets)."""
+    if current_user["role"] not in ["guest", "host"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only guests and hosts can view facets."
+        )
 
-@router.get("", response_model=List[PropertyRead])
-def browse_properties(
-    session: Session = Depends(get_session),
+    # the counts change exactly when the catalog does
+    etag = make_etag("facets", await catalog_version(session))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+
+    states: Dict[str, List[CityFacet]] = defaultdict(list)
+    for state, city, count in await facet_counts(session):
+        states[state].append(CityFacet(city=city, count=count))
+    facets = [
+        StateFacet(state=state, count=sum(city.count for city in cities), cities=sorted(cities, key=lambda city: (-city.count, city.city)))
+        for state, cities in states.items()
+    ]
+    facets.sort(key=lambda facet: (-facet.count, facet.state))
+
+    return json_response(PropertyFacets(total=sum(facet.count for facet in facets), states=facets), response)
+
+
+@router.get("", response_model=PropertyPage)
+async def browse_properties(
+    response: Response,
+    limit: int = Query(default=settings.default_page_size, ge=1),
+    max_pictures: Optional[int] = Query(default=settings.list_max_pictures, ge=0, description="only the first n picture_urls of each property (thumbnails)"),
+    cursor: Optional[str] = None,
+    city: Optional[str] = None,
+    state: Optional[str] = None,
+    date_in: Optional[date] = None,
+    date_out: Optional[date] = None,
+    if_none_match: Optional[str] = Header(default=None),
+    session: AsyncSession = Depends(get_async_session),
     current_user: dict = Depends(get_current_user)
 ):
     # Authorization: only guests can browse
@@ -122,30 +504,65 @@ def browse_properties(
             detail="Only guests can browse available properties."
         )
     
-    properties = session.exec(
-        select(Property)
-    ).all()
+    # Availability search needs both ends of the stay
+    if (date_in is None) != (date_out is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Both date_in and date_out are required to search availability."
+        )
+    if date_in is not None and date_in >= date_out:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Check-in date must be before check-out date."
+        )
 
-    result = []
-    for property in properties:
-        property_read = PropertyRead(
-            property_id=property.property_id,
-            title=property.title,
-            address=property.address,
-            city=property.city,
-            state=property.state,
-            picture_urls=json.loads(property.picture_urls),  # Deserialize for response
-            host_name=property.host.name
+    limit = clamp_page_size(limit)
+
+    # Conditional GET: a page only changes with the catalog (ETags are per URL, so filters and
+    # cursor are already part of the key). Availability also depends on bookings, which don't
+    # bump the catalog version, so date searches are always served in full.
+    if date_in is None:
+        etag = make_etag("catalog", await catalog_version(session))
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        set_etag(response, etag)
+
+    # Keyset pagination on property_id: latency stays flat however deep the client pages.
+    # Only the ids are queried, the cards come from the cache.
+    statement = (
+        select(Property.property_id)
+        .order_by(Property.property_id)
+        .limit(limit + 1)
+    )
+    if cursor is not None:
+        statement = statement.where(Property.property_id > decode_cursor(cursor))
+    if city is not None:
+        statement = statement.where(Property.city == city)
+    if state is not None:
+        statement = statement.where(Property.state == state)
+    if date_in is not None:
+        # Anti-join: keep only properties with no booking overlapping the stay.
+        # Same overlap rule as create_booking, served by ix_bookings_property_dates.
+        overlapping_booking = exists().where(
+            Booking.property_id == Property.property_id,
+            Booking.date_in < date_out,
+            Booking.date_out > date_in
         )
-        result.append(property_read)
+        statement = statement.where(~overlapping_booking)
+
+    property_ids, next_cursor = paginate((await session.exec(statement)).all(), limit, key=lambda property_id: property_id)
 
-    return result
+    result = _first_pictures(await _property_cards(session, property_ids), max_pictures)
+
+    return json_response(PropertyPage(items=result, next_cursor=next_cursor), response)
 
 
 @router.get("/{property_id}", response_model=PropertyRead)
-def get_property_details(
+async def get_property_details(
     property_id: int,
-    session: Session = Depends(get_session),
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+    session: AsyncSession = Depends(get_async_session),
     current_user: dict = Depends(get_current_user)
 ):
     # Authorization: both guests and hosts can view property details
@@ -155,31 +572,33 @@ def get_property_details(
             detail="Only guests and hosts can view property details."
         )
 
-    property = session.get(Property, property_id)
-
-    if not property:
+    # Conditional GET: answer 304 from the cached version, or else look up the version alone,
+    # before loading/serializing the property
+    entry = (await property_cache.get_many([property_id])).get(property_id)
+    if entry is None and if_none_match is not None:
+        version = (await session.exec(select(Property.version).where(Property.property_id == property_id))).first()
+        if version is not None and etag_matches(if_none_match, make_etag("property", property_id, version)):
+            return not_modified(make_etag("property", property_id, version))
+    if entry is None:
+        entry = (await _property_entries(session, [property_id])).get(property_id)
+
+    if entry is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Property not found."
         )
 
-    property_read = PropertyRead(
-        property_id=property.property_id,
-        title=property.title,
-        address=property.address,
-        city=property.city,
-        state=property.state,
-        picture_urls=json.loads(property.picture_urls),  # Deserialize for response
-        host_name=property.host.name
-    )
-
-    return property_read
+    etag = make_etag("property", property_id, entry.version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    return json_response(entry.card, response)
 
 
 @router.delete("/{property_id}")
-def delete_property(
+async def delete_property(
     property_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     current_user: dict = Depends(get_current_user)
 ):
     # Authorization: only hosts can delete their own properties
@@ -189,7 +608,7 @@ def delete_property(
             detail="Only hosts can delete properties."
         )
 
-    property = session.get(Property, property_id)
+    property = await session.get(Property, property_id)
 
     if not property:
         raise HTTPException(
@@ -204,31 +623,101 @@ def delete_property(
             detail="You can only delete your own properties."
         )
 
-    session.delete(property)
-    session.commit()
+    # its bookings and their claimed nights go with it: ids are reused, a later listing must not inherit them
+    await session.exec(delete(BookingNight).where(BookingNight.property_id == property_id))
+    await session.exec(delete(Booking).where(Booking.property_id == property_id))
+    await session.exec(delete(PropertyPicture).where(PropertyPicture.property_id == property_id))
+    await session.delete(property)
+    version = await bump_catalog_version(session)
+    await adjust_facets(session, facet_deltas([(property.state, property.city)], sign=-1))
+    await session.commit()
+    search_index.remove(property_id, version)
+    await property_cache.invalidate(property_id)
+    calendar_cache.invalidate(property_id)
 
     return {"message": "Property deleted successfully"}
 
 
 @router.get("/{property_id}/bookings", response_model=List[BookingResponse])
-def get_property_bookings(
+async def get_property_bookings(
     property_id: int,
-    session: Session = Depends(get_session),
+    response: Response,
+    session: AsyncSession = Depends(get_async_session),
     current_user: dict = Depends(get_current_user)
 ):
     """Get all bookings for a specific property"""
     # Check if property exists
-    property = session.get(Property, property_id)
+    property = await session.get(Property, property_id)
     if not property:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Property not found"
         )
 
-    # Get all bookings for this property
-    bookings = session.exec(
-        select(Booking)
+    # Get all bookings for this property, as plain rows in BookingResponse field order
+    bookings = (await session.exec(
+        select(Booking.booking_id, Booking.guest_id, Booking.property_id, Booking.date_in, Booking.date_out)
         .where(Booking.property_id == property_id)
-    ).all()
-    
-    return bookings
+    )).all()
+    bookings = [booking._asdict() for booking in bookings]
+
+    return json_response(bookings, response)
+
+
+@router.get("/{property_id}/calendar", response_model=PropertyCalendar)
+async def get_property_calendar(
+    property_id: int,
+    response: Response,
+    start: Optional[date] = Query(default=None, alias="from", description="first night of the window (default: today)"),
+    end: Optional[date] = Query(default=None, alias="to", description="day after the last night (default: from + CALENDAR_DEFAULT_DAYS)"),
+    session: AsyncSession = Depends(get_async_session),
+    current_user: dict = Depends(get_current_user)
+):
+    """Booked nights of [from, to) as a bitmap and runs (app.core.calendar), for date pickers."""
+    start = start or date.today()
+    end = end or days_after(start, settings.calendar_default_days)
+    if end <= start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The calendar must end after it starts."
+        )
+    if (end - start).days > settings.calendar_max_days:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"The calendar can span at most {settings.calendar_max_days} days."
+        )
+
+    months = months_between(start, end)
+    masks = calendar_cache.get(property_id, months)
+    missing = [month for month in months if month not in masks]
+    if missing:
+        if not await session.get(Property, property_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Property not found"
+            )
+        # one range scan of the booking_nights primary key, whole months so they can be cached
+        loaded_months = months_between(missing[0], next_month(missing[-1]))
+        nights = (await session.exec(
+            select(BookingNight.night)
+            .where(
+                BookingNight.property_id == property_id,
+                BookingNight.night >= loaded_months[0],
+                BookingNight.night < next_month(loaded_months[-1])
+            )
+        )).all()
+        loaded = month_masks(nights, loaded_months)
+        calendar_cache.put(property_id, loaded)
+        masks.update(loaded)
+
+    bits = window_mask(masks, start, end)
+    return json_response(
+        PropertyCalendar(
+            property_id=property_id,
+            start=start,
+            end=end,
+            bitmap=encode_bitmap(bits, (end - start).days),
+            runs=[CalendarRun(start=start + timedelta(days=offset), nights=length) for offset, length in runs(bits)]
+        ),
+        response
+    )
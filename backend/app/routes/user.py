@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
-from app.core.db import get_session
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.db import get_async_session
 from app.core.security import hash_password, verify_password, create_access_token
 from app.models.user import User
 from app.schemas.user import UserCreate, UserRead, UserLogin
@@ -15,10 +16,10 @@ class SignupResponse(BaseModel):
 router = APIRouter()
 
 @router.post("/signup", response_model=SignupResponse)
-def signup(user_create: UserCreate, session: Session = Depends(get_session)):
+async def signup(user_create: UserCreate, session: AsyncSession = Depends(get_async_session)):
     # 1. Check if the user already exists
     statement = select(User).where(User.email == user_create.email)
-    existing_user = session.exec(statement).first()
+    existing_user = (await session.exec(statement)).first()
 
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already registered.")
@@ -36,8 +37,8 @@ def signup(user_create: UserCreate, session: Session = Depends(get_session)):
 
     # 4. Insert into database
     session.add(user)
-    session.commit()
-    session.refresh(user)
+    await session.commit()
+    await session.refresh(user)
 
     # 5. Create access token
     access_token = create_access_token(
@@ -52,13 +53,13 @@ def signup(user_create: UserCreate, session: Session = Depends(get_session)):
     }
 
 @router.post("/login")
-def login(
+async def login(
     form_data: OAuth2PasswordRequestForm = Depends(), 
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
     ):
 
     statement = select(User).where(User.email == form_data.username)
-    user = session.exec(statement).first()
+    user = (await session.exec(statement)).first()
 
     if not user or not verify_password(form_data.password, user.hashed_password):
         raise HTTPException(
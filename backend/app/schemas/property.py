@@ -1,5 +1,6 @@
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, Field
+from datetime import date
+from typing import List, Literal, Optional
 
 # request model
 class PropertyCreate(BaseModel):
@@ -8,6 +9,8 @@ class PropertyCreate(BaseModel):
     city: str
     state: str
     picture_urls: List[str]
+    latitude: Optional[float] = Field(default=None, ge=-90, le=90)
+    longitude: Optional[float] = Field(default=None, ge=-180, le=180)
     # host_id filled automactiacally by backend based on the logged-in user
 
 # response model
@@ -19,4 +22,58 @@ class PropertyRead(BaseModel):
     state: str
     picture_urls: List[str]
     host_name: str
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
     # no need to expose the host_id to the frontend
+
+# paginated response model (keyset pagination on property_id)
+class PropertyPage(BaseModel):
+    items: List[PropertyRead]
+    next_cursor: Optional[str] = None # pass it back as ?cursor= to get the next page, None on the last page
+
+# radius search response models (sorted by distance)
+class NearbyProperty(PropertyRead):
+    distance_km: float
+
+class NearbyPropertyPage(BaseModel):
+    items: List[NearbyProperty]
+    next_cursor: Optional[str] = None
+
+# bulk import response models (one result per uploaded row, in upload order)
+class BulkImportRow(BaseModel):
+    row: int # 1-based position in the upload (CSV: header excluded)
+    status: Literal["created", "duplicate", "invalid"]
+    property_id: Optional[int] = None
+    detail: Optional[str] = None
+
+class BulkImportResult(BaseModel):
+    created: int
+    duplicates: int
+    invalid: int
+    rows: List[BulkImportRow]
+
+# availability calendar response models (nights of [start, end), the check-out day is not a night)
+class CalendarRun(BaseModel):
+    start: date # first booked night of the run
+    nights: int
+
+class PropertyCalendar(BaseModel):
+    property_id: int
+    start: date
+    end: date # exclusive
+    bitmap: str # base64, bit i (byte i // 8, least significant bit first) set = night start + i is booked
+    runs: List[CalendarRun] # the same booked nights, run-length encoded
+
+# facet counts response models (properties per state and city, largest first)
+class CityFacet(BaseModel):
+    city: str
+    count: int
+
+class StateFacet(BaseModel):
+    state: str
+    count: int
+    cities: List[CityFacet]
+
+class PropertyFacets(BaseModel):
+    total: int
+    states: List[StateFacet]
@@ -0,0 +1,77 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.tests.utils.db import open_test_session
+from app.tests.utils.factories import create_test_user
+from app.tests.utils.auth import get_token
+import pytest
+
+client = TestClient(app)
+
+@pytest.fixture
+def catalog():
+    with open_test_session() as session:
+        create_test_user(session, "searchhost@example.com", "password123", role="host")
+        create_test_user(session, "searchguest@example.com", "password123", role="guest")
+    host_token = get_token("searchhost@example.com", "password123")
+    guest_token = get_token("searchguest@example.com", "password123")
+
+    property_ids = {}
+    for title, city, state in [
+        ("Lisbon Loft", "Lisbon", "LX"),
+        ("Lisbon Studio", "Lisbon", "LX"),
+        ("Porto Flat", "Porto", "PT"),
+    ]:
+        response = client.post(
+            "/v1/properties",
+            headers={"Authorization": f"Bearer {host_token}"},
+            json={
+                "title": title,
+                "address": f"1 {title} Street",
+                "city": city,
+                "state": state,
+                "picture_urls": ["https://example.com/search.jpg"]
+            }
+        )
+        assert response.status_code == 200
+        property_ids[title] = response.json()["property_id"]
+
+    # The Lisbon Loft is taken from the 10th to the 15th
+    response = client.post(
+        "/v1/bookings",
+        headers={"Authorization": f"Bearer {guest_token}"},
+        json={"property_id": property_ids["Lisbon Loft"], "date_in": "2025-08-10", "date_out": "2025-08-15"}
+    )
+    assert response.status_code == 200
+
+    return {"guest_token": guest_token, "property_ids": property_ids}
+
+def search(token, **params):
+    response = client.get(
+        "/v1/properties",
+        headers={"Authorization": f"Bearer {token}"},
+        params=params
+    )
+    assert response.status_code == 200
+    return {property["title"] for property in response.json()["items"]}
+
+def test_search_by_city(catalog):
+    assert search(catalog["guest_token"], city="Lisbon") == {"Lisbon Loft", "Lisbon Studio"}
+    assert search(catalog["guest_token"], city="Porto", state="PT") == {"Porto Flat"}
+
+def test_search_excludes_overlapping_bookings(catalog):
+    titles = search(catalog["guest_token"], city="Lisbon", date_in="2025-08-12", date_out="2025-08-20")
+    assert titles == {"Lisbon Studio"}
+
+def test_search_includes_back_to_back_stays(catalog):
+    # checking in on the day the previous guest checks out is not an overlap
+    titles = search(catalog["guest_token"], city="Lisbon", date_in="2025-08-15", date_out="2025-08-18")
+    assert titles == {"Lisbon Loft", "Lisbon Studio"}
+
+def test_search_requires_both_dates(catalog):
+    response = client.get(
+        "/v1/properties",
+        headers={"Authorization": f"Bearer {catalog['guest_token']}"},
+        params={"date_in": "2025-08-12"}
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Both date_in and date_out are required to search availability."
@@ -1,8 +1,9 @@
 from fastapi.testclient import TestClient
 from app.main import app
+from app.core.config import settings
 from app.tests.utils.factories import create_test_user
 from app.tests.utils.auth import get_token
-from app.core.db import get_session
+from app.tests.utils.db import open_test_session
 from sqlmodel import Session
 import pytest
 
@@ -10,7 +11,7 @@ client = TestClient(app)
 
 @pytest.fixture
 def setup_guest_and_host():
-    with next(get_session()) as session:
+    with open_test_session() as session:
         host = create_test_user(session, "hostbooking@example.com", "password123", role="host")
         guest = create_test_user(session, "guestbooking@example.com", "password123", role="guest")
     return {
@@ -77,6 +78,26 @@ def test_booking_fails_due_to_invalid_dates(setup_guest_and_host):
     assert response.status_code == 400
     assert response.json()["detail"] == "Check-in date must be before check-out date."
 
+def test_booking_fails_when_the_stay_is_too_long(setup_guest_and_host, monkeypatch):
+    monkeypatch.setattr(settings, "max_stay_nights", 30)
+    host_token = get_token(setup_guest_and_host["host_email"], setup_guest_and_host["password"])
+    property_id = create_property(host_token)
+    guest_token = get_token(setup_guest_and_host["guest_email"], setup_guest_and_host["password"])
+
+    def book(date_in, date_out):
+        return client.post(
+            "/v1/bookings",
+            headers={"Authorization": f"Bearer {guest_token}"},
+            json={"property_id": property_id, "date_in": date_in, "date_out": date_out}
+        )
+
+    response = book("2025-06-01", "2035-06-01")
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Stays are limited to 30 nights."
+    assert book("2025-06-01", "2025-07-02").status_code == 400 # 31 nights
+    assert book("2025-06-01", "2025-07-01").status_code == 200 # 30 nights
+
 def test_booking_fails_due_to_overlap(setup_guest_and_host):
     host_token = get_token(setup_guest_and_host["host_email"], setup_guest_and_host["password"])
     property_id = create_property(host_token)
@@ -108,3 +129,22 @@ def test_booking_fails_due_to_overlap(setup_guest_and_host):
 
     assert response.status_code == 400
     assert response.json()["detail"] == "Property already booked for the selected dates."
+
+def test_deleted_property_takes_its_bookings_along(setup_guest_and_host):
+    host_token = get_token(setup_guest_and_host["host_email"], setup_guest_and_host["password"])
+    guest_token = get_token(setup_guest_and_host["guest_email"], setup_guest_and_host["password"])
+    stay = {"date_in": "2025-08-01", "date_out": "2025-08-05"}
+    property_id = create_property(host_token)
+    response = client.post("/v1/bookings", headers={"Authorization": f"Bearer {guest_token}"}, json={"property_id": property_id, **stay})
+    assert response.status_code == 200
+
+    response = client.delete(f"/v1/properties/{property_id}", headers={"Authorization": f"Bearer {host_token}"})
+    assert response.status_code == 200
+    assert client.get("/v1/bookings/my-bookings", headers={"Authorization": f"Bearer {guest_token}"}).json() == []
+
+    # the highest id was deleted: the next listing gets it back, without the old claimed nights
+    assert create_property(host_token) == property_id
+    calendar = client.get(f"/v1/properties/{property_id}/calendar?from=2025-08-01", headers={"Authorization": f"Bearer {guest_token}"})
+    assert calendar.json()["runs"] == []
+    response = client.post("/v1/bookings", headers={"Authorization": f"Bearer {guest_token}"}, json={"property_id": property_id, **stay})
+    assert response.status_code == 200
@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from app.main import app
+from app.tests.utils.db import open_test_session
+from app.tests.utils.factories import create_test_user
+from app.tests.utils.auth import get_token
+import pytest
+
+client = TestClient(app)
+
+@pytest.fixture
+def property_and_guests():
+    with open_test_session() as session:
+        create_test_user(session, "racehost@example.com", "password123", role="host")
+        for i in range(4):
+            create_test_user(session, f"raceguest{i}@example.com", "password123", role="guest")
+
+    host_token = get_token("racehost@example.com", "password123")
+    response = client.post(
+        "/v1/properties",
+        headers={"Authorization": f"Bearer {host_token}"},
+        json={
+            "title": "Contested Cabin",
+            "address": "1 Race Road",
+            "city": "Race City",
+            "state": "RC",
+            "picture_urls": ["https://example.com/race.jpg"]
+        }
+    )
+    assert response.status_code == 200
+    return {
+        "property_id": response.json()["property_id"],
+        "guest_tokens": [get_token(f"raceguest{i}@example.com", "password123") for i in range(4)]
+    }
+
+# concurrent requests need their own connections, they can't share the test's transaction
+@pytest.mark.committed
+def test_concurrent_overlapping_bookings_never_double_book(property_and_guests):
+    property_id = property_and_guests["property_id"]
+    guest_tokens = property_and_guests["guest_tokens"]
+
+    # every request overlaps the others on the night of 2025-09-12
+    requests = [
+        (guest_tokens[i % len(guest_tokens)], f"2025-09-{10 + i % 3:02d}", f"2025-09-{13 + i % 2:02d}")
+        for i in range(24)
+    ]
+
+    def book(request):
+        token, date_in, date_out = request
+        return client.post(
+            "/v1/bookings",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"property_id": property_id, "date_in": date_in, "date_out": date_out}
+        ).status_code
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        status_codes = list(pool.map(book, requests))
+
+    assert status_codes.count(200) == 1
+    assert set(status_codes) <= {200, 400}
+
+    with open_test_session() as session:
+        bookings = session.exec(text("SELECT COUNT(*) FROM bookings WHERE property_id = :id").bindparams(id=property_id)).one()[0]
+    assert bookings == 1
@@ -0,0 +1,137 @@
+import json
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core.config import settings
+from app.tests.utils.db import open_test_session
+import pytest
+from app.tests.utils.factories import create_test_user
+from app.tests.utils.auth import get_token
+
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def tokens():
+    with open_test_session() as session:
+        create_test_user(session, "host@example.com", "strongpassword", role="host")
+        create_test_user(session, "other-host@example.com", "strongpassword", role="host")
+        create_test_user(session, "guest@example.com", "strongpassword", role="guest")
+    return {
+        "host": get_token("host@example.com", "strongpassword"),
+        "other_host": get_token("other-host@example.com", "strongpassword"),
+        "guest": get_token("guest@example.com", "strongpassword"),
+    }
+
+
+def _listing(n: int, **overrides):
+    listing = {
+        "title": f"Loft {n}",
+        "address": f"{n} Main Street",
+        "city": "Lisbon",
+        "state": "LX",
+        "picture_urls": [f"https://example.com/{n}-a.jpg", f"https://example.com/{n}-b.jpg"],
+    }
+    listing.update(overrides)
+    return listing
+
+
+def _import(token: str, **kwargs):
+    return client.post("/v1/properties/bulk", headers={"Authorization": f"Bearer {token}"}, **kwargs)
+
+
+def test_json_import_creates_every_row_in_chunks(tokens, monkeypatch):
+    monkeypatch.setattr(settings, "bulk_import_chunk_size", 2)
+    listings = [_listing(n) for n in range(5)]
+    listings[3].update(latitude=38.72, longitude=-9.14)
+
+    response = _import(tokens["host"], json=listings)
+    assert response.status_code == 200
+    result = response.json()
+    assert (result["created"], result["duplicates"], result["invalid"]) == (5, 0, 0)
+    assert [row["row"] for row in result["rows"]] == [1, 2, 3, 4, 5]
+    assert all(row["status"] == "created" for row in result["rows"])
+
+    # each created id reads back as the uploaded listing, pictures in order
+    for listing, row in zip(listings, result["rows"]):
+        card = client.get(f"/v1/properties/{row['property_id']}", headers={"Authorization": f"Bearer {tokens['guest']}"}).json()
+        assert card["title"] == listing["title"]
+        assert card["picture_urls"] == listing["picture_urls"]
+    nearby = client.get(
+        "/v1/properties/nearby", params={"lat": 38.72, "lng": -9.14, "radius_km": 1},
+        headers={"Authorization": f"Bearer {tokens['guest']}"}
+    ).json()
+    assert [item["property_id"] for item in nearby["items"]] == [result["rows"][3]["property_id"]]
+
+
+def test_duplicates_and_invalid_rows_are_reported_not_created(tokens):
+    assert client.post("/v1/properties", headers={"Authorization": f"Bearer {tokens['host']}"}, json=_listing(0)).status_code == 200
+
+    response = _import(tokens["host"], json=[
+        _listing(0),                        # already listed by the host
+        _listing(1),
+        _listing(1),                        # repeated within the upload
+        {"title": "No address"},            # missing fields
+        _listing(2, latitude=10.0),         # latitude without longitude
+        "not an object",
+    ])
+    assert response.status_code == 200
+    result = response.json()
+    assert (result["created"], result["duplicates"], result["invalid"]) == (1, 2, 3)
+    assert [row["status"] for row in result["rows"]] == ["duplicate", "created", "duplicate", "invalid", "invalid", "invalid"]
+    assert "address" in result["rows"][3]["detail"]
+
+    # another host may list the same title and address
+    assert _import(tokens["other_host"], json=[_listing(0)]).json()["created"] == 1
+
+    mine = client.get("/v1/properties/mine", headers={"Authorization": f"Bearer {tokens['host']}"}).json()
+    assert sorted(item["title"] for item in mine["items"]) == ["Loft 0", "Loft 1"]
+
+
+def test_ndjson_and_csv_uploads(tokens):
+    body = "\n".join(json.dumps(_listing(n)) for n in range(2)) + "\n\n{broken\n"
+    response = client.post(
+        "/v1/properties/bulk",
+        headers={"Authorization": f"Bearer {tokens['host']}", "Content-Type": "application/x-ndjson"},
+        content=body
+    )
+    assert response.status_code == 200
+    assert [row["status"] for row in response.json()["rows"]] == ["created", "created", "invalid"]
+
+    csv_body = (
+        "title,address,city,state,picture_urls,latitude,longitude\n"
+        "Cabin,1 Lake Road,Tahoe,CA,https://example.com/c1.jpg https://example.com/c2.jpg,39.09,-120.03\n"
+        "Shed,2 Lake Road,Tahoe,CA,,,\n"
+    )
+    response = _import(tokens["host"], files={"file": ("listings.csv", csv_body, "application/octet-stream")})
+    assert response.status_code == 200
+    rows = response.json()["rows"]
+    assert [row["status"] for row in rows] == ["created", "created"]
+    cabin = client.get(f"/v1/properties/{rows[0]['property_id']}", headers={"Authorization": f"Bearer {tokens['guest']}"}).json()
+    assert cabin["picture_urls"] == ["https://example.com/c1.jpg", "https://example.com/c2.jpg"]
+    assert (cabin["latitude"], cabin["longitude"]) == (39.09, -120.03)
+    shed = client.get(f"/v1/properties/{rows[1]['property_id']}", headers={"Authorization": f"Bearer {tokens['guest']}"}).json()
+    assert shed["picture_urls"] == [] and shed["latitude"] is None
+
+
+def test_import_changes_the_catalog_etag_and_search(tokens):
+    guest = {"Authorization": f"Bearer {tokens['guest']}"}
+    etag = client.get("/v1/properties", headers=guest).headers["etag"]
+    assert _import(tokens["host"], json=[_listing(0, title="Seaside Bungalow")]).json()["created"] == 1
+
+    assert client.get("/v1/properties", headers={**guest, "If-None-Match": etag}).status_code == 200
+    found = client.get("/v1/properties/search", params={"q": "bungalow"}, headers=guest).json()
+    assert [item["title"] for item in found["items"]] == ["Seaside Bungalow"]
+
+
+def test_only_hosts_can_import_and_bad_uploads_are_rejected(tokens, monkeypatch):
+    assert _import(tokens["guest"], json=[_listing(0)]).status_code == 403
+    assert _import(tokens["host"], json={"title": "not a list"}).status_code == 400
+    assert client.post(
+        "/v1/properties/bulk",
+        headers={"Authorization": f"Bearer {tokens['host']}", "Content-Type": "application/xml"},
+        content="<properties/>"
+    ).status_code == 415
+
+    monkeypatch.setattr(settings, "bulk_import_max_rows", 2)
+    assert _import(tokens["host"], json=[_listing(n) for n in range(3)]).status_code == 413
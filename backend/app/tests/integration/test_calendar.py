@@ -0,0 +1,96 @@
+import base64
+from fastapi.testclient import TestClient
+from app.main import app
+from app.tests.utils.db import open_test_session
+import pytest
+from app.tests.utils.factories import create_test_user
+from app.tests.utils.auth import get_token
+from app.tests.utils.queries import count_queries
+
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def setup():
+    with open_test_session() as session:
+        create_test_user(session, "host@example.com", "strongpassword", role="host")
+        create_test_user(session, "guest@example.com", "strongpassword", role="guest")
+    host = {"Authorization": f"Bearer {get_token('host@example.com', 'strongpassword')}"}
+    guest = {"Authorization": f"Bearer {get_token('guest@example.com', 'strongpassword')}"}
+    response = client.post("/v1/properties", headers=host, json={
+        "title": "Cabin", "address": "1 Lake Road", "city": "Tahoe", "state": "CA", "picture_urls": []
+    })
+    assert response.status_code == 200
+    return {"host": host, "guest": guest, "property_id": response.json()["property_id"]}
+
+
+def _book(setup, date_in: str, date_out: str):
+    response = client.post("/v1/bookings", headers=setup["guest"], json={
+        "property_id": setup["property_id"], "date_in": date_in, "date_out": date_out
+    })
+    assert response.status_code == 200
+
+
+def _calendar(setup, start: str, end: str):
+    return client.get(
+        f"/v1/properties/{setup['property_id']}/calendar", params={"from": start, "to": end}, headers=setup["guest"]
+    )
+
+
+def _booked_offsets(bitmap: str, days: int):
+    bits = int.from_bytes(base64.b64decode(bitmap), "little")
+    return [offset for offset in range(days) if bits >> offset & 1]
+
+
+def test_calendar_spans_months(setup):
+    _book(setup, "2025-01-30", "2025-02-02") # nights of Jan 30, Jan 31, Feb 1
+    _book(setup, "2025-02-10", "2025-02-11")
+    _book(setup, "2025-03-20", "2025-03-25") # outside the window
+
+    response = _calendar(setup, "2025-01-28", "2025-03-01")
+    assert response.status_code == 200
+    calendar = response.json()
+    assert (calendar["start"], calendar["end"]) == ("2025-01-28", "2025-03-01")
+    assert calendar["runs"] == [{"start": "2025-01-30", "nights": 3}, {"start": "2025-02-10", "nights": 1}]
+    assert _booked_offsets(calendar["bitmap"], 32) == [2, 3, 4, 13]
+
+    # a window starting mid-run only shows the rest of it
+    assert _calendar(setup, "2025-01-31", "2025-02-05").json()["runs"] == [{"start": "2025-01-31", "nights": 2}]
+
+
+def test_calendar_is_cached_per_month_and_invalidated_by_bookings(setup):
+    assert _calendar(setup, "2025-06-01", "2025-07-01").json()["runs"] == []
+    with count_queries() as cached:
+        assert _calendar(setup, "2025-06-10", "2025-06-20").json()["runs"] == []
+    assert cached.count == 0
+
+    _book(setup, "2025-06-14", "2025-06-16")
+    assert _calendar(setup, "2025-06-10", "2025-06-20").json()["runs"] == [{"start": "2025-06-14", "nights": 2}]
+
+
+def test_calendar_of_a_deleted_property(setup):
+    assert _calendar(setup, "2025-06-01", "2025-06-10").status_code == 200
+    assert client.delete(f"/v1/properties/{setup['property_id']}", headers=setup["host"]).status_code == 200
+    assert _calendar(setup, "2025-06-01", "2025-06-10").status_code == 404
+
+
+@pytest.mark.parametrize("start, end", [("2025-06-10", "2025-06-10"), ("2025-01-01", "2026-01-03")])
+def test_calendar_window_is_bounded(setup, start, end):
+    assert _calendar(setup, start, end).status_code == 400
+
+
+def test_calendar_at_the_end_of_time(setup):
+    _book(setup, "9999-12-29", "9999-12-31")
+
+    response = _calendar(setup, "9999-12-01", "9999-12-31")
+    assert response.status_code == 200
+    assert response.json()["runs"] == [{"start": "9999-12-29", "nights": 2}]
+
+    # the default window stops at the last representable day
+    response = client.get(
+        f"/v1/properties/{setup['property_id']}/calendar", params={"from": "9999-11-01"}, headers=setup["guest"]
+    )
+    assert response.status_code == 200
+    assert response.json()["end"] == "9999-12-31"
+    assert response.json()["runs"] == [{"start": "9999-12-29", "nights": 2}]
@@ -0,0 +1,110 @@
+import asyncio
+from fastapi.testclient import TestClient
+from app.main import app
+from app.tests.utils.db import open_test_session
+from app.core.property_cache import property_cache
+from app.routes import property as property_routes
+from app.tests.utils.factories import create_test_user
+from app.tests.utils.auth import get_token
+from app.tests.utils.queries import count_queries
+import pytest
+
+client = TestClient(app)
+
+@pytest.fixture
+def tokens():
+    with open_test_session() as session:
+        create_test_user(session, "etaghost@example.com", "password123", role="host")
+        create_test_user(session, "etagguest@example.com", "password123", role="guest")
+    return {
+        "host": get_token("etaghost@example.com", "password123"),
+        "guest": get_token("etagguest@example.com", "password123")
+    }
+
+def auth(token, **headers):
+    return {"Authorization": f"Bearer {token}", **headers}
+
+def create_property(token, title):
+    response = client.post(
+        "/v1/properties",
+        headers=auth(token),
+        json={
+            "title": title,
+            "address": f"1 {title} Street",
+            "city": "Etag City",
+            "state": "EC",
+            "picture_urls": ["https://example.com/etag.jpg"]
+        }
+    )
+    assert response.status_code == 200
+    return response.json()["property_id"]
+
+def test_details_revalidate_with_304(tokens, monkeypatch):
+    property_id = create_property(tokens["host"], "Cached Flat")
+    first = client.get(f"/v1/properties/{property_id}", headers=auth(tokens["guest"]))
+    etag = first.headers["ETag"]
+
+    # a 304 must not build (or serialize) the PropertyRead
+    monkeypatch.setattr(property_routes, "_to_property_read", lambda *args: pytest.fail("payload was built"))
+    with count_queries() as cached_queries:
+        second = client.get(f"/v1/properties/{property_id}", headers=auth(tokens["guest"], **{"If-None-Match": etag}))
+    asyncio.run(property_cache.clear())
+    with count_queries() as uncached_queries:
+        third = client.get(f"/v1/properties/{property_id}", headers=auth(tokens["guest"], **{"If-None-Match": etag}))
+
+    assert first.status_code == 200
+    assert second.status_code == third.status_code == 304
+    assert second.content == third.content == b""
+    assert second.headers["ETag"] == third.headers["ETag"] == etag
+    assert cached_queries.count == 0 # version taken from the cached card
+    assert uncached_queries.count == 1 # version looked up alone
+
+def test_stale_etag_gets_the_full_payload(tokens):
+    property_id = create_property(tokens["host"], "Changed Flat")
+
+    response = client.get(f"/v1/properties/{property_id}", headers=auth(tokens["guest"], **{"If-None-Match": '"property-0-0"'}))
+
+    assert response.status_code == 200
+    assert response.json()["title"] == "Changed Flat"
+
+def test_catalog_etag_changes_on_create_and_delete(tokens):
+    create_property(tokens["host"], "First Flat")
+    etag = client.get("/v1/properties", headers=auth(tokens["guest"])).headers["ETag"]
+
+    unchanged = client.get("/v1/properties", headers=auth(tokens["guest"], **{"If-None-Match": etag}))
+    assert unchanged.status_code == 304
+
+    second_id = create_property(tokens["host"], "Second Flat")
+    after_create = client.get("/v1/properties", headers=auth(tokens["guest"], **{"If-None-Match": etag}))
+    assert after_create.status_code == 200
+    assert len(after_create.json()["items"]) == 2
+
+    client.delete(f"/v1/properties/{second_id}", headers=auth(tokens["host"]))
+    after_delete = client.get("/v1/properties", headers=auth(tokens["guest"], **{"If-None-Match": after_create.headers["ETag"]}))
+    assert after_delete.status_code == 200
+    assert len(after_delete.json()["items"]) == 1
+    assert len({etag, after_create.headers["ETag"], after_delete.headers["ETag"]}) == 3
+
+def test_reused_property_id_gets_a_new_etag(tokens):
+    # SQLite hands out the id of a deleted last row again
+    property_id = create_property(tokens["host"], "Old Flat")
+    etag = client.get(f"/v1/properties/{property_id}", headers=auth(tokens["guest"])).headers["ETag"]
+    client.delete(f"/v1/properties/{property_id}", headers=auth(tokens["host"]))
+    new_id = create_property(tokens["host"], "New Flat")
+
+    response = client.get(f"/v1/properties/{new_id}", headers=auth(tokens["guest"], **{"If-None-Match": etag}))
+
+    assert response.status_code == 200
+    assert response.json()["title"] == "New Flat"
+
+def test_availability_search_is_not_conditional(tokens):
+    create_property(tokens["host"], "Bookable Flat")
+
+    response = client.get(
+        "/v1/properties",
+        headers=auth(tokens["guest"], **{"If-None-Match": "*"}),
+        params={"date_in": "2025-06-01", "date_out": "2025-06-03"}
+    )
+
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
@@ -0,0 +1,85 @@
+import json
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core.config import settings
+from app.tests.utils.db import open_test_session
+from app.tests.utils.factories import create_test_user
+from app.tests.utils.auth import get_token
+import pytest
+
+client = TestClient(app)
+
+@pytest.fixture
+def tokens():
+    with open_test_session() as session:
+        create_test_user(session, "exporthost@example.com", "password123", role="host")
+        create_test_user(session, "otherexporthost@example.com", "password123", role="host")
+        create_test_user(session, "exportguest@example.com", "password123", role="guest")
+    return {
+        "host": get_token("exporthost@example.com", "password123"),
+        "other_host": get_token("otherexporthost@example.com", "password123"),
+        "guest": get_token("exportguest@example.com", "password123")
+    }
+
+def auth(token):
+    return {"Authorization": f"Bearer {token}"}
+
+def create_property(token, i, pictures):
+    response = client.post(
+        "/v1/properties",
+        headers=auth(token),
+        json={
+            "title": f"Export Flat {i}",
+            "address": f"{i} Export Street",
+            "city": "Export City",
+            "state": "EX",
+            "picture_urls": [f"https://example.com/{i}/{n}.jpg" for n in range(pictures)]
+        }
+    )
+    return response.json()["property_id"]
+
+def book(token, property_id, day):
+    response = client.post(
+        "/v1/bookings",
+        headers=auth(token),
+        json={"property_id": property_id, "date_in": f"2025-08-{day:02d}", "date_out": f"2025-08-{day + 1:02d}"}
+    )
+    assert response.status_code == 200
+    return response.json()["booking_id"]
+
+def lines(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+def test_export_streams_every_property(tokens, monkeypatch):
+    # tiny batches, so properties and their pictures straddle batch boundaries
+    monkeypatch.setattr(settings, "export_batch_size", 2)
+    for i, pictures in enumerate([3, 0, 1, 5, 2]):
+        create_property(tokens["host"], i, pictures)
+
+    response = client.get("/v1/properties/export", headers=auth(tokens["guest"]))
+    browse = client.get("/v1/properties", headers=auth(tokens["guest"])).json()["items"]
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert lines(response) == browse
+
+def test_host_exports_only_their_bookings(tokens):
+    mine = create_property(tokens["host"], 1, 1)
+    theirs = create_property(tokens["other_host"], 2, 1)
+    expected = [book(tokens["guest"], mine, 1), book(tokens["guest"], mine, 5)]
+    book(tokens["guest"], theirs, 1)
+
+    response = client.get("/v1/bookings/export", headers=auth(tokens["host"]))
+
+    exported = lines(response)
+    assert [booking["booking_id"] for booking in exported] == expected
+    assert exported[0] == {
+        "booking_id": expected[0], "guest_id": exported[0]["guest_id"], "property_id": mine,
+        "date_in": "2025-08-01", "date_out": "2025-08-02"
+    }
+
+def test_guests_cannot_export_bookings(tokens):
+    response = client.get("/v1/bookings/export", headers=auth(tokens["guest"]))
+
+    assert response.status_code == 403
+    assert response.json()["detail"] == "Only hosts can export their bookings."
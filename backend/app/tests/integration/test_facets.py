@@ -0,0 +1,107 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.tests.utils.db import open_test_session
+from app.core.facets import rebuild_facets
+from sqlalchemy import create_engine, text
+from app.core.migrations import run_migrations
+import os
+import subprocess
+import sys
+import pytest
+from app.tests.utils.factories import create_test_user
+from app.tests.utils.auth import get_token
+
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def tokens():
+    with open_test_session() as session:
+        create_test_user(session, "host@example.com", "strongpassword", role="host")
+        create_test_user(session, "guest@example.com", "strongpassword", role="guest")
+    return {
+        "host": {"Authorization": f"Bearer {get_token('host@example.com', 'strongpassword')}"},
+        "guest": {"Authorization": f"Bearer {get_token('guest@example.com', 'strongpassword')}"},
+    }
+
+
+def _create(tokens, n: int, city: str, state: str) -> int:
+    response = client.post("/v1/properties", headers=tokens["host"], json={
+        "title": f"Listing {n}", "address": f"{n} Main Street", "city": city, "state": state, "picture_urls": []
+    })
+    assert response.status_code == 200
+    return response.json()["property_id"]
+
+
+def _facets(tokens):
+    response = client.get("/v1/properties/facets", headers=tokens["guest"])
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_facets_follow_creates_imports_and_deletes(tokens):
+    assert _facets(tokens) == {"total": 0, "states": []}
+
+    porto = _create(tokens, 1, "Porto", "PT")
+    _create(tokens, 2, "Lisbon", "PT")
+    _create(tokens, 3, "Lisbon", "PT")
+    response = client.post("/v1/properties/bulk", headers=tokens["host"], json=[
+        {"title": f"Imported {n}", "address": "1 Rua", "city": "Madrid", "state": "ES", "picture_urls": []} for n in range(2)
+    ] + [{"title": "Listing 1", "address": "1 Main Street", "city": "Porto", "state": "PT", "picture_urls": []}]) # duplicate
+    assert response.json()["created"] == 2
+
+    assert _facets(tokens) == {"total": 5, "states": [
+        {"state": "PT", "count": 3, "cities": [{"city": "Lisbon", "count": 2}, {"city": "Porto", "count": 1}]},
+        {"state": "ES", "count": 2, "cities": [{"city": "Madrid", "count": 2}]},
+    ]}
+
+    # the last property of a city takes its facet with it
+    assert client.delete(f"/v1/properties/{porto}", headers=tokens["host"]).status_code == 200
+    assert _facets(tokens)["states"] == [ # ties by name
+        {"state": "ES", "count": 2, "cities": [{"city": "Madrid", "count": 2}]},
+        {"state": "PT", "count": 2, "cities": [{"city": "Lisbon", "count": 2}]},
+    ]
+
+
+def test_facets_revalidate_with_the_catalog(tokens):
+    _create(tokens, 1, "Porto", "PT")
+    etag = client.get("/v1/properties/facets", headers=tokens["guest"]).headers["etag"]
+    assert client.get("/v1/properties/facets", headers={**tokens["guest"], "If-None-Match": etag}).status_code == 304
+
+    _create(tokens, 2, "Porto", "PT")
+    response = client.get("/v1/properties/facets", headers={**tokens["guest"], "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["total"] == 2
+
+
+def test_rebuild_recounts_rows_written_behind_the_routes_back(tokens):
+    property_id = _create(tokens, 1, "Porto", "PT")
+    with open_test_session() as session:
+        conn = session.connection()
+        conn.execute(text("UPDATE properties SET city = 'Braga' WHERE property_id = :id"), {"id": property_id})
+        assert rebuild_facets(conn) == 1
+        session.commit()
+
+    assert _facets(tokens)["states"] == [{"state": "PT", "count": 1, "cities": [{"city": "Braga", "count": 1}]}]
+
+
+def test_rebuild_command_runs_as_a_script(tmp_path):
+    # a fresh interpreter: the models must load without the app having imported them first
+    database_url = f"sqlite:///{tmp_path / 'cli.sqlite3'}"
+    engine = create_engine(database_url)
+    run_migrations(engine)
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO users (name, email, hashed_password, role) VALUES ('Host', 'cli@example.com', 'x', 'host')"))
+        conn.execute(text("INSERT INTO properties (host_id, title, address, city, state) VALUES (1, 't', 'a', 'Porto', 'PT')"))
+        conn.execute(text("DELETE FROM property_facets"))
+    engine.dispose()
+
+    result = subprocess.run(
+        [sys.executable, "-m", "app.core.facets"],
+        env={**os.environ, "ENVIRONMENT": "test", "DATABASE_URL": database_url},
+        capture_output=True, text=True, timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "1 locations" in result.stdout
@@ -0,0 +1,77 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core.config import settings
+from app.tests.utils.db import open_test_session
+from app.tests.utils.factories import create_test_user
+from app.tests.utils.auth import get_token
+import pytest
+
+client = TestClient(app)
+
+# Contract: FAST_JSON_RESPONSES only changes how the bytes are produced, never the bytes
+
+@pytest.fixture
+def catalog():
+    with open_test_session() as session:
+        create_test_user(session, "fasthost@example.com", "password123", role="host")
+        create_test_user(session, "fastguest@example.com", "password123", role="guest")
+    tokens = {
+        "host": get_token("fasthost@example.com", "password123"),
+        "guest": get_token("fastguest@example.com", "password123")
+    }
+    properties = [
+        # non-ASCII text and several pictures
+        {"title": "Casa São João “ático”", "city": "Lisboa", "latitude": 38.7110, "longitude": -9.1366,
+         "picture_urls": ["https://example.com/1.jpg", "https://example.com/2.jpg", "https://example.com/3.jpg"]},
+        # coordinates Python writes with an exponent (1e-05), unlike orjson
+        {"title": "Null Island Hut", "city": "Atlantic", "latitude": 0.00001, "longitude": -0.00002, "picture_urls": []},
+        {"title": "Casa Unmapped", "city": "Lisboa", "picture_urls": ["https://example.com/4.jpg"]},
+    ]
+    property_ids = []
+    for body in properties:
+        response = client.post(
+            "/v1/properties",
+            headers={"Authorization": f"Bearer {tokens['host']}"},
+            json={"address": f"1 {body['title']} Street", "state": "LX", **body}
+        )
+        assert response.status_code == 200
+        property_ids.append(response.json()["property_id"])
+    response = client.post(
+        "/v1/bookings",
+        headers={"Authorization": f"Bearer {tokens['guest']}"},
+        json={"property_id": property_ids[0], "date_in": "2025-07-01", "date_out": "2025-07-03"}
+    )
+    assert response.status_code == 200
+    return tokens, property_ids
+
+def requests_for(property_ids):
+    first = property_ids[0]
+    return [
+        ("guest", "/v1/properties", {}),
+        ("guest", "/v1/properties", {"limit": 1, "max_pictures": 1}),
+        ("guest", "/v1/properties", {"date_in": "2025-07-01", "date_out": "2025-07-02"}),
+        ("host", "/v1/properties/mine", {}),
+        ("guest", "/v1/properties/search", {"q": "casa"}),
+        ("guest", "/v1/properties/nearby", {"lat": 38.72, "lng": -9.14, "radius_km": 5}),
+        ("guest", "/v1/properties/nearby", {"lat": 0, "lng": 0, "radius_km": 1}),
+        ("guest", f"/v1/properties/{first}", {}),
+        ("guest", f"/v1/properties/{property_ids[1]}", {}),
+        ("guest", f"/v1/properties/{first}/bookings", {}),
+        ("guest", "/v1/bookings/my-bookings", {}),
+        ("guest", "/v1/bookings/my-bookings", {"max_pictures": 2}),
+    ]
+
+def test_fast_responses_are_byte_identical(catalog, monkeypatch):
+    tokens, property_ids = catalog
+
+    for role, path, params in requests_for(property_ids):
+        headers = {"Authorization": f"Bearer {tokens[role]}"}
+        monkeypatch.setattr(settings, "fast_json_responses", False)
+        default = client.get(path, headers=headers, params=params)
+        monkeypatch.setattr(settings, "fast_json_responses", True)
+        fast = client.get(path, headers=headers, params=params)
+
+        assert default.status_code == fast.status_code == 200, path
+        assert fast.content == default.content, path
+        for header in ("content-type", "content-length", "etag", "cache-control"):
+            assert fast.headers.get(header) == default.headers.get(header), (path, header)
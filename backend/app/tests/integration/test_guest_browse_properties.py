@@ -2,7 +2,7 @@ from fastapi.testclient import TestClient
 from app.main import app
 from app.tests.utils.factories import create_test_user
 from app.tests.utils.auth import get_token
-from app.core.db import get_session
+from app.tests.utils.db import open_test_session
 from sqlmodel import Session
 import pytest
 
@@ -10,7 +10,7 @@ client = TestClient(app)
 
 @pytest.fixture
 def setup_users():
-    with next(get_session()) as session:
+    with open_test_session() as session:
         host1 = create_test_user(session, "host1@example.com", "password123", role="host")
         host2 = create_test_user(session, "host2@example.com", "password123", role="host")
         guest = create_test_user(session, "guest@example.com", "password123", role="guest")
@@ -64,7 +64,7 @@ def test_guest_can_browse_properties(setup_users):
     )
     assert response.status_code == 200
 
-    properties = response.json()
+    properties = response.json()["items"]
 
     # Check that both properties are returned
     assert len(properties) == 2
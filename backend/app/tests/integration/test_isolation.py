@@ -0,0 +1,34 @@
+from fastapi.testclient import TestClient
+from sqlmodel import func, select
+from app.main import app
+from app.core.config import settings
+from app.core.db import get_session
+from app.models.user import User
+from app.tests.utils.db import open_test_session
+import pytest
+
+client = TestClient(app)
+
+def count_users(session):
+    return session.exec(select(func.count()).select_from(User)).one()
+
+# runs twice: whichever instance comes second checks that the first one's signup didn't outlive it
+@pytest.mark.parametrize("run", [1, 2])
+def test_committing_routes_leave_no_rows_for_the_next_test(run):
+    with open_test_session() as session:
+        assert count_users(session) == 0
+
+    response = client.post("/v1/users/signup", json={
+        "name": "Isolated Guest",
+        "email": "isolated@example.com",
+        "password": "securepassword123",
+        "role": "guest"
+    })
+
+    assert response.status_code == 200
+    with open_test_session() as session:
+        assert count_users(session) == 1
+    if not settings.database_async:
+        # the route's commit only released a SAVEPOINT of the test's transaction: nothing reached the database
+        with next(get_session()) as outside:
+            assert count_users(outside) == 0
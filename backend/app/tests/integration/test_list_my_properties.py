@@ -2,7 +2,7 @@ from fastapi.testclient import TestClient
 from app.main import app
 from app.tests.utils.factories import create_test_user
 from app.core.security import hash_password
-from app.core.db import get_session
+from app.tests.utils.db import open_test_session
 from sqlmodel import Session
 import pytest
 import json
@@ -13,7 +13,7 @@ client = TestClient(app)
 
 @pytest.fixture
 def setup_hosts():
-    with next(get_session()) as session:
+    with open_test_session() as session:
         host1 = create_test_user(session, "host1@example.com", "strongpassword", role="host")
         host2 = create_test_user(session, "host2@example.com", "strongpassword", role="host")
     return {
@@ -66,7 +66,7 @@ def test_list_my_properties(setup_hosts):
     )
 
     assert response.status_code == 200
-    properties = response.json()
+    properties = response.json()["items"]
 
     # Assert only host1 properties are returned
     assert len(properties) == 2
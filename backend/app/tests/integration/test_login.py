@@ -2,14 +2,14 @@ from fastapi.testclient import TestClient
 from app.main import app
 from app.core.security import hash_password
 from app.models.user import User
-from app.core.db import get_session
+from app.tests.utils.db import open_test_session
 from sqlmodel import Session
 from app.tests.utils.factories import create_test_user
 
 client = TestClient(app)
 
 def test_login_success():
-    with next(get_session()) as session:
+    with open_test_session() as session:
         create_test_user(session, "loginsuccess@example.com", "strongpassword123", "guest")
 
     response = client.post(
@@ -26,7 +26,7 @@ def test_login_success():
     assert data["token_type"] == "bearer"
 
 def test_login_wrong_password():
-    with next(get_session()) as session:
+    with open_test_session() as session:
         create_test_user(session, "wrongpassword@example.com", "rightpassword123", "guest")
 
     response = client.post(
@@ -0,0 +1,52 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core.config import settings
+from app.core.metrics import CONTENT_TYPE, UNMATCHED_ROUTE, route_metrics
+import pytest
+
+client = TestClient(app)
+
+@pytest.fixture(autouse=True)
+def clear_metrics():
+    route_metrics.clear()
+
+def test_metrics_label_requests_with_the_route_template():
+    client.get("/v1/properties/123456")
+    client.get("/v1/properties/654321")
+    client.get("/ping")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == CONTENT_TYPE
+    labels = 'method="GET",route="/v1/properties/{property_id}"'
+    assert f'http_requests_total{{{labels},status="4xx"}} 2' in response.text
+    assert f"http_request_duration_seconds_count{{{labels}}} 2" in response.text
+    assert 'http_requests_total{method="GET",route="/ping",status="2xx"} 1' in response.text
+    assert "123456" not in response.text
+
+def test_metrics_group_unmatched_paths():
+    client.get("/no/such/path/1")
+    client.get("/no/such/path/2")
+
+    text = client.get("/metrics").text
+
+    assert f'http_requests_total{{method="GET",route="{UNMATCHED_ROUTE}",status="4xx"}} 2' in text
+    assert "/no/such/path" not in text
+
+INTERNAL_PATHS = ("/metrics", "/internal/pool", "/internal/cache", "/internal/startup")
+
+@pytest.mark.parametrize("path", INTERNAL_PATHS)
+def test_internal_endpoints_require_the_internal_token(path, monkeypatch):
+    monkeypatch.setattr(settings, "internal_token", "s3cret")
+
+    assert client.get(path).status_code == 401
+    assert client.get(path, headers={"Authorization": "Bearer wrong"}).status_code == 401
+    assert client.get(path, headers={"Authorization": "Bearer s3cret"}).status_code == 200
+
+@pytest.mark.parametrize("path", INTERNAL_PATHS)
+def test_internal_endpoints_are_hidden_in_production_without_a_token(path, monkeypatch):
+    monkeypatch.setattr(settings, "environment", "production")
+    monkeypatch.setattr(settings, "internal_token", None)
+
+    assert client.get(path).status_code == 404
@@ -0,0 +1,105 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core.pagination import encode_cursor
+from app.tests.utils.db import open_test_session
+from app.tests.utils.factories import create_test_user
+from app.tests.utils.auth import get_token
+import pytest
+
+client = TestClient(app)
+
+LISBON = {"lat": 38.7223, "lng": -9.1393}
+
+@pytest.fixture
+def tokens():
+    with open_test_session() as session:
+        create_test_user(session, "geohost@example.com", "password123", role="host")
+        create_test_user(session, "geoguest@example.com", "password123", role="guest")
+    return {
+        "host": get_token("geohost@example.com", "password123"),
+        "guest": get_token("geoguest@example.com", "password123")
+    }
+
+def create_property(token, title, latitude=None, longitude=None):
+    body = {
+        "title": title,
+        "address": f"1 {title} Street",
+        "city": "Somewhere",
+        "state": "SW",
+        "picture_urls": ["https://example.com/geo.jpg"]
+    }
+    if latitude is not None:
+        body.update({"latitude": latitude, "longitude": longitude})
+    return client.post("/v1/properties", headers={"Authorization": f"Bearer {token}"}, json=body)
+
+def nearby(token, **params):
+    return client.get("/v1/properties/nearby", headers={"Authorization": f"Bearer {token}"}, params=params)
+
+@pytest.fixture
+def places(tokens):
+    create_property(tokens["host"], "Baixa Flat", 38.7110, -9.1366) # ~1.3 km from the center
+    create_property(tokens["host"], "Belem House", 38.6970, -9.2060) # ~6.4 km
+    create_property(tokens["host"], "Porto Loft", 41.1579, -8.6291) # ~274 km
+    create_property(tokens["host"], "Unmapped Room") # no coordinates
+    return tokens
+
+def test_nearby_returns_properties_sorted_by_distance(places):
+    response = nearby(places["guest"], radius_km=10, **LISBON)
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item["title"] for item in items] == ["Baixa Flat", "Belem House"]
+    assert items[0]["distance_km"] < items[1]["distance_km"] < 10
+    assert items[0]["latitude"] == 38.7110
+
+def test_radius_excludes_farther_properties(places):
+    response = nearby(places["guest"], radius_km=3, **LISBON)
+
+    assert [item["title"] for item in response.json()["items"]] == ["Baixa Flat"]
+
+def test_nearby_wraps_around_the_antimeridian(tokens):
+    create_property(tokens["host"], "Taveuni Hut", -16.8, 179.99) # ~2 km across the date line
+    create_property(tokens["host"], "Far Hut", -16.8, 179.5) # ~52 km
+
+    for lng in (-179.99, 179.99):
+        response = nearby(tokens["guest"], lat=-16.8, lng=lng, radius_km=10)
+        items = response.json()["items"]
+        assert [item["title"] for item in items] == ["Taveuni Hut"]
+        assert items[0]["distance_km"] < 3
+
+def test_nearby_is_paginated(places):
+    first = nearby(places["guest"], radius_km=10, limit=1, **LISBON).json()
+    second = nearby(places["guest"], radius_km=10, limit=1, cursor=first["next_cursor"], **LISBON).json()
+
+    assert [item["title"] for item in first["items"]] == ["Baixa Flat"]
+    assert [item["title"] for item in second["items"]] == ["Belem House"]
+    assert second["next_cursor"] is None
+
+@pytest.mark.parametrize("distance", [float("nan"), float("inf"), float("-inf")])
+def test_nearby_rejects_a_non_finite_cursor(places, distance):
+    response = nearby(places["guest"], radius_km=10, cursor=encode_cursor(distance, 1), **LISBON)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor."
+
+def test_location_needs_both_coordinates(tokens):
+    response = client.post(
+        "/v1/properties",
+        headers={"Authorization": f"Bearer {tokens['host']}"},
+        json={
+            "title": "Half Located",
+            "address": "1 Half Street",
+            "city": "Somewhere",
+            "state": "SW",
+            "picture_urls": [],
+            "latitude": 38.7
+        }
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Both latitude and longitude are required to set a location."
+
+def test_radius_is_capped(tokens):
+    response = nearby(tokens["guest"], radius_km=10000, **LISBON)
+
+    assert response.status_code == 422
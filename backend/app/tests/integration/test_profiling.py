@@ -0,0 +1,62 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core.config import settings
+from app.tests.utils.factories import create_test_user
+from app.tests.utils.auth import get_token
+from app.tests.utils.db import open_test_session
+import pytest
+
+client = TestClient(app)
+
+@pytest.fixture
+def token():
+    with open_test_session() as session:
+        create_test_user(session, "profileguest@example.com", "password123", role="guest")
+    return get_token("profileguest@example.com", "password123")
+
+def test_flagged_requests_are_not_profiled_when_profiling_is_off(monkeypatch):
+    monkeypatch.setattr(settings, "request_profiling", False)
+
+    response = client.get("/ping", headers={"X-Profile": "1"})
+
+    assert response.json() == {"message": "pong"}
+    assert "x-profiled-status" not in response.headers
+
+def test_unflagged_requests_are_not_profiled(monkeypatch):
+    monkeypatch.setattr(settings, "request_profiling", True)
+
+    response = client.get("/ping")
+
+    assert response.json() == {"message": "pong"}
+    assert "x-profiled-status" not in response.headers
+
+def test_query_flag_returns_the_profile_instead_of_the_response(token, monkeypatch):
+    monkeypatch.setattr(settings, "request_profiling", True)
+
+    response = client.get("/v1/properties?profile=1", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert response.headers["x-profiled-status"] == "200"
+    assert response.headers["x-profiled-content-type"] == "application/json"
+    assert response.text.startswith("GET /v1/properties -> 200 in ")
+    assert "cumulative" in response.text
+    assert "get_current_user" in response.text
+
+def test_header_flag_keeps_the_original_status(monkeypatch):
+    monkeypatch.setattr(settings, "request_profiling", True)
+
+    response = client.get("/v1/properties", headers={"X-Profile": "tottime"})
+
+    assert response.headers["x-profiled-status"] == "401"
+    assert "internal time" in response.text
+
+def test_profiles_are_written_to_the_profile_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "request_profiling", True)
+    monkeypatch.setattr(settings, "request_profiling_dir", str(tmp_path))
+
+    response = client.get("/ping", headers={"X-Profile": "1"})
+
+    files = list(tmp_path.glob("*.prof"))
+    assert len(files) == 1
+    assert response.headers["x-profile-file"] == str(files[0])
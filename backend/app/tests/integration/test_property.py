@@ -2,7 +2,7 @@ from fastapi.testclient import TestClient
 from sqlmodel import Session
 from app.main import app
 from app.models.user import User
-from app.core.db import get_session
+from app.tests.utils.db import open_test_session
 from app.core.security import hash_password
 from app.core.config import settings
 import pytest
@@ -16,7 +16,7 @@ client = TestClient(app)
 @pytest.fixture
 def setup_users():
     # Setup: create one host and one guest
-    with next(get_session()) as session:
+    with open_test_session() as session:
         host = create_test_user(session, "host@example.com", "strongpassword", role="host")
         guest = create_test_user(session, "guest@example.com", "strongpassword", role="guest")
     return {
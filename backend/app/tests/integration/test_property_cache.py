@@ -0,0 +1,92 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.tests.utils.db import open_test_session
+from app.core.property_cache import ExternalPropertyCache, NullPropertyCache
+from app.routes import property as property_routes
+from app.tests.utils.factories import create_test_user
+from app.tests.utils.auth import get_token
+from app.tests.utils.kv_store import LocalKeyValueStore
+from app.tests.utils.queries import count_queries
+import pytest
+
+client = TestClient(app)
+
+@pytest.fixture
+def tokens():
+    with open_test_session() as session:
+        create_test_user(session, "cachehost@example.com", "password123", role="host")
+        create_test_user(session, "cacheguest@example.com", "password123", role="guest")
+    return {
+        "host": get_token("cachehost@example.com", "password123"),
+        "guest": get_token("cacheguest@example.com", "password123")
+    }
+
+@pytest.fixture(params=["memory", "external"])
+def cache(request, monkeypatch):
+    if request.param == "external":
+        monkeypatch.setattr(property_routes, "property_cache", ExternalPropertyCache(LocalKeyValueStore(), ttl_seconds=60))
+    return property_routes.property_cache
+
+def auth(token):
+    return {"Authorization": f"Bearer {token}"}
+
+def create_property(token, title):
+    response = client.post(
+        "/v1/properties",
+        headers=auth(token),
+        json={
+            "title": title,
+            "address": f"1 {title} Street",
+            "city": "Cache City",
+            "state": "CC",
+            "picture_urls": ["https://example.com/cache.jpg"]
+        }
+    )
+    assert response.status_code == 200
+    return response.json()["property_id"]
+
+def test_details_are_served_from_the_cache(tokens, cache):
+    property_id = create_property(tokens["host"], "Cached Flat")
+    first = client.get(f"/v1/properties/{property_id}", headers=auth(tokens["guest"]))
+
+    with count_queries() as queries:
+        second = client.get(f"/v1/properties/{property_id}", headers=auth(tokens["guest"]))
+
+    assert second.json() == first.json()
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert queries.count == 0
+
+def test_listing_pages_only_load_missing_cards(tokens, cache):
+    for i in range(3):
+        create_property(tokens["host"], f"Listed Flat {i}")
+    first = client.get("/v1/properties", headers=auth(tokens["guest"])).json()
+    hits = cache.stats.hits
+
+    with count_queries() as queries:
+        second = client.get("/v1/properties/mine", headers=auth(tokens["host"])).json()
+
+    assert second["items"] == first["items"]
+    assert cache.stats.hits == hits + 3
+    assert queries.count == 1 # the ids of the page
+
+def test_delete_invalidates_the_card(tokens, cache):
+    property_id = create_property(tokens["host"], "Doomed Flat")
+    client.get(f"/v1/properties/{property_id}", headers=auth(tokens["guest"]))
+
+    client.delete(f"/v1/properties/{property_id}", headers=auth(tokens["host"]))
+
+    assert client.get(f"/v1/properties/{property_id}", headers=auth(tokens["guest"])).status_code == 404
+    assert client.get("/v1/properties", headers=auth(tokens["guest"])).json()["items"] == []
+
+def test_without_a_cache_every_request_loads_its_card(tokens, monkeypatch):
+    monkeypatch.setattr(property_routes, "property_cache", NullPropertyCache()) # PROPERTY_CACHE_BACKEND=none
+    property_id = create_property(tokens["host"], "Uncached Flat")
+    first = client.get(f"/v1/properties/{property_id}", headers=auth(tokens["guest"]))
+
+    with count_queries() as queries:
+        second = client.get(f"/v1/properties/{property_id}", headers=auth(tokens["guest"]))
+
+    assert second.json() == first.json()
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert queries.count > 0
+    assert property_routes.property_cache.stats.snapshot()["hits"] == 0
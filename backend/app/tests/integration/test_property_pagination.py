@@ -0,0 +1,114 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.tests.utils.db import open_test_session
+from app.core.config import settings
+from app.tests.utils.factories import create_test_user
+from app.tests.utils.auth import get_token
+import pytest
+
+client = TestClient(app)
+
+@pytest.fixture
+def setup_users():
+    with open_test_session() as session:
+        host = create_test_user(session, "pagehost@example.com", "password123", role="host")
+        guest = create_test_user(session, "pageguest@example.com", "password123", role="guest")
+    return {
+        "host_email": host["email"],
+        "guest_email": guest["email"],
+        "password": "password123"
+    }
+
+def create_properties(token, count):
+    for i in range(count):
+        response = client.post(
+            "/v1/properties",
+            headers={"Authorization": f"Bearer {token}"},
+            json={
+                "title": f"Paged Property {i}",
+                "address": f"{i} Page Street",
+                "city": "Page City",
+                "state": "PC",
+                "picture_urls": ["https://example.com/page.jpg"]
+            }
+        )
+        assert response.status_code == 200
+
+def test_browse_follows_cursor_until_last_page(setup_users):
+    host_token = get_token(setup_users["host_email"], setup_users["password"])
+    create_properties(host_token, 5)
+
+    guest_token = get_token(setup_users["guest_email"], setup_users["password"])
+
+    seen_ids = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(
+            "/v1/properties",
+            headers={"Authorization": f"Bearer {guest_token}"},
+            params=params
+        )
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page["items"]) <= 2
+        seen_ids.extend(property["property_id"] for property in page["items"])
+        pages += 1
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert len(seen_ids) == 5
+    assert seen_ids == sorted(set(seen_ids)) # no duplicates, stable order
+
+def test_my_properties_are_paginated(setup_users):
+    host_token = get_token(setup_users["host_email"], setup_users["password"])
+    create_properties(host_token, 3)
+
+    response = client.get(
+        "/v1/properties/mine",
+        headers={"Authorization": f"Bearer {host_token}"},
+        params={"limit": 2}
+    )
+    assert response.status_code == 200
+    first_page = response.json()
+    assert len(first_page["items"]) == 2
+    assert first_page["next_cursor"] is not None
+
+    response = client.get(
+        "/v1/properties/mine",
+        headers={"Authorization": f"Bearer {host_token}"},
+        params={"limit": 2, "cursor": first_page["next_cursor"]}
+    )
+    assert response.status_code == 200
+    second_page = response.json()
+    assert len(second_page["items"]) == 1
+    assert second_page["next_cursor"] is None
+
+def test_page_size_is_capped_by_the_server(setup_users, monkeypatch):
+    monkeypatch.setattr(settings, "max_page_size", 2)
+    host_token = get_token(setup_users["host_email"], setup_users["password"])
+    create_properties(host_token, 3)
+
+    guest_token = get_token(setup_users["guest_email"], setup_users["password"])
+    response = client.get(
+        "/v1/properties",
+        headers={"Authorization": f"Bearer {guest_token}"},
+        params={"limit": 1000}
+    )
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 2
+
+def test_invalid_cursor_is_rejected(setup_users):
+    guest_token = get_token(setup_users["guest_email"], setup_users["password"])
+    response = client.get(
+        "/v1/properties",
+        headers={"Authorization": f"Bearer {guest_token}"},
+        params={"cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor."
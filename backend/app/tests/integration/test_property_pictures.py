@@ -0,0 +1,68 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from app.main import app
+from app.tests.utils.db import open_test_session
+from app.tests.utils.factories import create_test_user
+from app.tests.utils.auth import get_token
+import pytest
+
+client = TestClient(app)
+
+PICTURES = ["https://example.com/1.jpg", "https://example.com/2.jpg", "https://example.com/3.jpg"]
+
+@pytest.fixture
+def tokens():
+    with open_test_session() as session:
+        create_test_user(session, "picturehost@example.com", "password123", role="host")
+        create_test_user(session, "pictureguest@example.com", "password123", role="guest")
+    return {
+        "host": get_token("picturehost@example.com", "password123"),
+        "guest": get_token("pictureguest@example.com", "password123")
+    }
+
+def auth(token):
+    return {"Authorization": f"Bearer {token}"}
+
+@pytest.fixture
+def property_id(tokens):
+    response = client.post(
+        "/v1/properties",
+        headers=auth(tokens["host"]),
+        json={"title": "Gallery Flat", "address": "1 Gallery Street", "city": "Pic City", "state": "PC", "picture_urls": PICTURES}
+    )
+    assert response.json()["picture_urls"] == PICTURES
+    return response.json()["property_id"]
+
+def test_pictures_keep_their_order(tokens, property_id):
+    response = client.get(f"/v1/properties/{property_id}", headers=auth(tokens["guest"]))
+
+    assert response.json()["picture_urls"] == PICTURES
+
+def test_list_views_can_return_thumbnails_only(tokens, property_id):
+    browse = client.get("/v1/properties", headers=auth(tokens["guest"]), params={"max_pictures": 1})
+    mine = client.get("/v1/properties/mine", headers=auth(tokens["host"]), params={"max_pictures": 2})
+    details = client.get(f"/v1/properties/{property_id}", headers=auth(tokens["guest"]))
+
+    assert browse.json()["items"][0]["picture_urls"] == PICTURES[:1]
+    assert mine.json()["items"][0]["picture_urls"] == PICTURES[:2]
+    assert details.json()["picture_urls"] == PICTURES # the cached card was not trimmed
+
+def test_my_bookings_can_return_thumbnails_only(tokens, property_id):
+    client.post(
+        "/v1/bookings",
+        headers=auth(tokens["guest"]),
+        json={"property_id": property_id, "date_in": "2025-07-01", "date_out": "2025-07-03"}
+    )
+
+    full = client.get("/v1/bookings/my-bookings", headers=auth(tokens["guest"])).json()
+    thumbnails = client.get("/v1/bookings/my-bookings", headers=auth(tokens["guest"]), params={"max_pictures": 1}).json()
+
+    assert full[0]["property"]["picture_urls"] == PICTURES
+    assert thumbnails[0]["property"]["picture_urls"] == PICTURES[:1]
+
+def test_deleting_a_property_deletes_its_pictures(tokens, property_id):
+    client.delete(f"/v1/properties/{property_id}", headers=auth(tokens["host"]))
+
+    with open_test_session() as session:
+        remaining = session.exec(text("SELECT COUNT(*) FROM property_pictures")).one()[0]
+    assert remaining == 0
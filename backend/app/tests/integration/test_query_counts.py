@@ -0,0 +1,96 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.tests.utils.db import open_test_session
+from app.tests.utils.factories import create_test_user
+from app.tests.utils.auth import get_token
+from app.tests.utils.queries import count_queries
+import pytest
+
+client = TestClient(app)
+
+# The number of statements issued by a listing endpoint must not depend on how many rows it returns
+
+@pytest.fixture
+def tokens():
+    with open_test_session() as session:
+        create_test_user(session, "queryhost@example.com", "password123", role="host")
+        create_test_user(session, "queryguest@example.com", "password123", role="guest")
+    return {
+        "host": get_token("queryhost@example.com", "password123"),
+        "guest": get_token("queryguest@example.com", "password123")
+    }
+
+def add_properties(token, start, count):
+    property_ids = []
+    for i in range(start, start + count):
+        response = client.post(
+            "/v1/properties",
+            headers={"Authorization": f"Bearer {token}"},
+            json={
+                "title": f"Query Property {i}",
+                "address": f"{i} Query Street",
+                "city": "Query City",
+                "state": "QC",
+                "picture_urls": ["https://example.com/query.jpg"]
+            }
+        )
+        assert response.status_code == 200
+        property_ids.append(response.json()["property_id"])
+    return property_ids
+
+def add_properties_from_many_hosts(start, count):
+    # one host per property, so a per-row host lookup can't be served from the session identity map
+    property_ids = []
+    for i in range(start, start + count):
+        with open_test_session() as session:
+            create_test_user(session, f"queryhost{i}@example.com", "password123", role="host")
+        property_ids += add_properties(get_token(f"queryhost{i}@example.com", "password123"), i, 1)
+    return property_ids
+
+def add_bookings(token, property_ids):
+    for property_id in property_ids:
+        response = client.post(
+            "/v1/bookings",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"property_id": property_id, "date_in": "2025-07-01", "date_out": "2025-07-03"}
+        )
+        assert response.status_code == 200
+
+def queries_for(path, token):
+    with count_queries() as counter:
+        response = client.get(path, headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    return counter.count
+
+def test_browse_uses_constant_queries(tokens):
+    add_properties_from_many_hosts(0, 1)
+    small = queries_for("/v1/properties", tokens["guest"])
+
+    add_properties_from_many_hosts(1, 5)
+    large = queries_for("/v1/properties", tokens["guest"])
+
+    assert large == small
+
+def test_my_properties_use_constant_queries(tokens):
+    add_properties(tokens["host"], 0, 1)
+    small = queries_for("/v1/properties/mine", tokens["host"])
+
+    add_properties(tokens["host"], 1, 5)
+    large = queries_for("/v1/properties/mine", tokens["host"])
+
+    assert large == small
+
+def test_my_bookings_use_constant_queries(tokens):
+    property_ids = add_properties_from_many_hosts(0, 6)
+
+    add_bookings(tokens["guest"], property_ids[:1])
+    small = queries_for("/v1/bookings/my-bookings", tokens["guest"])
+
+    add_bookings(tokens["guest"], property_ids[1:])
+    large = queries_for("/v1/bookings/my-bookings", tokens["guest"])
+
+    assert large == small
+
+def test_property_details_use_a_single_query(tokens):
+    property_id = add_properties(tokens["host"], 0, 1)[0]
+    assert queries_for(f"/v1/properties/{property_id}", tokens["guest"]) == 1
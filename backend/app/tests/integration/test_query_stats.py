@@ -0,0 +1,103 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core import db
+from app.core.db import query_logger
+from app.tests.utils.db import open_test_session
+from app.tests.utils.factories import create_test_user
+from app.tests.utils.auth import get_token
+from app.tests.utils.queries import count_queries, query_budget
+import logging
+import pytest
+
+client = TestClient(app)
+
+@pytest.fixture
+def tokens():
+    with open_test_session() as session:
+        create_test_user(session, "statshost@example.com", "password123", role="host")
+        create_test_user(session, "statsguest@example.com", "password123", role="guest")
+    return {
+        "host": get_token("statshost@example.com", "password123"),
+        "guest": get_token("statsguest@example.com", "password123")
+    }
+
+@pytest.fixture
+def logged():
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    query_logger.addHandler(handler)
+    level = query_logger.level
+    query_logger.setLevel(logging.INFO)
+    yield records
+    query_logger.setLevel(level)
+    query_logger.removeHandler(handler)
+
+def auth(token):
+    return {"Authorization": f"Bearer {token}"}
+
+def add_property(token, title):
+    response = client.post(
+        "/v1/properties",
+        headers=auth(token),
+        json={"title": title, "address": f"1 {title} Street", "city": "Stats City", "state": "SC",
+              "picture_urls": ["https://example.com/stats.jpg"]}
+    )
+    assert response.status_code == 200
+    return response.json()["property_id"]
+
+# committed: Server-Timing would also count the SAVEPOINTs of the test's transaction
+@pytest.mark.committed
+def test_server_timing_reports_the_request_queries(tokens, logged):
+    property_id = add_property(tokens["host"], "Timed")
+
+    with count_queries() as counter:
+        response = client.get(f"/v1/properties/{property_id}", headers=auth(tokens["guest"]))
+
+    assert response.status_code == 200
+    assert f'desc="{counter.count} queries"' in response.headers["server-timing"]
+    assert response.headers["server-timing"].startswith("db;dur=")
+    record = [r for r in logged if getattr(r, "event", None) == "request_queries"][-1]
+    assert record.path == f"/v1/properties/{property_id}"
+    assert record.status == 200
+    assert record.queries == counter.count
+
+def test_slow_queries_are_logged_with_their_parameters(tokens, logged, monkeypatch):
+    property_id = add_property(tokens["host"], "Slow")
+    monkeypatch.setattr(db.settings, "database_slow_query_ms", 1e-6) # every statement is "slow"
+
+    client.get(f"/v1/properties/{property_id}", headers=auth(tokens["guest"]))
+
+    slow = [r for r in logged if getattr(r, "event", None) == "slow_query"]
+    assert slow
+    assert any("FROM properties" in r.statement and str(property_id) in r.parameters for r in slow)
+
+def test_query_budget_fails_the_test_when_exceeded(tokens):
+    property_id = add_property(tokens["host"], "Budget")
+
+    with pytest.raises(pytest.fail.Exception, match="over the budget of 0"):
+        with query_budget(0):
+            client.get(f"/v1/properties/{property_id}", headers=auth(tokens["guest"]))
+
+# Declared budgets of the hot endpoints: raise one only with a reason, an increase usually means an N+1
+
+def test_hot_endpoints_stay_within_their_query_budgets(tokens):
+    property_id = add_property(tokens["host"], "Hot")
+    for i in range(5):
+        add_property(tokens["host"], f"Hot {i}")
+    response = client.post("/v1/bookings", headers=auth(tokens["guest"]),
+                           json={"property_id": property_id, "date_in": "2025-07-01", "date_out": "2025-07-03"})
+    assert response.status_code == 200
+
+    budgets = [
+        ("guest", "/v1/properties", 3), # catalog version (ETag), page of ids, rows with host and pictures
+        ("guest", f"/v1/properties/{property_id}", 1), # the card's row with host and pictures (0 when the card is cached)
+        ("guest", f"/v1/properties/{property_id}/calendar?from=2025-07-01", 2), # existence check, nights range scan
+        ("guest", "/v1/properties/facets", 2), # catalog version, facet rows
+        ("guest", "/v1/bookings/my-bookings", 1),
+        ("host", "/v1/properties/mine", 1),
+    ]
+    for role, path, budget in budgets:
+        with query_budget(budget):
+            response = client.get(path, headers=auth(tokens[role]))
+        assert response.status_code == 200, path
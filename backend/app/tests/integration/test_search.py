@@ -0,0 +1,149 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.tests.utils.db import open_test_session
+from app.core.pagination import encode_cursor
+from app.core.search import InMemorySearchIndex
+from app.routes import property as property_routes
+from app.tests.utils.factories import create_test_user
+from app.tests.utils.auth import get_token
+from sqlalchemy import text
+import pytest
+
+client = TestClient(app)
+
+@pytest.fixture(params=["database", "memory"])
+def index_backend(request, monkeypatch):
+    # run every test against the SQLite FTS5 index and the in-memory index used on other databases
+    if request.param == "memory":
+        monkeypatch.setattr(property_routes, "search_index", InMemorySearchIndex())
+    return request.param
+
+@pytest.fixture
+def tokens(index_backend):
+    with open_test_session() as session:
+        create_test_user(session, "ftshost@example.com", "password123", role="host")
+        create_test_user(session, "ftsguest@example.com", "password123", role="guest")
+    return {
+        "host": get_token("ftshost@example.com", "password123"),
+        "guest": get_token("ftsguest@example.com", "password123")
+    }
+
+def create_property(token, title, city, state):
+    response = client.post(
+        "/v1/properties",
+        headers={"Authorization": f"Bearer {token}"},
+        json={
+            "title": title,
+            "address": f"1 {title} Street",
+            "city": city,
+            "state": state,
+            "picture_urls": ["https://example.com/fts.jpg"]
+        }
+    )
+    assert response.status_code == 200
+    return response.json()["property_id"]
+
+def search(token, q, **params):
+    response = client.get(
+        "/v1/properties/search",
+        headers={"Authorization": f"Bearer {token}"},
+        params={"q": q, **params}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+def test_search_matches_title_city_and_state(tokens):
+    create_property(tokens["host"], "Cozy Beach Cottage", "Miami", "FL")
+    create_property(tokens["host"], "Mountain Cabin", "Denver", "CO")
+    create_property(tokens["host"], "Miami Penthouse", "Orlando", "FL")
+
+    assert {p["title"] for p in search(tokens["guest"], "cabin")["items"]} == {"Mountain Cabin"}
+    assert {p["title"] for p in search(tokens["guest"], "fl")["items"]} == {"Cozy Beach Cottage", "Miami Penthouse"}
+    # every word has to match, the last one as a prefix
+    assert [p["title"] for p in search(tokens["guest"], "cozy mia")["items"]] == ["Cozy Beach Cottage"]
+
+def test_title_matches_rank_first(tokens):
+    create_property(tokens["host"], "Quiet Flat", "Lisbon", "LX")
+    create_property(tokens["host"], "Lisbon Rooftop", "Porto", "PT")
+
+    titles = [p["title"] for p in search(tokens["guest"], "lisbon")["items"]]
+
+    assert titles == ["Lisbon Rooftop", "Quiet Flat"]
+
+def test_deleted_properties_leave_the_index(tokens):
+    property_id = create_property(tokens["host"], "Temporary Loft", "Paris", "IDF")
+    assert len(search(tokens["guest"], "loft")["items"]) == 1
+
+    response = client.delete(f"/v1/properties/{property_id}", headers={"Authorization": f"Bearer {tokens['host']}"})
+    assert response.status_code == 200
+
+    assert search(tokens["guest"], "loft")["items"] == []
+
+def test_search_is_paginated(tokens):
+    for i in range(3):
+        create_property(tokens["host"], f"Garden House {i}", "Rome", "RM")
+
+    first = search(tokens["guest"], "garden", limit=2)
+    second = search(tokens["guest"], "garden", limit=2, cursor=first["next_cursor"])
+
+    assert len(first["items"]) == 2
+    assert len(second["items"]) == 1
+    assert second["next_cursor"] is None
+    assert {p["property_id"] for p in first["items"]}.isdisjoint(p["property_id"] for p in second["items"])
+
+def test_query_syntax_is_not_interpreted(tokens):
+    create_property(tokens["host"], "Plain Studio", "Berlin", "BE")
+
+    # FTS5 operators, quotes and stars are treated as plain text
+    assert [p["title"] for p in search(tokens["guest"], 'studio"*')["items"]] == ["Plain Studio"]
+    assert [p["title"] for p in search(tokens["guest"], "NEAR(plain)")["items"]] == []
+    assert search(tokens["guest"], "---")["items"] == []
+
+def test_writes_of_other_workers_reach_the_index(tokens):
+    create_property(tokens["host"], "Harbour Loft", "Porto", "PT")
+    assert len(search(tokens["guest"], "loft")["items"]) == 1
+
+    # another worker renames it: rows and catalog version change, this worker's index isn't told
+    other_worker = client.post(
+        "/v1/properties",
+        headers={"Authorization": f"Bearer {tokens['host']}"},
+        json={"title": "Garden Loft", "address": "2 Garden Street", "city": "Braga", "state": "PT", "picture_urls": []}
+    ).json()["property_id"]
+    with open_test_session() as session:
+        session.exec(text("UPDATE properties SET title = 'Garden Studio' WHERE property_id = :id").bindparams(id=other_worker))
+        session.exec(text("UPDATE catalog_versions SET version = version + 1 WHERE name = 'properties'"))
+        session.commit()
+
+    assert {p["title"] for p in search(tokens["guest"], "loft")["items"]} == {"Harbour Loft"}
+    assert {p["title"] for p in search(tokens["guest"], "studio")["items"]} == {"Garden Studio"}
+
+def test_own_writes_do_not_rebuild_the_index(tokens, index_backend, monkeypatch):
+    if index_backend != "memory":
+        pytest.skip("FTS5 is kept in sync by triggers")
+    create_property(tokens["host"], "First Loft", "Porto", "PT")
+    search(tokens["guest"], "loft") # builds the index
+    loads = []
+    original_load = property_routes.search_index._load
+
+    async def counted_load(session, version):
+        loads.append(version)
+        await original_load(session, version)
+
+    monkeypatch.setattr(property_routes.search_index, "_load", counted_load)
+    create_property(tokens["host"], "Second Loft", "Porto", "PT")
+
+    assert len(search(tokens["guest"], "loft")["items"]) == 2
+    assert loads == []
+
+@pytest.mark.parametrize("cursor", [encode_cursor(-2), encode_cursor(1.5), encode_cursor("two")])
+def test_search_rejects_a_crafted_cursor(tokens, cursor):
+    create_property(tokens["host"], "Garden Loft", "Austin", "TX")
+
+    response = client.get(
+        "/v1/properties/search",
+        headers={"Authorization": f"Bearer {tokens['guest']}"},
+        params={"q": "garden", "cursor": cursor}
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor."
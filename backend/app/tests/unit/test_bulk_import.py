@@ -0,0 +1,33 @@
+import pytest
+from fastapi import HTTPException
+from app.core.bulk_import import parse_rows
+
+def test_csv_rows():
+    body = (
+        "\ufefftitle,address,city,state,picture_urls,latitude,longitude\r\n"
+        "Loft,\"1 Main St, Apt 2\",Lisbon,LX,https://a.jpg  https://b.jpg,38.7,-9.1\r\n"
+        "Shed,2 Main St,Lisbon,LX,,,\r\n"
+        "Barn,3 Main St,Lisbon,LX,,,,extra\r\n"
+    ).encode()
+
+    rows = parse_rows(body, "text/csv; charset=utf-8")
+    assert rows[0] == {
+        "title": "Loft", "address": "1 Main St, Apt 2", "city": "Lisbon", "state": "LX",
+        "picture_urls": ["https://a.jpg", "https://b.jpg"], "latitude": "38.7", "longitude": "-9.1",
+    }
+    assert rows[1] == {"title": "Shed", "address": "2 Main St", "city": "Lisbon", "state": "LX", "picture_urls": []}
+    assert rows[2] == "Too many columns."
+
+def test_ndjson_rows_report_unreadable_lines():
+    rows = parse_rows(b'{"title": "a"}\n\n[1]\n{oops\n', "application/x-ndjson")
+    assert rows == [{"title": "a"}, "Expected a JSON object.", "Invalid JSON line."]
+
+@pytest.mark.parametrize("body, content_type, status_code", [
+    (b'{"title": "a"}', "application/json", 400),
+    (b"\xff\xfe", "text/csv", 400),
+    (b"<xml/>", "application/xml", 415),
+])
+def test_unreadable_uploads(body, content_type, status_code):
+    with pytest.raises(HTTPException) as error:
+        parse_rows(body, content_type)
+    assert error.value.status_code == status_code
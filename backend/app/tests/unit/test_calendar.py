@@ -0,0 +1,53 @@
+import time
+from datetime import date, timedelta
+from app.core.calendar import CalendarCache, days_after, month_masks, months_between, next_month, runs, window_mask
+
+def test_months_between():
+    assert months_between(date(2024, 12, 31), date(2025, 2, 1)) == [date(2024, 12, 1), date(2025, 1, 1)]
+    assert months_between(date(2025, 2, 1), date(2025, 2, 2)) == [date(2025, 2, 1)]
+
+def test_months_at_the_end_of_time():
+    assert next_month(date(9999, 12, 5)) == date.max
+    assert months_between(date(9999, 11, 15), date.max) == [date(9999, 11, 1), date(9999, 12, 1)]
+    assert days_after(date(9999, 12, 1), 90) == date.max
+    assert days_after(date(2025, 1, 1), 31) == date(2025, 2, 1)
+
+def test_window_mask_stitches_months():
+    nights = [date(2024, 2, 29), date(2024, 3, 1), date(2024, 3, 31), date(2024, 4, 1)]
+    masks = month_masks(nights, months_between(date(2024, 2, 1), date(2024, 5, 1)))
+    start = date(2024, 2, 20)
+    bits = window_mask(masks, start, date(2024, 4, 2))
+    assert [start + timedelta(days=offset) for offset in range(60) if bits >> offset & 1] == nights
+    assert window_mask(masks, date(2024, 3, 2), date(2024, 3, 31)) == 0
+
+def test_runs():
+    assert runs(0) == []
+    assert runs(0b1110_0110_0001) == [(0, 1), (5, 2), (9, 3)]
+
+def test_cache_invalidates_months_and_expires():
+    cache = CalendarCache(max_properties=2, ttl_seconds=60)
+    cache.put(1, {date(2025, 1, 1): 1, date(2025, 2, 1): 2})
+    cache.invalidate(1, [date(2025, 1, 1)])
+    assert cache.get(1, [date(2025, 1, 1), date(2025, 2, 1)]) == {date(2025, 2, 1): 2}
+
+    cache.put(2, {date(2025, 1, 1): 0})
+    cache.put(3, {date(2025, 1, 1): 0}) # evicts property 1
+    assert cache.get(1, [date(2025, 2, 1)]) == {}
+
+    expiring = CalendarCache(max_properties=2, ttl_seconds=0)
+    expiring.put(1, {date(2025, 1, 1): 1})
+    time.sleep(0.001)
+    assert expiring.get(1, [date(2025, 1, 1)]) == {}
+
+def test_cache_keeps_a_bounded_number_of_months_per_property():
+    cache = CalendarCache(max_properties=2, ttl_seconds=60, max_months=3)
+    months = months_between(date(2025, 1, 1), date(2025, 6, 1))
+    for month in months:
+        cache.put(1, {month: 1})
+    assert list(cache.get(1, months)) == months[-3:]
+
+    expiring = CalendarCache(max_properties=2, ttl_seconds=0.01)
+    expiring.put(1, {date(2025, 1, 1): 1})
+    time.sleep(0.02)
+    expiring.put(1, {date(2025, 2, 1): 1}) # drops the expired January without it being read again
+    assert list(expiring._entries[1]) == [date(2025, 2, 1)]
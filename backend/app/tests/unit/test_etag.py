@@ -0,0 +1,11 @@
+from app.core.etag import etag_matches, make_etag
+
+def test_etag_matching_follows_if_none_match_rules():
+    etag = make_etag("property", 7, 3)
+
+    assert etag == '"property-7-3"'
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"property-7-2"', etag)
+    assert not etag_matches(None, etag)
@@ -0,0 +1,34 @@
+import random
+from math import cos, radians
+from app.core.geo import KM_PER_DEGREE, cell_id, cell_ranges, haversine_km
+
+def covered(ranges, cell):
+    return any(first <= cell <= last for first, last in ranges)
+
+def test_haversine_known_distance():
+    # Lisbon -> Porto is about 274 km
+    assert 270 < haversine_km(38.7223, -9.1393, 41.1579, -8.6291) < 280
+
+def test_cells_cover_every_point_inside_the_radius():
+    rng = random.Random(3)
+    for _ in range(200):
+        latitude, longitude = rng.uniform(-80, 80), rng.uniform(-180, 180)
+        radius_km = rng.uniform(1, 100)
+        ranges = cell_ranges(latitude, longitude, radius_km)
+        for _ in range(20):
+            # random point inside the radius
+            distance = rng.uniform(0, radius_km) / KM_PER_DEGREE
+            point_latitude = latitude + distance * rng.uniform(-1, 1)
+            point_longitude = longitude + distance * rng.uniform(-1, 1) / cos(radians(latitude))
+            point_longitude = (point_longitude + 180) % 360 - 180
+            if haversine_km(latitude, longitude, point_latitude, point_longitude) <= radius_km:
+                assert covered(ranges, cell_id(point_latitude, point_longitude))
+
+def test_cells_wrap_around_the_antimeridian():
+    ranges = cell_ranges(0.0, 179.99, 20)
+
+    assert covered(ranges, cell_id(0.0, 179.95))
+    assert covered(ranges, cell_id(0.0, -179.95))
+
+def test_no_cell_without_coordinates():
+    assert cell_id(None, None) is None
@@ -0,0 +1,50 @@
+import asyncio
+from app.core.metrics import LATENCY_BUCKETS, UNMATCHED_ROUTE, MetricsMiddleware, RouteMetrics
+
+def test_record_fills_buckets_and_status_classes():
+    metrics = RouteMetrics(buckets=[0.01, 0.1])
+    metrics.record("GET", "/items/{item_id}", 200, 0.005)
+    metrics.record("GET", "/items/{item_id}", 404, 0.05)
+    metrics.record("GET", "/items/{item_id}", 503, 3.0)
+
+    text = metrics.render()
+    labels = 'method="GET",route="/items/{item_id}"'
+    assert f'http_requests_total{{{labels},status="2xx"}} 1' in text
+    assert f'http_requests_total{{{labels},status="4xx"}} 1' in text
+    assert f'http_requests_total{{{labels},status="5xx"}} 1' in text
+    assert "3xx" not in text # empty status classes are left out
+    # buckets are cumulative
+    assert f'http_request_duration_seconds_bucket{{{labels},le="0.01"}} 1' in text
+    assert f'http_request_duration_seconds_bucket{{{labels},le="0.1"}} 2' in text
+    assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in text
+    assert f"http_request_duration_seconds_count{{{labels}}} 3" in text
+    assert f"http_request_duration_seconds_sum{{{labels}}} 3.055" in text
+
+def test_bucket_bounds_are_inclusive():
+    metrics = RouteMetrics()
+    metrics.record("GET", "/ping", 200, LATENCY_BUCKETS[0])
+
+    assert f'le="{LATENCY_BUCKETS[0]}"}} 1' in metrics.render()
+
+def test_label_values_are_escaped():
+    metrics = RouteMetrics()
+    metrics.record("GET", '/odd"\\path', 200, 0.001)
+
+    assert 'route="/odd\\"\\\\path"' in metrics.render()
+
+def test_middleware_records_unmatched_and_failed_requests():
+    metrics = RouteMetrics()
+
+    async def failing_app(scope, receive, send):
+        raise RuntimeError("boom")
+
+    async def sent(message):
+        pass
+
+    middleware = MetricsMiddleware(failing_app, metrics)
+    try:
+        asyncio.run(middleware({"type": "http", "method": "POST", "path": "/nowhere"}, None, sent))
+    except RuntimeError:
+        pass
+
+    assert f'http_requests_total{{method="POST",route="{UNMATCHED_ROUTE}",status="5xx"}} 1' in metrics.render()
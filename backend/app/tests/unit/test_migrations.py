@@ -0,0 +1,162 @@
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import create_engine, event, inspect, text
+from sqlmodel import SQLModel
+import pytest
+from app.core import migrations
+from app.core.migrations import LATEST_VERSION, current_version, register_models, run_migrations
+
+register_models()
+
+INDEXES = {"ix_properties_city_state", "ix_properties_host", "ix_bookings_property_dates", "ix_bookings_guest_date"}
+
+def index_names(engine):
+    inspector = inspect(engine)
+    return {index["name"] for table in ("properties", "bookings") for index in inspector.get_indexes(table)}
+
+def test_fresh_database_is_created_at_latest_version(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'fresh.sqlite3'}")
+
+    run_migrations(engine)
+
+    with engine.connect() as conn:
+        assert current_version(conn) == LATEST_VERSION
+    assert INDEXES <= index_names(engine)
+
+def test_legacy_database_gets_indexes_without_losing_data(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.sqlite3'}")
+    # a database created by the old bare create_all(), before the indexes existed
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as conn:
+        for index in INDEXES:
+            conn.execute(text(f"DROP INDEX {index}"))
+        conn.execute(text("INSERT INTO users (name, email, hashed_password, role) VALUES ('Old', 'old@example.com', 'x', 'guest')"))
+
+    applied = run_migrations(engine)
+
+    assert applied == list(range(2, LATEST_VERSION + 1))
+    assert INDEXES <= index_names(engine)
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM users")).scalar_one() == 1
+
+def test_migrations_are_applied_once(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'twice.sqlite3'}")
+    run_migrations(engine)
+
+    assert run_migrations(engine) == []
+
+def test_up_to_date_database_is_a_single_version_lookup(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'boot.sqlite3'}")
+    run_migrations(engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+
+    run_migrations(engine)
+
+    # has_table (one PRAGMA) + SELECT MAX(version), nothing else
+    assert len(statements) <= 2
+    assert "schema_migrations" in statements[-1]
+
+def test_booking_nights_are_backfilled_from_existing_bookings(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'nights.sqlite3'}")
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE booking_nights"))
+        conn.execute(text("INSERT INTO users (name, email, hashed_password, role) VALUES ('Old', 'old@example.com', 'x', 'guest')"))
+        conn.execute(text("INSERT INTO properties (host_id, title, address, city, state) VALUES (1, 't', 'a', 'c', 's')"))
+        # two overlapping bookings made before the claim table existed
+        conn.execute(text("INSERT INTO bookings (guest_id, property_id, date_in, date_out) VALUES (1, 1, '2025-06-01', '2025-06-04')"))
+        conn.execute(text("INSERT INTO bookings (guest_id, property_id, date_in, date_out) VALUES (1, 1, '2025-06-03', '2025-06-05')"))
+
+    run_migrations(engine)
+
+    with engine.connect() as conn:
+        nights = conn.execute(text("SELECT night, booking_id FROM booking_nights ORDER BY night")).all()
+    assert nights == [("2025-06-01", 1), ("2025-06-02", 1), ("2025-06-03", 1), ("2025-06-04", 2)]
+
+def test_booking_nights_are_backfilled_in_batches(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'many_nights.sqlite3'}")
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE booking_nights"))
+        conn.execute(text("INSERT INTO users (name, email, hashed_password, role) VALUES ('Old', 'old@example.com', 'x', 'guest')"))
+        for property_id in (1, 2):
+            conn.execute(text("INSERT INTO properties (host_id, title, address, city, state) VALUES (1, 't', 'a', 'c', 's')"))
+            # 6000 nights each, the second booking overlapping the first
+            conn.execute(text(f"INSERT INTO bookings (guest_id, property_id, date_in, date_out) VALUES (1, {property_id}, '2000-01-01', '2010-01-01')"))
+            conn.execute(text(f"INSERT INTO bookings (guest_id, property_id, date_in, date_out) VALUES (1, {property_id}, '2009-01-01', '2016-06-05')"))
+    batches = []
+    def count_rows(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO booking_nights"):
+            batches.append(len(parameters) if executemany else 1)
+    event.listen(engine, "before_cursor_execute", count_rows)
+
+    run_migrations(engine)
+
+    with engine.connect() as conn:
+        nights = conn.execute(text("SELECT property_id, COUNT(*) FROM booking_nights GROUP BY property_id")).all()
+    assert nights == [(1, 6000), (2, 6000)]
+    assert sum(batches) == 12000
+    assert max(batches) <= 5000
+
+def test_picture_urls_are_moved_to_property_pictures(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pictures.sqlite3'}")
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as conn:
+        # pictures stored the old way, as a JSON string on the property
+        conn.execute(text("DROP TABLE property_pictures"))
+        conn.execute(text("ALTER TABLE properties ADD COLUMN picture_urls VARCHAR"))
+        conn.execute(text("INSERT INTO users (name, email, hashed_password, role) VALUES ('Old', 'old@example.com', 'x', 'host')"))
+        conn.execute(text("INSERT INTO properties (host_id, title, address, city, state, picture_urls) VALUES (1, 't1', 'a', 'c', 's', '[\"a.jpg\", \"b.jpg\"]')"))
+        conn.execute(text("INSERT INTO properties (host_id, title, address, city, state, picture_urls) VALUES (1, 't2', 'a', 'c', 's', '[]')"))
+
+    run_migrations(engine)
+
+    with engine.connect() as conn:
+        pictures = conn.execute(text("SELECT property_id, position, url FROM property_pictures ORDER BY property_id, position")).all()
+    assert pictures == [(1, 0, "a.jpg"), (1, 1, "b.jpg")]
+    assert "picture_urls" not in {column["name"] for column in inspect(engine).get_columns("properties")}
+
+def test_facets_are_counted_from_existing_properties(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'facets.sqlite3'}")
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE property_facets"))
+        conn.execute(text("INSERT INTO users (name, email, hashed_password, role) VALUES ('Old', 'old@example.com', 'x', 'host')"))
+        for title, city in [("t1", "Lisbon"), ("t2", "Lisbon"), ("t3", "Porto")]:
+            conn.execute(text(f"INSERT INTO properties (host_id, title, address, city, state) VALUES (1, '{title}', 'a', '{city}', 'PT')"))
+
+    run_migrations(engine)
+
+    with engine.connect() as conn:
+        facets = conn.execute(text("SELECT state, city, count FROM property_facets ORDER BY city")).all()
+    assert facets == [("PT", "Lisbon", 2), ("PT", "Porto", 1)]
+
+def test_concurrent_boots_apply_each_migration_once(tmp_path):
+    url = f"sqlite:///{tmp_path / 'race.sqlite3'}"
+    engines = [create_engine(url) for _ in range(4)]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(run_migrations, engines))
+
+    assert sorted(version for applied in results for version in applied) == list(range(2, LATEST_VERSION + 1))
+    with engines[0].connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM schema_migrations")).scalar_one() == LATEST_VERSION
+
+def test_failed_migration_rolls_back_its_ddl(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'failed.sqlite3'}")
+    run_migrations(engine)
+
+    def half_done(conn):
+        conn.execute(text("CREATE TABLE half_done (id INTEGER PRIMARY KEY)"))
+        conn.execute(text("ALTER TABLE properties DROP COLUMN version"))
+        raise RuntimeError("migration bug")
+
+    monkeypatch.setattr(migrations, "MIGRATIONS", migrations.MIGRATIONS + [(LATEST_VERSION + 1, "broken", half_done)])
+    monkeypatch.setattr(migrations, "LATEST_VERSION", LATEST_VERSION + 1)
+    with pytest.raises(RuntimeError):
+        run_migrations(engine)
+
+    assert not inspect(engine).has_table("half_done")
+    assert "version" in {column["name"] for column in inspect(engine).get_columns("properties")}
+    with engine.connect() as conn:
+        assert current_version(conn) == LATEST_VERSION
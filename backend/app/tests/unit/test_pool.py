@@ -0,0 +1,32 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from app.core.pool import InstrumentedQueuePool, pool_stats
+from app.main import app
+
+client = TestClient(app)
+
+def test_pool_stats_track_connections_and_waits(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.sqlite3'}", poolclass=InstrumentedQueuePool, pool_size=2, max_overflow=0)
+
+    first = engine.connect()
+    second = engine.connect()
+    stats = pool_stats(engine)
+    assert stats["in_use"] == 2
+    assert stats["checkouts"] == 2
+
+    first.close()
+    stats = pool_stats(engine)
+    assert stats["in_use"] == 1
+    assert stats["idle"] == 1
+    assert sum(stats["wait_histogram"].values()) == 2
+
+    second.close()
+    engine.dispose()
+
+def test_pool_status_endpoint():
+    response = client.get("/internal/pool")
+
+    assert response.status_code == 200
+    stats = response.json()["sync"]
+    for key in ("size", "in_use", "idle", "checkouts", "timeouts", "mean_wait_ms", "max_wait_ms", "wait_histogram"):
+        assert key in stats
@@ -0,0 +1,77 @@
+import asyncio
+import time
+from app.core.property_cache import CachedProperty, ExternalPropertyCache, InMemoryPropertyCache, NullPropertyCache, create_property_cache
+from app.schemas.property import PropertyRead
+from app.tests.utils.kv_store import LocalKeyValueStore
+
+def card(property_id):
+    return CachedProperty(1, PropertyRead(
+        property_id=property_id,
+        title=f"Flat {property_id}",
+        address="1 Cache Street",
+        city="Cache City",
+        state="CC",
+        picture_urls=["https://example.com/cache.jpg"],
+        host_name="Host"
+    ))
+
+def test_memory_cache_evicts_least_recently_used():
+    async def scenario():
+        cache = InMemoryPropertyCache(max_entries=2, ttl_seconds=60)
+        await cache.set_many({1: card(1), 2: card(2)})
+        await cache.get_many([1]) # 2 is now the least recently used
+        await cache.set_many({3: card(3)})
+        return cache, await cache.get_many([1, 2, 3])
+
+    cache, found = asyncio.run(scenario())
+
+    assert set(found) == {1, 3}
+    assert cache.stats.snapshot() == {"hits": 3, "misses": 1, "hit_ratio": 0.75, "evictions": 1, "expirations": 0}
+
+def test_memory_cache_entries_expire():
+    async def scenario():
+        cache = InMemoryPropertyCache(max_entries=10, ttl_seconds=0.05)
+        await cache.set_many({1: card(1)})
+        time.sleep(0.06)
+        return cache, await cache.get_many([1])
+
+    cache, found = asyncio.run(scenario())
+
+    assert found == {}
+    assert cache.stats.expirations == 1
+
+def test_external_cache_round_trips_cards():
+    async def scenario():
+        cache = ExternalPropertyCache(LocalKeyValueStore(), ttl_seconds=60)
+        await cache.set_many({1: card(1), 2: card(2)})
+        await cache.invalidate(2)
+        return cache, await cache.get_many([1, 2])
+
+    cache, found = asyncio.run(scenario())
+
+    assert found == {1: card(1)}
+    assert cache.stats.snapshot()["misses"] == 1
+
+def test_external_cache_writes_a_page_in_one_round_trip():
+    async def scenario():
+        store = LocalKeyValueStore()
+        cache = ExternalPropertyCache(store, ttl_seconds=60)
+        await cache.set_many({property_id: card(property_id) for property_id in range(1, 51)})
+        return store, await cache.get_many(range(1, 51))
+
+    store, found = asyncio.run(scenario())
+
+    assert len(found) == 50
+    assert store.round_trips == 2 # one pipelined write, one MGET
+
+def test_none_backend_misses_everything():
+    async def scenario():
+        cache = create_property_cache("none")
+        await cache.set_many({1: card(1)})
+        return cache, await cache.get_many([1, 2])
+
+    cache, found = asyncio.run(scenario())
+
+    assert isinstance(cache, NullPropertyCache)
+    assert found == {}
+    assert cache.stats.snapshot()["misses"] == 2
@@ -0,0 +1,15 @@
+from datetime import date
+from fastapi.responses import JSONResponse
+from app.core.responses import FastJSONResponse
+from app.schemas.booking import BookingRead
+
+def test_fast_json_matches_the_standard_encoder():
+    booking = BookingRead(booking_id=1, guest_id=2, property_id=3, date_in=date(2025, 7, 1), date_out=date(2025, 7, 3))
+    content = {
+        "text": "São Paulo   </script>",
+        "floats": [0.0, 1.0, -9.1366, 0.1 + 0.2, 5e-324, 1e16, 0.00001, 1.5e-07, 123456789.123],
+        "row": (1, "tuple", None, True),
+    }
+
+    assert FastJSONResponse(content).body == JSONResponse(content).body
+    assert FastJSONResponse(booking).body == JSONResponse(booking.model_dump(mode="json")).body
@@ -0,0 +1,23 @@
+from fastapi.testclient import TestClient
+from app.core.startup import StartupTimer
+from app.main import app
+
+def test_phases_are_summed_in_the_snapshot():
+    timer = StartupTimer()
+    timer.record("imports", 0.2)
+    with timer.phase("schema"):
+        pass
+    timer.record("schema", 0.01)
+
+    snapshot = timer.snapshot()
+    assert list(snapshot) == ["total_ms", "imports_ms", "schema_ms"]
+    assert snapshot["imports_ms"] == 200.0
+    assert 10.0 <= snapshot["schema_ms"] < 20.0
+    assert abs(snapshot["total_ms"] - snapshot["imports_ms"] - snapshot["schema_ms"]) <= 0.01
+
+def test_startup_endpoint_reports_the_boot_phases():
+    with TestClient(app) as client: # runs the lifespan, hence the schema check
+        response = client.get("/internal/startup")
+
+    assert response.status_code == 200
+    assert {"imports_ms", "engines_ms", "routers_ms", "schema_ms"} <= set(response.json())
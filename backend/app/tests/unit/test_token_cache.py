@@ -0,0 +1,50 @@
+import time
+from app.core.token_cache import VerifiedTokenCache
+
+def test_cached_claims_are_returned():
+    cache = VerifiedTokenCache(max_entries=10, ttl_seconds=60)
+    claims = {"sub": "1", "role": "guest", "exp": int(time.time()) + 600}
+
+    cache.put("token-a", claims)
+
+    assert cache.get("token-a") == claims
+    assert cache.get("token-b") is None
+
+def test_entries_never_outlive_the_token_exp():
+    cache = VerifiedTokenCache(max_entries=10, ttl_seconds=600)
+
+    cache.put("expired", {"sub": "1", "role": "guest", "exp": int(time.time()) - 1})
+    cache.put("expiring", {"sub": "1", "role": "guest", "exp": time.time() + 0.05})
+
+    assert cache.get("expired") is None
+    assert cache.get("expiring") is not None
+    time.sleep(0.06)
+    assert cache.get("expiring") is None
+
+def test_ttl_bounds_entries_of_long_lived_tokens():
+    cache = VerifiedTokenCache(max_entries=10, ttl_seconds=0.05)
+    cache.put("token", {"sub": "1", "role": "guest", "exp": int(time.time()) + 3600})
+
+    time.sleep(0.06)
+
+    assert cache.get("token") is None
+
+def test_least_recently_used_entry_is_evicted():
+    cache = VerifiedTokenCache(max_entries=2, ttl_seconds=60)
+    exp = int(time.time()) + 600
+    cache.put("a", {"sub": "1", "exp": exp})
+    cache.put("b", {"sub": "2", "exp": exp})
+    cache.get("a") # a is now more recent than b
+
+    cache.put("c", {"sub": "3", "exp": exp})
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+def test_zero_size_disables_the_cache():
+    cache = VerifiedTokenCache(max_entries=0, ttl_seconds=60)
+    cache.put("token", {"sub": "1", "exp": int(time.time()) + 600})
+
+    assert cache.get("token") is None
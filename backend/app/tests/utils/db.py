@@ -0,0 +1,54 @@
+from contextlib import contextmanager
+from typing import Optional
+from sqlmodel import Session
+from app.core.db import engine, get_async_session, get_session, get_session_factory, session_dependency, session_factory
+
+
+class TestTransaction:
+    """One connection and an outer transaction for a whole test, rolled back at the end.
+
+    The app's session dependencies are overridden to use that connection: every commit of the routes
+    (and of the tests' own sessions) only releases a SAVEPOINT, so nothing reaches the database
+    and the next test starts from the state left by the migrations.
+    """
+    __test__ = False # not a test class, whatever pytest makes of its name
+
+    def __init__(self, app):
+        self.app = app
+        self.connection = engine.connect()
+        self.sqlite = engine.dialect.name == "sqlite"
+        if self.sqlite:
+            # pysqlite only BEGINs before DML, so a SAVEPOINT would open (and its RELEASE commit) the
+            # transaction: take transaction control from the driver and BEGIN explicitly instead
+            self.connection.connection.driver_connection.isolation_level = None
+        self.transaction = self.connection.begin()
+        if self.sqlite:
+            self.connection.exec_driver_sql("BEGIN")
+
+        open_session = session_factory(self.connection)
+        app.dependency_overrides[get_session] = self.sessions
+        app.dependency_overrides[get_async_session] = session_dependency(open_session)
+        app.dependency_overrides[get_session_factory] = lambda: open_session
+
+    def sessions(self):
+        with Session(self.connection, join_transaction_mode="create_savepoint") as session:
+            yield session
+
+    def rollback(self):
+        for dependency in (get_session, get_async_session, get_session_factory):
+            self.app.dependency_overrides.pop(dependency, None)
+        self.transaction.rollback()
+        if self.sqlite:
+            self.connection.connection.driver_connection.isolation_level = "" # back to the driver's default
+        self.connection.close()
+
+
+# the running test's transaction (set by the conftest), None when the test commits for real
+current_transaction: Optional[TestTransaction] = None
+
+@contextmanager
+def open_test_session():
+    """A session for the test's own setup and checks, inside its transaction when it has one."""
+    sessions = current_transaction.sessions if current_transaction is not None else get_session
+    with next(sessions()) as session:
+        yield session
@@ -0,0 +1,60 @@
+import fnmatch
+import time
+
+# Local stand-in for a redis.asyncio client, with the subset used by ExternalPropertyCache
+class LocalKeyValueStore:
+    def __init__(self):
+        self.data = {} # key -> (value, expires_at)
+        self.round_trips = 0
+
+    def _alive(self, key):
+        entry = self.data.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+            del self.data[key]
+            return None
+        return entry
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [entry[0] if (entry := self._alive(key)) else None for key in keys]
+
+    def _set(self, key, value, ex=None):
+        # values come back as bytes, like redis without decode_responses
+        self.data[key] = (value.encode(), time.monotonic() + ex if ex else None)
+
+    async def delete(self, *keys):
+        self.round_trips += 1
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def scan_iter(self, match="*"):
+        for key in list(self.data):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    def pipeline(self, transaction=True):
+        return LocalPipeline(self)
+
+
+# Buffers the commands and runs them on execute(), in one round-trip
+class LocalPipeline:
+    def __init__(self, store):
+        self.store = store
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.commands.clear()
+
+    def set(self, key, value, ex=None):
+        self.commands.append((key, value, ex))
+        return self
+
+    async def execute(self):
+        self.store.round_trips += 1
+        for key, value, ex in self.commands:
+            self.store._set(key, value, ex)
+        results = [True] * len(self.commands)
+        self.commands.clear()
+        return results
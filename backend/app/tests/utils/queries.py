@@ -0,0 +1,40 @@
+from contextlib import contextmanager
+import pytest
+from sqlalchemy import event
+from app.core.db import engine, async_engine
+
+SAVEPOINT_STATEMENTS = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+class QueryCounter:
+    def __init__(self):
+        self.statements = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        # the SAVEPOINTs standing in for the routes' transactions in the tests (utils.db) aren't the routes' queries
+        if not statement.startswith(SAVEPOINT_STATEMENTS):
+            self.statements.append(statement)
+
+# Helper: count the SQL statements sent to the database inside the block
+@contextmanager
+def count_queries():
+    counter = QueryCounter()
+    # the routes go through the async engine when DATABASE_ASYNC is on
+    target = async_engine.sync_engine if async_engine is not None else engine
+    event.listen(target, "before_cursor_execute", counter)
+    try:
+        yield counter
+    finally:
+        event.remove(target, "before_cursor_execute", counter)
+
+# Helper: fail the test when the block sends more than `max_queries` statements (an endpoint's query budget)
+@contextmanager
+def query_budget(max_queries: int):
+    with count_queries() as counter:
+        yield counter
+    if counter.count > max_queries:
+        statements = "\n".join(f"  {n}. {statement}" for n, statement in enumerate(counter.statements, 1))
+        pytest.fail(f"{counter.count} queries, over the budget of {max_queries}:\n{statements}", pytrace=False)
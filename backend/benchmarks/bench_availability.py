@@ -0,0 +1,53 @@
+"""Availability search benchmark: GET /v1/properties?city=&date_in=&date_out=
+
+Seeds catalogs of increasing size and times the anti-join search, so we can check that latency
+tracks the size of the result page rather than the size of the catalog or booking history.
+
+    ENVIRONMENT=test python -m benchmarks.bench_availability --sizes 1000,10000,100000 --bookings 10
+"""
+import argparse
+from sqlalchemy import text
+from benchmarks.common import client_for, drop_engine, measure, print_table, reset_overrides, seed_catalog, temp_engine
+
+SEARCH = {"city": "City 7", "date_in": "2025-02-10", "date_out": "2025-02-14", "limit": 20}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000,50000", help="comma separated catalog sizes")
+    parser.add_argument("--bookings", type=int, default=10, help="bookings per property")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = []
+    for size in [int(s) for s in args.sizes.split(",")]:
+        engine, path = temp_engine()
+        try:
+            seed_catalog(engine, properties=size, bookings_per_property=args.bookings)
+            client = client_for(engine)
+
+            def search():
+                response = client.get("/v1/properties", params=SEARCH)
+                assert response.status_code == 200, response.text
+
+            stats = measure(search, repeat=args.repeat)
+            rows.append({"properties": size, "bookings": size * args.bookings, **stats})
+        finally:
+            reset_overrides()
+            if size == int(args.sizes.split(",")[-1]):
+                with engine.connect() as conn:
+                    plan = conn.execute(text(
+                        "EXPLAIN QUERY PLAN SELECT properties.property_id FROM properties "
+                        "WHERE city = 'City 7' AND NOT EXISTS (SELECT 1 FROM bookings "
+                        "WHERE bookings.property_id = properties.property_id "
+                        "AND date_in < '2025-02-14' AND date_out > '2025-02-10') "
+                        "ORDER BY property_id LIMIT 21"
+                    )).all()
+            drop_engine(engine, path)
+
+    print_table(rows)
+    print("\nquery plan (largest catalog):")
+    for row in plan:
+        print("  ", row[-1])
+
+if __name__ == "__main__":
+    main()
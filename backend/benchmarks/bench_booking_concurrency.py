@@ -0,0 +1,77 @@
+"""Concurrent booking stress test: POST /v1/bookings
+
+Fires thousands of overlapping booking requests from many threads at a small set of properties,
+then checks that no two committed bookings overlap and reports the sustained throughput.
+
+    ENVIRONMENT=test python -m benchmarks.bench_booking_concurrency --requests 5000 --threads 32 --properties 20
+"""
+import argparse
+import random
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from sqlalchemy import text
+from benchmarks.common import client_for, drop_engine, print_table, reset_overrides, seed_catalog, temp_engine
+
+DOUBLE_BOOKINGS = text(
+    "SELECT COUNT(*) FROM bookings a JOIN bookings b "
+    "ON a.property_id = b.property_id AND a.booking_id < b.booking_id "
+    "AND a.date_in < b.date_out AND a.date_out > b.date_in"
+)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--properties", type=int, default=20)
+    parser.add_argument("--window-days", type=int, default=60, help="all stays start within this many days")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    hosts = 10
+    engine, path = temp_engine()
+    try:
+        seed_catalog(engine, properties=args.properties, hosts=hosts)
+        client = client_for(engine, role="guest", user_id=hosts + 1)
+
+        rng = random.Random(args.seed)
+        payloads = []
+        for _ in range(args.requests):
+            date_in = date(2026, 1, 1) + timedelta(days=rng.randrange(args.window_days))
+            payloads.append({
+                "property_id": rng.randint(1, args.properties),
+                "date_in": date_in.isoformat(),
+                "date_out": (date_in + timedelta(days=rng.randint(1, 5))).isoformat(),
+            })
+
+        def book(payload):
+            return client.post("/v1/bookings", json=payload).status_code
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as pool:
+            status_codes = Counter(pool.map(book, payloads))
+        elapsed = time.perf_counter() - start
+
+        with engine.connect() as conn:
+            double_bookings = conn.execute(DOUBLE_BOOKINGS).scalar_one()
+            committed = conn.execute(text("SELECT COUNT(*) FROM bookings")).scalar_one()
+    finally:
+        reset_overrides()
+        drop_engine(engine, path)
+
+    print_table([{
+        "requests": args.requests,
+        "threads": args.threads,
+        "created": status_codes[200],
+        "conflicts": status_codes[400],
+        "busy": status_codes[503],
+        "committed": committed,
+        "double_bookings": double_bookings,
+        "req_per_s": args.requests / elapsed,
+    }])
+    assert double_bookings == 0, "overlapping bookings were committed"
+    assert committed == status_codes[200]
+
+if __name__ == "__main__":
+    main()
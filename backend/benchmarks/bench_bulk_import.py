@@ -0,0 +1,84 @@
+"""Bulk import benchmark: POST /v1/properties/bulk vs one POST /v1/properties per listing.
+
+The one-by-one path is timed on a sample and extrapolated to the full import size.
+
+    ENVIRONMENT=test python -m benchmarks.bench_bulk_import --rows 50000 --sample 500
+"""
+import argparse
+import csv
+import io
+import time
+from benchmarks.common import client_for, drop_engine, print_table, reset_overrides, seed_catalog, temp_engine
+
+def listings(count: int, pictures: int, prefix: str):
+    return [
+        {
+            "title": f"{prefix} Listing {i}",
+            "address": f"{i} Import Avenue",
+            "city": "Imported City",
+            "state": "IC",
+            "picture_urls": [f"https://example.com/import/{prefix}/{i}/{position}.jpg" for position in range(pictures)],
+            "latitude": 40 + (i % 1000) / 1000,
+            "longitude": -3 + (i // 1000) / 1000,
+        }
+        for i in range(count)
+    ]
+
+def as_csv(rows) -> str:
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=list(rows[0]))
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({**row, "picture_urls": " ".join(row["picture_urls"])})
+    return out.getvalue()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000, help="listings per import")
+    parser.add_argument("--sample", type=int, default=500, help="listings created one by one")
+    parser.add_argument("--pictures", type=int, default=5, help="pictures per listing")
+    parser.add_argument("--catalog", type=int, default=10000, help="existing listings")
+    parser.add_argument("--async-mode", action="store_true", help="run the app on the async engine")
+    args = parser.parse_args()
+
+    engine, path = temp_engine()
+    rows = []
+    try:
+        seed_catalog(engine, properties=args.catalog)
+        client = client_for(engine, role="host", user_id=1, async_mode=args.async_mode)
+
+        def record(method: str, count: int, seconds: float, created: int):
+            rows.append({"method": method, "rows": count, "created": created, "total_s": seconds,
+                         "rows_per_s": count / seconds, f"est_{args.rows}_s": args.rows * seconds / count})
+
+        start = time.perf_counter()
+        created = 0
+        for listing in listings(args.sample, args.pictures, "single"):
+            response = client.post("/v1/properties", json=listing)
+            assert response.status_code == 200, response.text
+            created += 1
+        record("POST /v1/properties x N", args.sample, time.perf_counter() - start, created)
+
+        for method, kwargs in [
+            ("bulk JSON", {"json": listings(args.rows, args.pictures, "json")}),
+            ("bulk CSV upload", {"files": {"file": ("listings.csv", as_csv(listings(args.rows, args.pictures, "csv")), "text/csv")}}),
+        ]:
+            start = time.perf_counter()
+            response = client.post("/v1/properties/bulk", **kwargs)
+            seconds = time.perf_counter() - start
+            assert response.status_code == 200, response.text
+            record(method, args.rows, seconds, response.json()["created"])
+
+        # everything again: all duplicates, found by the set-based check
+        start = time.perf_counter()
+        response = client.post("/v1/properties/bulk", json=listings(args.rows, args.pictures, "json"))
+        assert response.status_code == 200 and response.json()["duplicates"] == args.rows
+        record("bulk JSON, all duplicates", args.rows, time.perf_counter() - start, response.json()["created"])
+    finally:
+        reset_overrides()
+        drop_engine(engine, path)
+
+    print_table(rows)
+
+if __name__ == "__main__":
+    main()
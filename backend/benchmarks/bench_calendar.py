@@ -0,0 +1,62 @@
+"""Availability calendar benchmark: GET /{id}/calendar vs the full GET /{id}/bookings list.
+
+Properties get a long booking history, so the unfiltered list grows with it while the calendar
+only scans the nights of its window. The calendar is timed without and with the month cache.
+
+    ENVIRONMENT=test python -m benchmarks.bench_calendar --size 1000 --bookings 200 --days 90
+"""
+import argparse
+import random
+from datetime import date, timedelta
+from app.core import calendar
+from app.routes import property as property_routes
+from benchmarks.common import client_for, drop_engine, measure, print_table, reset_overrides, seed_catalog, temp_engine
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1000, help="catalog size")
+    parser.add_argument("--bookings", type=int, default=200, help="bookings per property (about 8 years of history at 200)")
+    parser.add_argument("--days", type=int, default=90, help="calendar window")
+    parser.add_argument("--repeat", type=int, default=300)
+    args = parser.parse_args()
+
+    original_cache = property_routes.calendar_cache
+    engine, path = temp_engine()
+    rows = []
+    try:
+        seed_catalog(engine, properties=args.size, bookings_per_property=args.bookings)
+        client = client_for(engine)
+        rng = random.Random(7)
+        history_days = args.bookings * 15 # seed_catalog leaves 4.5 + 7 days per booking on average
+        requests = []
+        for _ in range(args.repeat):
+            start = date(2025, 1, 1) + timedelta(days=rng.randrange(history_days))
+            requests.append((rng.randint(1, args.size), {"from": start.isoformat(), "to": (start + timedelta(days=args.days)).isoformat()}))
+
+        def run(label, path, with_window=True):
+            pending = iter(requests)
+            sizes = []
+
+            def get():
+                property_id, window = next(pending)
+                response = client.get(f"/v1/properties/{property_id}/{path}", params=window if with_window else None)
+                assert response.status_code == 200, response.text
+                sizes.append(len(response.content))
+
+            rows.append({"endpoint": label, **measure(get, repeat=args.repeat, warmup=0), "bytes": sum(sizes) // len(sizes)})
+
+        run("bookings (full history)", "bookings", with_window=False)
+        property_routes.calendar_cache = calendar.CalendarCache(0, 0)
+        run("calendar, no cache", "calendar")
+        property_routes.calendar_cache = calendar.CalendarCache(args.size, 3600)
+        run("calendar, cold cache", "calendar")
+        run("calendar, warm cache", "calendar") # the same requests again: every month is a hit
+    finally:
+        property_routes.calendar_cache = original_cache
+        reset_overrides()
+        drop_engine(engine, path)
+
+    print_table(rows)
+
+if __name__ == "__main__":
+    main()
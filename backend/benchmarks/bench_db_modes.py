@@ -0,0 +1,69 @@
+"""Sync vs async database mode under concurrency.
+
+Drives GET /v1/properties and GET /v1/properties/{id} in-process (httpx ASGI transport) with many
+concurrent clients, once with DATABASE_ASYNC=false (sync engine in the threadpool) and once with
+DATABASE_ASYNC=true (AsyncSession), and reports requests/sec and tail latency for each.
+
+    ENVIRONMENT=test python -m benchmarks.bench_db_modes --concurrency 50,200 --requests 4000
+"""
+import argparse
+import asyncio
+import random
+import time
+import httpx
+from benchmarks.common import bind_app, dispose_async_engines, drop_engine, percentile, print_table, reset_overrides, seed_catalog, temp_engine
+
+async def drive(app, properties: int, requests: int, concurrency: int):
+    rng = random.Random(1)
+    paths = [
+        "/v1/properties?limit=20" if rng.random() < 0.5 else f"/v1/properties/{rng.randint(1, properties)}"
+        for _ in range(requests)
+    ]
+    timings = []
+    queue = iter(paths)
+
+    async def worker(client: httpx.AsyncClient):
+        for path in queue:
+            start = time.perf_counter()
+            response = await client.get(path)
+            timings.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200, response.text
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    await dispose_async_engines()
+
+    timings.sort()
+    return {
+        "req_per_s": requests / elapsed,
+        "p50_ms": percentile(timings, 0.50),
+        "p99_ms": percentile(timings, 0.99),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--properties", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", default="10,100", help="comma separated concurrency levels")
+    args = parser.parse_args()
+
+    engine, path = temp_engine()
+    rows = []
+    try:
+        seed_catalog(engine, properties=args.properties)
+        for concurrency in [int(c) for c in args.concurrency.split(",")]:
+            for async_mode in (False, True):
+                app = bind_app(engine, async_mode=async_mode)
+                stats = asyncio.run(drive(app, args.properties, args.requests, concurrency))
+                rows.append({"mode": "async" if async_mode else "sync", "concurrency": concurrency, **stats})
+    finally:
+        reset_overrides()
+        drop_engine(engine, path)
+
+    print_table(rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Conditional GET benchmark: full responses vs 304 Not Modified.
+
+Times GET /v1/properties (one page) and GET /v1/properties/{id} with and without a matching
+If-None-Match, and reports the bytes sent per response.
+
+    ENVIRONMENT=test python -m benchmarks.bench_etag --size 100000 --limit 100
+"""
+import argparse
+from benchmarks.common import client_for, drop_engine, measure, print_table, reset_overrides, seed_catalog, temp_engine
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100000, help="catalog size")
+    parser.add_argument("--limit", type=int, default=100, help="browse page size")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    engine, path = temp_engine()
+    rows = []
+    try:
+        seed_catalog(engine, properties=args.size)
+        client = client_for(engine)
+        endpoints = {
+            "browse": ("/v1/properties", {"limit": args.limit}),
+            "details": (f"/v1/properties/{args.size // 2}", {}),
+        }
+        for name, (url, params) in endpoints.items():
+            etag = client.get(url, params=params).headers["ETag"]
+            for mode, headers in [("full", {}), ("304", {"If-None-Match": etag})]:
+                sizes = []
+
+                def get():
+                    response = client.get(url, params=params, headers=headers)
+                    assert response.status_code == (304 if headers else 200), response.text
+                    sizes.append(len(response.content))
+
+                stats = measure(get, repeat=args.repeat)
+                rows.append({"endpoint": name, "response": mode, "bytes": sizes[-1], **stats})
+    finally:
+        reset_overrides()
+        drop_engine(engine, path)
+
+    print_table(rows)
+
+if __name__ == "__main__":
+    main()
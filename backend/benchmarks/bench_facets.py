@@ -0,0 +1,53 @@
+"""Facet counts benchmark: GET /v1/properties/facets vs the GROUP BY it replaces.
+
+The endpoint reads the maintained property_facets rows, so its latency should stay flat
+as the catalog grows while the GROUP BY over properties grows with it.
+
+    ENVIRONMENT=test python -m benchmarks.bench_facets --sizes 10000,100000,500000
+"""
+import argparse
+import time
+from sqlalchemy import text
+from benchmarks.common import bind_app, client_for, drop_engine, measure, print_table, reset_overrides, seed_catalog, temp_engine
+
+GROUP_BY = "SELECT state, city, COUNT(*) FROM properties GROUP BY state, city"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000,500000", help="comma separated catalog sizes")
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    rows = []
+    for size in [int(s) for s in args.sizes.split(",")]:
+        engine, path = temp_engine()
+        try:
+            seed_catalog(engine, properties=size, pictures_per_property=1)
+            client = client_for(engine)
+
+            def facets():
+                response = client.get("/v1/properties/facets")
+                assert response.status_code == 200, response.text
+
+            with engine.connect() as conn:
+                group_by = measure(lambda: conn.execute(text(GROUP_BY)).all(), repeat=max(5, args.repeat // 10))
+            # an incremental update, as paid by create_property / delete_property
+            bind_app(engine, role="host", user_id=1)
+            start = time.perf_counter()
+            for n in range(20):
+                assert client.post("/v1/properties", json={
+                    "title": f"Bench facet {n}", "address": "1 Bench Street", "city": "City 7", "state": "S7", "picture_urls": []
+                }).status_code == 200
+            create_ms = (time.perf_counter() - start) * 1000 / 20
+            bind_app(engine)
+
+            rows.append({"properties": size, "endpoint_p50_ms": measure(facets, repeat=args.repeat)["p50_ms"],
+                         "group_by_p50_ms": group_by["p50_ms"], "create_property_ms": create_ms})
+        finally:
+            reset_overrides()
+            drop_engine(engine, path)
+
+    print_table(rows)
+
+if __name__ == "__main__":
+    main()
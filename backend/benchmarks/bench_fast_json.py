@@ -0,0 +1,83 @@
+"""Fast JSON responses benchmark: list endpoints with FAST_JSON_RESPONSES off and on.
+
+The card cache is warm, so the difference is the response path: response_model validation +
+serialization + json.dumps vs FastJSONResponse (orjson). Requests go straight to the ASGI app
+(no TestClient thread hop) to keep the framework overhead out of the numbers as much as possible;
+`render_ms` is the serialization of one response alone.
+
+    ENVIRONMENT=test python -m benchmarks.bench_fast_json --size 20000 --limit 100
+"""
+import argparse
+import asyncio
+import time
+import httpx
+from fastapi.responses import JSONResponse
+from app.core.config import settings
+from app.core.responses import FastJSONResponse
+from app.schemas.property import PropertyPage
+from benchmarks.common import bind_app, drop_engine, print_table, reset_overrides, seed_catalog, summarize, temp_engine
+
+async def timings(app, url, params, repeat):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for _ in range(10):
+            assert (await client.get(url, params=params)).status_code == 200
+        result = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            await client.get(url, params=params)
+            result.append((time.perf_counter() - start) * 1000)
+        return result
+
+async def fetch_json(app, url, params):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        return (await client.get(url, params=params)).json()
+
+def render_ms(render, repeat=200):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        render()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=20000, help="catalog size")
+    parser.add_argument("--limit", type=int, default=100, help="page size")
+    parser.add_argument("--repeat", type=int, default=300)
+    args = parser.parse_args()
+
+    original = settings.fast_json_responses
+    engine, path = temp_engine()
+    rows, render_rows = [], []
+    try:
+        seed_catalog(engine, properties=args.size)
+        app = bind_app(engine)
+        endpoints = {
+            "browse": ("/v1/properties", {"limit": args.limit}),
+            "nearby": ("/v1/properties/nearby", {"lat": 45, "lng": 5, "radius_km": 100, "limit": args.limit}),
+            "details": ("/v1/properties/1", {}),
+        }
+        for name, (url, params) in endpoints.items():
+            for fast in [False, True]:
+                settings.fast_json_responses = fast
+                stats = summarize(asyncio.run(timings(app, url, params, args.repeat)))
+                rows.append({"endpoint": name, "fast_json": fast, **stats})
+
+        # serialization of one browse page alone: what FastAPI does with the returned page vs FastJSONResponse
+        page = PropertyPage.model_validate(asyncio.run(fetch_json(app, "/v1/properties", {"limit": args.limit})))
+        render = [
+            ("response_model", lambda: JSONResponse(PropertyPage.model_validate(page).model_dump(mode="json"))),
+            ("fast_json", lambda: FastJSONResponse(page)),
+        ]
+        for label, fn in render:
+            render_rows.append({"serializer": label, "render_ms": render_ms(fn)})
+    finally:
+        settings.fast_json_responses = original
+        reset_overrides()
+        drop_engine(engine, path)
+
+    print_table(rows)
+    print()
+    print_table(render_rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Radius search benchmark: GET /v1/properties/nearby?lat=&lng=&radius_km=
+
+Times the grid-cell lookup around city centers (dense) and between cities (sparse) for a few radii
+on catalogs of increasing size.
+
+    ENVIRONMENT=test python -m benchmarks.bench_geo --sizes 10000,100000,1000000
+"""
+import argparse
+import itertools
+import time
+from benchmarks.common import CITY_CENTERS, client_for, drop_engine, measure, print_table, reset_overrides, seed_catalog, temp_engine
+
+RADII_KM = [2, 10, 50]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000", help="comma separated catalog sizes")
+    parser.add_argument("--repeat", type=int, default=60)
+    args = parser.parse_args()
+
+    centers = list(CITY_CENTERS.values())[:20]
+    points = {
+        "city": centers,
+        "between": [(latitude + 0.7, longitude + 0.7) for latitude, longitude in centers],
+    }
+    rows = []
+    for size in [int(s) for s in args.sizes.split(",")]:
+        engine, path = temp_engine()
+        try:
+            start = time.perf_counter()
+            seed_catalog(engine, properties=size)
+            seed_seconds = time.perf_counter() - start
+            client = client_for(engine)
+
+            for label, locations in points.items():
+                for radius_km in RADII_KM:
+                    cycle = itertools.cycle(locations)
+
+                    def nearby():
+                        latitude, longitude = next(cycle)
+                        response = client.get("/v1/properties/nearby", params={
+                            "lat": latitude, "lng": longitude, "radius_km": radius_km, "limit": 20
+                        })
+                        assert response.status_code == 200, response.text
+
+                    stats = measure(nearby, repeat=args.repeat)
+                    rows.append({"properties": size, "where": label, "radius_km": radius_km, "seed_s": seed_seconds, **stats})
+        finally:
+            reset_overrides()
+            drop_engine(engine, path)
+
+    print_table(rows)
+
+if __name__ == "__main__":
+    main()
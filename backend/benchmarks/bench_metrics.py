@@ -0,0 +1,64 @@
+"""Metrics middleware overhead: RouteMetrics.record alone, then a request with and without the middleware.
+
+Requests are driven straight through the ASGI interface (no HTTP client in the way), against the
+app's router so the only difference between the two columns is MetricsMiddleware.
+
+    ENVIRONMENT=test python -m benchmarks.bench_metrics --requests 20000
+"""
+import argparse
+import asyncio
+import time
+from app.core.metrics import MetricsMiddleware, RouteMetrics
+from app.main import app
+from benchmarks.common import print_table
+
+def scope_for(path: str) -> dict:
+    return {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+            "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"", "headers": [],
+            "client": ("127.0.0.1", 1234), "server": ("testserver", 80)} # no "app": the router answers 404s itself
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+async def send(message):
+    pass
+
+async def drive(asgi_app, path: str, requests: int) -> float:
+    # mean microseconds per request
+    for _ in range(200):
+        await asgi_app(scope_for(path), receive, send)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await asgi_app(scope_for(path), receive, send)
+    return (time.perf_counter() - start) * 1e6 / requests
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--routes", type=int, default=50, help="distinct series in the registry while recording")
+    args = parser.parse_args()
+
+    registry = RouteMetrics()
+    routes = [f"/v1/route{n}/{{item_id}}" for n in range(args.routes)]
+    for route in routes:
+        registry.record("GET", route, 200, 0.001)
+    start = time.perf_counter()
+    for n in range(args.requests):
+        registry.record("GET", routes[n % args.routes], 200, 0.0123)
+    record_us = (time.perf_counter() - start) * 1e6 / args.requests
+    start = time.perf_counter()
+    registry.render()
+    render_ms = (time.perf_counter() - start) * 1000
+
+    rows = []
+    # /ping is a sync endpoint (threadpool hop), an unmatched path is answered on the event loop
+    for path in ["/ping", "/no/such/route"]:
+        bare = asyncio.run(drive(app.router, path, args.requests))
+        wrapped = asyncio.run(drive(MetricsMiddleware(app.router, RouteMetrics()), path, args.requests))
+        rows.append({"request": f"GET {path}", "without_us": bare, "with_us": wrapped, "overhead_us": wrapped - bare})
+    print_table(rows)
+    print(f"record(): {record_us:.2f}us per request over {args.routes} routes")
+    print(f"render() of {args.routes} routes: {render_ms:.2f}ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Picture loading benchmark: list pages with every picture vs thumbnails only.
+
+Runs with the property card cache disabled, so each request builds its cards from
+properties + property_pictures, and once with it enabled for comparison.
+
+    ENVIRONMENT=test python -m benchmarks.bench_pictures --size 100000 --limit 100
+"""
+import argparse
+import asyncio
+import random
+from app.core.property_cache import InMemoryPropertyCache, NullPropertyCache
+from app.routes import property as property_routes
+from benchmarks.common import client_for, drop_engine, measure, print_table, reset_overrides, seed_catalog, temp_engine
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100000, help="catalog size")
+    parser.add_argument("--limit", type=int, default=100, help="browse page size")
+    parser.add_argument("--pictures", type=int, default=5, help="mean pictures per property")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    original_cache = property_routes.property_cache
+    engine, path = temp_engine()
+    rows = []
+    try:
+        seed_catalog(engine, properties=args.size, pictures_per_property=args.pictures)
+        client = client_for(engine)
+        rng = random.Random(7)
+        pages = args.size // args.limit
+
+        for label, cache in [("none", NullPropertyCache()), ("memory", InMemoryPropertyCache(10000, 60))]:
+            property_routes.property_cache = cache
+            for max_pictures in [None, 1]:
+                sizes = []
+
+                def browse():
+                    params = {"limit": args.limit, "cursor": property_routes.encode_cursor(rng.randrange(min(pages, 50)) * args.limit)}
+                    if max_pictures is not None:
+                        params["max_pictures"] = max_pictures
+                    response = client.get("/v1/properties", params=params)
+                    assert response.status_code == 200, response.text
+                    sizes.append(len(response.content))
+
+                stats = measure(browse, repeat=args.repeat)
+                rows.append({"cache": label, "max_pictures": max_pictures or "all", "bytes": sum(sizes) // len(sizes), **stats})
+            asyncio.run(cache.clear())
+    finally:
+        property_routes.property_cache = original_cache
+        reset_overrides()
+        drop_engine(engine, path)
+
+    print_table(rows)
+
+if __name__ == "__main__":
+    main()
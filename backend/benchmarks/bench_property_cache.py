@@ -0,0 +1,58 @@
+"""Property card cache benchmark: browse pages and details with and without the cache.
+
+Pages are drawn at random from the first `--hot-pages` pages of the catalog, so the hit ratio
+reflects a realistic working set rather than a single repeated URL (ETags are not sent).
+
+    ENVIRONMENT=test python -m benchmarks.bench_property_cache --size 100000 --limit 100
+"""
+import argparse
+import asyncio
+import random
+from app.core.property_cache import InMemoryPropertyCache, NullPropertyCache
+from app.routes import property as property_routes
+from benchmarks.common import client_for, drop_engine, measure, print_table, reset_overrides, seed_catalog, temp_engine
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100000, help="catalog size")
+    parser.add_argument("--limit", type=int, default=100, help="browse page size")
+    parser.add_argument("--hot-pages", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=300)
+    args = parser.parse_args()
+
+    original_cache = property_routes.property_cache
+    engine, path = temp_engine()
+    rows = []
+    try:
+        seed_catalog(engine, properties=args.size)
+        client = client_for(engine)
+        rng = random.Random(7)
+        hot_ids = range(1, args.hot_pages * args.limit + 1)
+
+        for label, cache in [("none", NullPropertyCache()), ("memory", InMemoryPropertyCache(10000, 60))]:
+            property_routes.property_cache = cache
+
+            def browse():
+                # cursor of page n is the last id of page n-1
+                page = rng.randrange(args.hot_pages)
+                params = {"limit": args.limit}
+                if page:
+                    params["cursor"] = property_routes.encode_cursor(page * args.limit)
+                assert client.get("/v1/properties", params=params).status_code == 200
+
+            def details():
+                assert client.get(f"/v1/properties/{rng.choice(hot_ids)}").status_code == 200
+
+            for name, fn in [("browse", browse), ("details", details)]:
+                stats = measure(fn, repeat=args.repeat, warmup=50)
+                rows.append({"cache": label, "endpoint": name, **stats, "hit_ratio": cache.stats.snapshot()["hit_ratio"]})
+            asyncio.run(cache.clear())
+    finally:
+        property_routes.property_cache = original_cache
+        reset_overrides()
+        drop_engine(engine, path)
+
+    print_table(rows)
+
+if __name__ == "__main__":
+    main()
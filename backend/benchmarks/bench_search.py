@@ -0,0 +1,54 @@
+"""Full-text search benchmark: GET /v1/properties/search?q=
+
+Times ranked search on catalogs of increasing size, with the SQLite FTS5 index and with the
+in-memory inverted index used on other databases (its one-off build time is reported separately).
+
+    ENVIRONMENT=test python -m benchmarks.bench_search --sizes 10000,100000,1000000
+"""
+import argparse
+import itertools
+import time
+from app.core.search import InMemorySearchIndex
+from app.routes import property as property_routes
+from benchmarks.common import client_for, drop_engine, measure, print_table, reset_overrides, seed_catalog, temp_engine
+
+QUERIES = ["cozy cabin", "villa pool", "city 7", "lux", "historic loft old town", "s12"]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000", help="comma separated catalog sizes")
+    parser.add_argument("--repeat", type=int, default=60)
+    args = parser.parse_args()
+
+    original_index = property_routes.search_index
+    rows = []
+    for size in [int(s) for s in args.sizes.split(",")]:
+        engine, path = temp_engine()
+        try:
+            start = time.perf_counter()
+            seed_catalog(engine, properties=size)
+            seed_seconds = time.perf_counter() - start
+            client = client_for(engine)
+
+            for label, index in [("fts5", original_index), ("memory", InMemorySearchIndex())]:
+                property_routes.search_index = index
+                queries = itertools.cycle(QUERIES)
+
+                def search():
+                    response = client.get("/v1/properties/search", params={"q": next(queries), "limit": 20})
+                    assert response.status_code == 200, response.text
+
+                start = time.perf_counter()
+                search() # builds the in-memory index
+                first_ms = (time.perf_counter() - start) * 1000
+                stats = measure(search, repeat=args.repeat)
+                rows.append({"index": label, "properties": size, "seed_s": seed_seconds, "first_query_ms": first_ms, **stats})
+        finally:
+            property_routes.search_index = original_index
+            reset_overrides()
+            drop_engine(engine, path)
+
+    print_table(rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Cold start benchmark: time from spawning a uvicorn worker to its first successful request.
+
+Each run starts a fresh `uvicorn app.main:app` process and polls GET /ping until it answers, then
+reads the worker's own breakdown from GET /internal/startup (imports, engines, routers, schema).
+The first run is against an empty database file (every migration applied); the others find
+the schema up to date, which is what a worker scaled out next to running ones sees.
+
+    ENVIRONMENT=test python -m benchmarks.bench_startup --runs 10
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import httpx
+from benchmarks.common import print_table
+from benchmarks.loadtest import free_port
+
+def cold_start(database_url: str) -> dict:
+    port = free_port()
+    env = {**os.environ, "DATABASE_URL": database_url, "DATABASE_ECHO": "false"}
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"], env=env
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        with httpx.Client(base_url=base_url, trust_env=False) as client:
+            while True:
+                try:
+                    if client.get("/ping").status_code == 200:
+                        break
+                except httpx.TransportError:
+                    pass
+                if server.poll() is not None or time.perf_counter() - start > 60:
+                    raise RuntimeError("uvicorn did not start")
+                time.sleep(0.005)
+            first_request_ms = (time.perf_counter() - start) * 1000
+            return {"first_request_ms": first_request_ms, **client.get("/internal/startup").json()}
+    finally:
+        server.terminate()
+        server.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="starts with the schema up to date")
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(prefix="bench_", suffix=".sqlite3")
+    os.close(fd)
+    os.remove(path) # empty database: the first start creates the schema
+    database_url = f"sqlite:///{path}"
+    try:
+        fresh = cold_start(database_url)
+        warm = [cold_start(database_url) for _ in range(args.runs)]
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+    columns = ["first_request_ms", "total_ms", "imports_ms", "engines_ms", "routers_ms", "schema_ms"]
+    rows = [{"start": "fresh database", **{name: fresh.get(name, 0.0) for name in columns}}]
+    rows.append({"start": f"up to date (median of {args.runs})",
+                 **{name: statistics.median(run.get(name, 0.0) for run in warm) for name in columns}})
+    rows.append({"start": "up to date (best)", **{name: min(run.get(name, 0.0) for run in warm) for name in columns}})
+    print_table(rows)
+    print("first_request_ms includes the interpreter and uvicorn start, total_ms only the app's own phases")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""Shared helpers for the benchmarks.
+
+Benchmarks run against a throw-away SQLite file, never against the app database.
+Run them from the backend folder, e.g. `ENVIRONMENT=test python -m benchmarks.bench_availability`.
+"""
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Sequence
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import create_engine
+from app.main import app
+from app.core.facets import rebuild_facets
+from app.core.geo import cell_id
+from app.core.db import async_database_url, engine_options, get_async_session, get_session_factory, session_dependency, session_factory
+from app.core.dependencies import get_current_user
+from app.core.migrations import run_migrations
+from app.core.security import hash_password
+from app.models.user import User
+from app.models.property import Property
+from app.models.property_picture import PropertyPicture
+from app.models.booking import Booking
+from app.models.booking_night import BookingNight, nights_between
+
+CITIES = [(f"City {i}", f"S{i % 50}") for i in range(200)]
+ADJECTIVES = ["Cozy", "Sunny", "Modern", "Rustic", "Quiet", "Charming", "Spacious", "Bright", "Historic", "Luxury"]
+KINDS = ["Apartment", "Loft", "Cabin", "Villa", "Studio", "Cottage", "House", "Penthouse", "Bungalow", "Chalet"]
+# city centers spread over a ~20 x 30 degree region, listings cluster around them
+CITY_CENTERS = {city: (random.Random(i).uniform(35, 55), random.Random(-i).uniform(-10, 20)) for i, (city, _) in enumerate(CITIES)}
+FEATURES = ["with Pool", "near Beach", "in Old Town", "with Garden", "by the Lake", "with View", "downtown", "near Park"]
+
+def temp_engine():
+    fd, path = tempfile.mkstemp(prefix="bench_", suffix=".sqlite3")
+    os.close(fd)
+    url = f"sqlite:///{path}"
+    engine = create_engine(url, **engine_options(url))
+    run_migrations(engine)
+    return engine, path
+
+def drop_engine(engine, path: str):
+    engine.dispose()
+    os.remove(path)
+
+def batched(rows: List[dict], size: int):
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+def seed_catalog(engine, properties: int, bookings_per_property: int = 0, hosts: int = 100, seed: int = 42,
+                 batch_size: int = 5000, pictures_per_property: int = 5, guests: int = 1):
+    """Insert hosts (ids 1..hosts), guests (the next ids), `properties` listings (1 to 2 * pictures_per_property - 1
+    pictures each) and non-overlapping bookings (with their booking_nights) with core inserts.
+
+    Every user's password is "password123"; the first guest is guest@bench.local, the others guest<i>@bench.local.
+    """
+    rng = random.Random(seed)
+    password = hash_password("password123")
+    with engine.begin() as conn:
+        conn.execute(insert(User.__table__), [
+            {"name": f"Host {i}", "email": f"host{i}@bench.local", "hashed_password": password, "role": "host"}
+            for i in range(hosts)
+        ] + [
+            {"name": f"Guest {i}", "email": f"guest{i or ''}@bench.local", "hashed_password": password, "role": "guest"}
+            for i in range(guests)
+        ])
+
+        property_rows = []
+        for i in range(properties):
+            city, state = rng.choice(CITIES)
+            center_latitude, center_longitude = CITY_CENTERS[city]
+            latitude = center_latitude + rng.gauss(0, 0.05)
+            longitude = center_longitude + rng.gauss(0, 0.05)
+            property_rows.append({
+                "host_id": rng.randint(1, hosts),
+                "title": f"{rng.choice(ADJECTIVES)} {rng.choice(KINDS)} {rng.choice(FEATURES)} {i}",
+                "address": f"{i} Bench Street",
+                "city": city,
+                "state": state,
+                "latitude": latitude,
+                "longitude": longitude,
+                "geo_cell": cell_id(latitude, longitude),
+            })
+        for chunk in batched(property_rows, batch_size):
+            conn.execute(insert(Property.__table__), chunk)
+
+        picture_rows = [
+            {"property_id": property_id, "position": position, "url": f"https://example.com/bench/{property_id}/{position}.jpg"}
+            for property_id in range(1, properties + 1)
+            for position in range(rng.randint(1, max(1, 2 * pictures_per_property - 1)))
+        ]
+        for chunk in batched(picture_rows, batch_size):
+            conn.execute(insert(PropertyPicture.__table__), chunk)
+
+        first_guest_id = hosts + 1
+        booking_rows = []
+        for property_id in range(1, properties + 1):
+            day = date(2025, 1, 1) + timedelta(days=rng.randint(0, 30))
+            for _ in range(bookings_per_property):
+                nights = rng.randint(1, 7)
+                booking_rows.append({
+                    "guest_id": first_guest_id if guests == 1 else first_guest_id + rng.randrange(guests),
+                    "property_id": property_id,
+                    "date_in": day,
+                    "date_out": day + timedelta(days=nights),
+                })
+                day += timedelta(days=nights + rng.randint(0, 14))
+        for chunk in batched(booking_rows, batch_size):
+            conn.execute(insert(Booking.__table__), chunk)
+
+        # booking ids are 1..n in insertion order on the fresh database
+        night_rows = [
+            {"property_id": booking["property_id"], "night": night, "booking_id": booking_id}
+            for booking_id, booking in enumerate(booking_rows, start=1)
+            for night in nights_between(booking["date_in"], booking["date_out"])
+        ]
+        for chunk in batched(night_rows, batch_size):
+            conn.execute(insert(BookingNight.__table__), chunk)
+
+        rebuild_facets(conn) # core inserts bypass the routes that keep the counts
+
+_async_engines = []
+
+def bind_app(engine, role: str = "guest", user_id: int = 1, async_mode: bool = False, fake_auth: bool = True):
+    """Point the app at `engine` (sync or async mode), authenticated as a fake user (auth is not what we measure)
+    unless `fake_auth` is off: requests then need a real bearer token."""
+    async_engine = None
+    if async_mode:
+        url = engine.url.render_as_string(hide_password=False)
+        async_engine = create_async_engine(async_database_url(url), **engine_options(url, async_mode=True))
+        _async_engines.append(async_engine)
+
+    open_session = session_factory(engine, async_engine)
+    app.dependency_overrides[get_async_session] = session_dependency(open_session)
+    app.dependency_overrides[get_session_factory] = lambda: open_session
+    if fake_auth:
+        app.dependency_overrides[get_current_user] = lambda: {"user_id": user_id, "role": role}
+    return app
+
+def client_for(engine, role: str = "guest", user_id: int = 1, async_mode: bool = False) -> TestClient:
+    return TestClient(bind_app(engine, role, user_id, async_mode))
+
+def reset_overrides():
+    app.dependency_overrides.clear()
+
+async def dispose_async_engines():
+    # must run on the loop that used them: aiosqlite connections are non-daemon threads
+    while _async_engines:
+        await _async_engines.pop().dispose()
+
+def measure(fn: Callable[[], object], repeat: int = 50, warmup: int = 5) -> Dict[str, float]:
+    for _ in range(warmup):
+        fn()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return summarize(timings)
+
+def percentile(sorted_timings: List[float], fraction: float) -> float:
+    return sorted_timings[min(len(sorted_timings) - 1, int(len(sorted_timings) * fraction))]
+
+def summarize(timings: List[float]) -> Dict[str, float]:
+    timings = sorted(timings)
+    return {
+        "mean_ms": statistics.fmean(timings),
+        "p50_ms": percentile(timings, 0.50),
+        "p95_ms": percentile(timings, 0.95),
+    }
+
+def print_table(rows: Sequence[Dict[str, object]]):
+    if not rows:
+        return
+    columns = list(rows[0].keys())
+    cells = [[f"{row[c]:.3f}" if isinstance(row[c], float) else str(row[c]) for c in columns] for row in rows]
+    widths = [max(len(c), *(len(r[i]) for r in cells)) for i, c in enumerate(columns)]
+    print("  ".join(c.rjust(w) for c, w in zip(columns, widths)))
+    for r in cells:
+        print("  ".join(v.rjust(w) for v, w in zip(r, widths)))
@@ -0,0 +1,212 @@
+"""Synthetic dataset generator: users, properties (with pictures) and bookings at production scale.
+
+Data is skewed like real traffic: a few cities hold most listings (Zipf), a few hosts own most of
+them and a few guests make most bookings (Pareto), stays are mostly short. Bookings of a property
+never overlap and come with their booking_nights claims, as if made through create_booking.
+
+Rows are generated batch by batch and written with Core executemany inserts, so memory stays flat
+however many millions are asked for. Ids are assigned here, after the ones already in the database,
+and the same --seed gives the same data. Facet counts are rebuilt and the catalog version bumped
+at the end, as the rows bypass the routes that maintain them.
+
+The target database must be given explicitly (it is never the app's DATABASE_URL by default):
+
+    ENVIRONMENT=test python -m benchmarks.generate_dataset --database-url sqlite:///./database/scale.sqlite3 \\
+        --users 1000000 --hosts 50000 --properties 500000 --bookings-per-property 8
+"""
+import argparse
+import random
+import time
+from bisect import bisect
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import Dict, Iterator, List, Tuple
+from sqlalchemy import func, insert, select, text
+from sqlmodel import create_engine
+from app.core.db import engine_options
+from app.core.facets import rebuild_facets
+from app.core.geo import cell_id
+from app.core.migrations import run_migrations
+from app.core.security import hash_password
+from app.models.booking import Booking
+from app.models.booking_night import BookingNight
+from app.models.property import Property
+from app.models.property_picture import PropertyPicture
+from app.models.user import User
+from benchmarks.common import ADJECTIVES, FEATURES, KINDS, print_table
+
+# (city, state, latitude, longitude): the most popular first, then synthetic towns up to --cities
+REAL_CITIES = [
+    ("Lisbon", "PT", 38.72, -9.14), ("Paris", "FR", 48.86, 2.35), ("Barcelona", "ES", 41.39, 2.17),
+    ("Rome", "IT", 41.90, 12.50), ("London", "UK", 51.51, -0.13), ("Amsterdam", "NL", 52.37, 4.90),
+    ("Porto", "PT", 41.15, -8.61), ("Madrid", "ES", 40.42, -3.70), ("Berlin", "DE", 52.52, 13.40),
+    ("Prague", "CZ", 50.08, 14.44), ("Vienna", "AT", 48.21, 16.37), ("Florence", "IT", 43.77, 11.26),
+    ("Seville", "ES", 37.39, -5.98), ("Nice", "FR", 43.70, 7.27), ("Munich", "DE", 48.14, 11.58),
+    ("Dublin", "IE", 53.35, -6.26), ("Budapest", "HU", 47.50, 19.04), ("Athens", "GR", 37.98, 23.73),
+    ("Venice", "IT", 45.44, 12.32), ("Copenhagen", "DK", 55.68, 12.57), ("Edinburgh", "UK", 55.95, -3.19),
+    ("Krakow", "PL", 50.06, 19.94), ("Valencia", "ES", 39.47, -0.38), ("Milan", "IT", 45.46, 9.19),
+    ("Brussels", "BE", 50.85, 4.35), ("Stockholm", "SE", 59.33, 18.07), ("Lyon", "FR", 45.76, 4.84),
+    ("Naples", "IT", 40.85, 14.27), ("Faro", "PT", 37.02, -7.93), ("Split", "HR", 43.51, 16.44),
+]
+STREETS = ["Main Street", "Harbour Road", "Old Town Lane", "Park Avenue", "Station Road", "Market Square", "Hill Street"]
+PASSWORD = "password123"
+
+def cities(count: int, rng: random.Random) -> List[Tuple[str, str, float, float]]:
+    found = REAL_CITIES[:count]
+    for i in range(len(found), count):
+        found.append((f"Town {i}", f"R{i % 40}", rng.uniform(36, 58), rng.uniform(-9, 24)))
+    return found
+
+def zipf_cumulative(count: int, exponent: float) -> List[float]:
+    # rank r gets weight 1 / r^exponent: the first few take most of the mass
+    return list(accumulate(1 / rank ** exponent for rank in range(1, count + 1)))
+
+def pareto_cumulative(count: int, alpha: float, rng: random.Random, cap: float = 100) -> List[float]:
+    # heavy tail: a few entries get many times the weight of the median one, but at most `cap` times
+    # the smallest, so one outlier draw can't take a sizeable share of a small dataset
+    return list(accumulate(min(cap, rng.paretovariate(alpha)) for _ in range(count)))
+
+def pick(cumulative: List[float], rng: random.Random) -> int:
+    return bisect(cumulative, rng.random() * cumulative[-1])
+
+def batches(rows: Iterator[dict], size: int) -> Iterator[List[dict]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class Generator:
+    def __init__(self, args, first_ids: Dict[str, int]):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.first_ids = first_ids
+        self.cities = cities(args.cities, self.rng)
+        self.city_weights = zipf_cumulative(len(self.cities), args.city_skew)
+        self.host_weights = pareto_cumulative(args.hosts, args.host_skew, self.rng)
+        self.guest_weights = pareto_cumulative(args.users - args.hosts, args.guest_skew, self.rng)
+        self.hashed_password = hash_password(PASSWORD) # one bcrypt for everyone, it's the slow part of a user
+        self.next_booking_id = first_ids["bookings"]
+
+    def users(self) -> Iterator[dict]:
+        # hosts first, then guests: ids are contiguous per role
+        for offset in range(self.args.users):
+            user_id = self.first_ids["users"] + offset
+            role = "host" if offset < self.args.hosts else "guest"
+            yield {"user_id": user_id, "name": f"{role.title()} {user_id}", "email": f"{role}{user_id}@example.com",
+                   "hashed_password": self.hashed_password, "role": role}
+
+    def property_batch(self, first_offset: int, count: int) -> Tuple[List[dict], List[dict], List[dict], List[dict]]:
+        """Properties first_offset .. first_offset + count - 1 with their pictures, bookings and nights."""
+        args, rng = self.args, self.rng
+        properties, pictures, bookings, nights = [], [], [], []
+        first_guest = self.first_ids["users"] + args.hosts
+        for offset in range(first_offset, first_offset + count):
+            property_id = self.first_ids["properties"] + offset
+            city, state, latitude, longitude = self.cities[pick(self.city_weights, rng)]
+            latitude += rng.gauss(0, 0.04)
+            longitude += rng.gauss(0, 0.04)
+            properties.append({
+                "property_id": property_id,
+                "host_id": self.first_ids["users"] + pick(self.host_weights, rng),
+                "title": f"{rng.choice(ADJECTIVES)} {rng.choice(KINDS)} {rng.choice(FEATURES)}",
+                "address": f"{rng.randint(1, 400)} {rng.choice(STREETS)}, unit {property_id}",
+                "city": city,
+                "state": state,
+                "latitude": latitude,
+                "longitude": longitude,
+                "geo_cell": cell_id(latitude, longitude),
+            })
+            # 1 to max pictures, most listings near the mean
+            for position in range(max(1, min(args.max_pictures, round(rng.gauss(args.pictures_per_property, 2))))):
+                pictures.append({"property_id": property_id, "position": position,
+                                 "url": f"https://images.example.com/properties/{property_id}/{position}.jpg"})
+            if args.users == args.hosts:
+                continue
+            # long tail of demand: most listings get a few bookings, some get many
+            day = args.start_date + timedelta(days=rng.randrange(60))
+            for _ in range(int(rng.gammavariate(0.8, args.bookings_per_property / 0.8))):
+                stay = min(28, 1 + int(rng.expovariate(1 / 2.5))) # mostly weekends and short trips
+                booking_id = self.next_booking_id
+                self.next_booking_id += 1
+                bookings.append({"booking_id": booking_id, "guest_id": first_guest + pick(self.guest_weights, rng),
+                                 "property_id": property_id, "date_in": day, "date_out": day + timedelta(days=stay)})
+                nights.extend({"property_id": property_id, "night": day + timedelta(days=n), "booking_id": booking_id}
+                              for n in range(stay))
+                day += timedelta(days=stay + int(rng.expovariate(1 / args.gap_days)))
+        return properties, pictures, bookings, nights
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", required=True, help="database to fill (migrated first, existing rows are kept)")
+    parser.add_argument("--users", type=int, default=100000, help="hosts + guests")
+    parser.add_argument("--hosts", type=int, default=10000)
+    parser.add_argument("--properties", type=int, default=100000)
+    parser.add_argument("--pictures-per-property", type=float, default=5, help="mean")
+    parser.add_argument("--max-pictures", type=int, default=20)
+    parser.add_argument("--bookings-per-property", type=float, default=10, help="mean")
+    parser.add_argument("--cities", type=int, default=200)
+    parser.add_argument("--city-skew", type=float, default=1.1, help="Zipf exponent of listings per city")
+    parser.add_argument("--host-skew", type=float, default=1.2, help="Pareto alpha of listings per host (lower = heavier hosts)")
+    parser.add_argument("--guest-skew", type=float, default=1.5, help="Pareto alpha of bookings per guest")
+    parser.add_argument("--gap-days", type=float, default=6, help="mean free days between two stays")
+    parser.add_argument("--start-date", type=date.fromisoformat, default=date(2024, 1, 1))
+    parser.add_argument("--batch-size", type=int, default=5000, help="properties per transaction")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    if not 0 < args.hosts <= args.users:
+        parser.error("--hosts must be between 1 and --users")
+
+    engine = create_engine(args.database_url, **engine_options(args.database_url))
+    run_migrations(engine)
+    with engine.connect() as conn:
+        first_ids = {
+            name: conn.execute(select(func.coalesce(func.max(column), 0))).scalar_one() + 1
+            for name, column in [("users", User.user_id), ("properties", Property.property_id), ("bookings", Booking.booking_id)]
+        }
+
+    generator = Generator(args, first_ids)
+    counts = {"users": 0, "properties": 0, "property_pictures": 0, "bookings": 0, "booking_nights": 0}
+    timings = dict.fromkeys(counts, 0.0)
+
+    def write(conn, name: str, table, rows: List[dict]):
+        if rows:
+            start = time.perf_counter()
+            conn.execute(insert(table), rows)
+            timings[name] += time.perf_counter() - start
+            counts[name] += len(rows)
+
+    started = time.perf_counter()
+    for batch in batches(generator.users(), args.batch_size * 4):
+        with engine.begin() as conn:
+            write(conn, "users", User.__table__, batch)
+    for first_offset in range(0, args.properties, args.batch_size):
+        properties, pictures, bookings, nights = generator.property_batch(first_offset, min(args.batch_size, args.properties - first_offset))
+        with engine.begin() as conn:
+            write(conn, "properties", Property.__table__, properties)
+            write(conn, "property_pictures", PropertyPicture.__table__, pictures)
+            write(conn, "bookings", Booking.__table__, bookings)
+            write(conn, "booking_nights", BookingNight.__table__, nights)
+        print(f"\r{counts['properties']}/{args.properties} properties, {counts['bookings']} bookings "
+              f"({time.perf_counter() - started:.0f}s)", end="", flush=True)
+    print()
+
+    with engine.begin() as conn:
+        rebuild_facets(conn)
+        # cached pages and ETags must not survive rows written behind the routes' back
+        conn.execute(text("UPDATE catalog_versions SET version = version + 1 WHERE name = 'properties'"))
+    engine.dispose()
+
+    print_table([
+        {"table": name, "rows": count, "insert_s": timings[name], "rows_per_s": count / timings[name] if timings[name] else 0.0}
+        for name, count in counts.items()
+    ])
+    print(f"total {time.perf_counter() - started:.1f}s, seed {args.seed}, users' password {PASSWORD!r}")
+
+if __name__ == "__main__":
+    main()
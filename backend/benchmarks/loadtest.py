@@ -0,0 +1,294 @@
+"""Load test of the API hot paths: signup, login, browse, property details, booking creation, my-bookings.
+
+Seeds a dataset, then drives each scenario with N concurrent clients for a fixed duration and reports
+throughput and latency percentiles (p50/p95/p99), as a table and as JSON for comparing releases.
+
+- in-process (default): requests go through httpx's ASGI transport, no network or server in the way
+- --server: the same requests against a uvicorn process (--workers) serving the seeded database
+
+The dataset goes to a throw-away SQLite file, or to --database-url (a local database that must be empty).
+Users are real (password "password123") and requests carry real bearer tokens.
+
+    ENVIRONMENT=test python -m benchmarks.loadtest --properties 10000 --concurrency 1,16 --duration 5
+    ENVIRONMENT=test python -m benchmarks.loadtest --server --workers 2 --output release.json
+    ENVIRONMENT=test python -m benchmarks.loadtest --baseline release.json --max-regression 0.2
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+import httpx
+from sqlalchemy import text
+from sqlmodel import create_engine
+from app.core.db import engine_options
+from app.core.migrations import run_migrations
+from app.core.pagination import encode_cursor
+from app.core.security import create_access_token
+from benchmarks.common import bind_app, dispose_async_engines, drop_engine, percentile, print_table, reset_overrides, seed_catalog, temp_engine
+
+SCENARIOS = ["signup", "login", "browse", "details", "book", "my_bookings"]
+PASSWORD = "password123"
+
+
+class Dataset:
+    """What the scenarios need to know about the seeded data: id ranges and one token per guest."""
+
+    def __init__(self, properties: int, hosts: int, guests: int):
+        self.properties = properties
+        self.guest_ids = range(hosts + 1, hosts + guests + 1)
+        self.tokens = {
+            guest_id: create_access_token({"sub": str(guest_id), "role": "guest"}) for guest_id in self.guest_ids
+        }
+
+    def guest(self, rng: random.Random):
+        guest_id = rng.choice(self.guest_ids)
+        index = guest_id - self.guest_ids[0]
+        return f"guest{index or ''}@bench.local", {"Authorization": f"Bearer {self.tokens[guest_id]}"}
+
+
+Scenario = Callable[[httpx.AsyncClient, Dataset, random.Random], Awaitable[httpx.Response]]
+
+async def signup(client, data, rng):
+    return await client.post("/v1/users/signup", json={
+        "name": "Load Test", "email": f"load-{uuid.uuid4().hex}@example.com", "password": PASSWORD, "role": "guest"
+    })
+
+async def login(client, data, rng):
+    email, _ = data.guest(rng)
+    return await client.post("/v1/users/login", data={"username": email, "password": PASSWORD})
+
+async def browse(client, data, rng):
+    _, headers = data.guest(rng)
+    params = {"limit": 20}
+    if rng.random() < 0.8: # most sessions page past the first screen
+        params["cursor"] = encode_cursor(rng.randrange(data.properties))
+    return await client.get("/v1/properties", params=params, headers=headers)
+
+async def details(client, data, rng):
+    _, headers = data.guest(rng)
+    return await client.get(f"/v1/properties/{rng.randint(1, data.properties)}", headers=headers)
+
+async def book(client, data, rng):
+    # far past the seeded history: conflicts (400) only come from the load test's own bookings
+    _, headers = data.guest(rng)
+    date_in = date(2030, 1, 1) + timedelta(days=rng.randrange(3650))
+    return await client.post("/v1/bookings", headers=headers, json={
+        "property_id": rng.randint(1, data.properties),
+        "date_in": date_in.isoformat(),
+        "date_out": (date_in + timedelta(days=rng.randint(1, 7))).isoformat(),
+    })
+
+async def my_bookings(client, data, rng):
+    _, headers = data.guest(rng)
+    return await client.get("/v1/bookings/my-bookings", headers=headers)
+
+SCENARIO_FUNCTIONS: Dict[str, Scenario] = {
+    "signup": signup, "login": login, "browse": browse, "details": details, "book": book, "my_bookings": my_bookings,
+}
+
+
+async def run_scenario(client, data: Dataset, scenario: Scenario, concurrency: int, duration: float, warmup: float, seed: int) -> Dict:
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    failures = 0
+
+    async def worker(index: int, deadline: float, record: bool):
+        nonlocal failures
+        rng = random.Random(seed * 1000 + index)
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                response = await scenario(client, data, rng)
+            except httpx.HTTPError:
+                if record:
+                    failures += 1
+                continue
+            if record:
+                latencies.append((time.perf_counter() - start) * 1000)
+                statuses[response.status_code] += 1
+
+    if warmup > 0:
+        deadline = time.perf_counter() + warmup
+        await asyncio.gather(*(worker(index, deadline, record=False) for index in range(concurrency)))
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*(worker(index, deadline, record=True) for index in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "throughput_rps": len(latencies) / elapsed,
+        "mean_ms": statistics.fmean(latencies) if latencies else None,
+        "p50_ms": percentile(latencies, 0.50) if latencies else None,
+        "p95_ms": percentile(latencies, 0.95) if latencies else None,
+        "p99_ms": percentile(latencies, 0.99) if latencies else None,
+        "max_ms": latencies[-1] if latencies else None,
+        # 4xx are expected outcomes for some scenarios (booking conflicts), 5xx and transport errors aren't
+        "errors": failures + sum(count for status, count in statuses.items() if status >= 500),
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def start_server(database_url: str, workers: int, async_mode: bool) -> Tuple[subprocess.Popen, str]:
+    port = free_port()
+    env = {**os.environ, "DATABASE_URL": database_url, "DATABASE_ASYNC": str(async_mode).lower(), "DATABASE_ECHO": "false"}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--workers", str(workers), "--log-level", "warning"],
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    for _ in range(200):
+        try:
+            if httpx.get(f"{base_url}/ping", trust_env=False).status_code == 200:
+                return server, base_url
+        except httpx.TransportError:
+            pass
+        if server.poll() is not None:
+            break
+        time.sleep(0.05)
+    server.terminate()
+    raise RuntimeError("uvicorn did not start")
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def regressions(results: List[Dict], baseline: Dict, max_regression: float) -> List[str]:
+    """Scenarios slower (p95) or with less throughput than the baseline run, beyond `max_regression`."""
+    previous = {(row["scenario"], row["concurrency"]): row for row in baseline["results"]}
+    found = []
+    for row in results:
+        before = previous.get((row["scenario"], row["concurrency"]))
+        if before is None or not row["requests"] or not before["requests"]:
+            continue
+        if row["p95_ms"] > before["p95_ms"] * (1 + max_regression):
+            found.append(f"{row['scenario']} x{row['concurrency']}: p95 {before['p95_ms']:.1f} -> {row['p95_ms']:.1f} ms")
+        if row["throughput_rps"] < before["throughput_rps"] * (1 - max_regression):
+            found.append(f"{row['scenario']} x{row['concurrency']}: {before['throughput_rps']:.0f} -> {row['throughput_rps']:.0f} req/s")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--properties", type=int, default=10000)
+    parser.add_argument("--hosts", type=int, default=100)
+    parser.add_argument("--guests", type=int, default=1000)
+    parser.add_argument("--bookings", type=int, default=5, help="seeded bookings per property")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"comma separated, among {','.join(SCENARIOS)}")
+    parser.add_argument("--concurrency", default="1,16", help="comma separated numbers of concurrent clients")
+    parser.add_argument("--duration", type=float, default=5, help="seconds per scenario and concurrency")
+    parser.add_argument("--warmup", type=float, default=1, help="seconds of unrecorded requests first")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--async-mode", action="store_true", help="run the app on the async engine")
+    parser.add_argument("--server", action="store_true", help="run the app in a uvicorn process instead of in-process")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers (--server)")
+    parser.add_argument("--database-url", help="seed this (empty) database instead of a temporary SQLite file")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--baseline", help="JSON report of a previous run: exit 1 if a scenario regressed")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="tolerated p95/throughput change (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    scenarios = args.scenarios.split(",")
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    if args.database_url:
+        engine, path = create_engine(args.database_url, **engine_options(args.database_url)), None
+        run_migrations(engine)
+        with engine.connect() as conn:
+            if conn.execute(text("SELECT COUNT(*) FROM users")).scalar_one():
+                parser.error("--database-url must point to an empty database, it gets seeded")
+    else:
+        engine, path = temp_engine()
+    database_url = engine.url.render_as_string(hide_password=False)
+
+    server = None
+    results = []
+    try:
+        started = time.perf_counter()
+        seed_catalog(engine, properties=args.properties, bookings_per_property=args.bookings,
+                     hosts=args.hosts, guests=args.guests, seed=args.seed)
+        print(f"seeded {args.properties} properties, {args.guests} guests in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+        data = Dataset(args.properties, args.hosts, args.guests)
+
+        if args.server:
+            server, base_url = start_server(database_url, args.workers, args.async_mode)
+            transport = None
+        else:
+            base_url = "http://loadtest"
+            transport = httpx.ASGITransport(app=bind_app(engine, async_mode=args.async_mode, fake_auth=False))
+
+        async def run():
+            limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+            # trust_env off: an HTTP(S)_PROXY from the environment must not sit between us and the local server
+            async with httpx.AsyncClient(base_url=base_url, transport=transport, limits=limits, timeout=60, trust_env=False) as client:
+                for concurrency in [int(c) for c in args.concurrency.split(",")]:
+                    for name in scenarios:
+                        stats = await run_scenario(client, data, SCENARIO_FUNCTIONS[name], concurrency, args.duration, args.warmup, args.seed)
+                        results.append({"scenario": name, "concurrency": concurrency, **stats})
+                        print(f"{name} x{concurrency}: {stats['throughput_rps']:.0f} req/s, p95 {stats['p95_ms'] or 0:.1f} ms", file=sys.stderr)
+            await dispose_async_engines()
+
+        asyncio.run(run())
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        reset_overrides()
+        if path is not None:
+            drop_engine(engine, path)
+        else:
+            engine.dispose()
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "mode": f"uvicorn x{args.workers}" if args.server else "in-process",
+            "database": engine.url.get_backend_name(),
+            "database_async": args.async_mode,
+            "dataset": {"properties": args.properties, "hosts": args.hosts, "guests": args.guests, "bookings_per_property": args.bookings},
+            "duration_s": args.duration,
+        },
+        "results": results,
+    }
+    print_table([
+        {key: value for key, value in row.items() if key != "statuses"} | {"statuses": " ".join(f"{s}:{n}" for s, n in row["statuses"].items())}
+        for row in results
+    ])
+    if args.output:
+        with open(args.output, "w") as out:
+            json.dump(report, out, indent=2)
+    else:
+        print(json.dumps(report))
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            found = regressions(results, json.load(baseline_file), args.max_regression)
+        for line in found:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        sys.exit(1 if found else 0)
+
+if __name__ == "__main__":
+    main()
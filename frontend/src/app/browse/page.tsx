@@ -7,7 +7,7 @@ import { useRouter } from 'next/navigation';
 import { useEffect } from 'react';
 
 export default function BrowsePage() {
-  const { properties, loading, error } = useProperties();
+  const { properties, loading, error, hasMore, loadingMore, loadMore } = useProperties();
   const { isAuthenticated, isLoading } = useAuth();
   const router = useRouter();
 
@@ -47,6 +47,17 @@ export default function BrowsePage() {
             />
           ))}
         </div>
+        {hasMore && (
+          <div className="flex justify-center mt-8">
+            <button
+              onClick={loadMore}
+              disabled={loadingMore}
+              className="bg-rose-500 text-white px-4 py-2 rounded-lg hover:bg-rose-600 transition disabled:opacity-50"
+            >
+              {loadingMore ? 'Loading...' : 'Load more'}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   );
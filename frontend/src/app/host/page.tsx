@@ -9,7 +9,7 @@ import Image from 'next/image';
 import { apiDelete } from '@/lib/api';
 
 export default function HostDashboard() {
-  const { properties, loading, error, refetch } = useMyProperties();
+  const { properties, loading, error, refetch, hasMore, loadingMore, loadMore } = useMyProperties();
   const { userRole, isAuthenticated } = useAuth();
   const router = useRouter();
 
@@ -116,6 +116,17 @@ export default function HostDashboard() {
             ))}
           </div>
         )}
+        {hasMore && (
+          <div className="flex justify-center mt-8">
+            <button
+              onClick={loadMore}
+              disabled={loadingMore}
+              className="bg-rose-500 text-white px-4 py-2 rounded-lg hover:bg-rose-600 transition disabled:opacity-50"
+            >
+              {loadingMore ? 'Loading...' : 'Load more'}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   );
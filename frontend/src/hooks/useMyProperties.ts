@@ -1,5 +1,5 @@
 'use client';
-import { apiGet } from '@/lib/api';
+import { apiGetPage } from '@/lib/api';
 import { useState, useEffect, useRef, useCallback } from 'react';
 import { useAuth } from '@/contexts/AuthContext';
 import { jwtDecode } from 'jwt-decode';
@@ -24,6 +24,8 @@ export function useMyProperties() {
     const [properties, setProperties] = useState<Property[]>([]);
     const [loading, setLoading] = useState<boolean>(true);
     const [error, setError] = useState<Error | null>(null);
+    const [nextCursor, setNextCursor] = useState<string | null>(null);
+    const [loadingMore, setLoadingMore] = useState<boolean>(false);
     const { isAuthenticated, userRole } = useAuth();
     const mountedRef = useRef(true);
     const fetchTimeoutRef = useRef<NodeJS.Timeout>();
@@ -44,11 +46,15 @@ export function useMyProperties() {
             }
             lastFetchRef.current = now;
 
+            // first page only (also after a delete): the next ones are fetched on demand by loadMore
             console.log('Fetching host properties...');
-            const data = await apiGet<Property[]>('/v1/properties/mine', token);
+            const page = await apiGetPage<Property>('/v1/properties/mine', null, token);
+            const data = page.items;
             console.log('Received host properties:', data);
             
             if (mountedRef.current) {
+                setNextCursor(page.next_cursor);
+
                 // Deduplicate properties by property_id
                 const uniqueProperties = Array.from(
                     new Map(data.map(property => [property.property_id, property])).values()
@@ -72,6 +78,38 @@ export function useMyProperties() {
         }
     }, []);
 
+    const loadMore = useCallback(async () => {
+        if (!nextCursor || loadingMore) {
+            return;
+        }
+        setLoadingMore(true);
+        try {
+            const token = localStorage.getItem('token');
+            if (!token || !validateToken(token)) {
+                throw new Error('Not authenticated');
+            }
+            const page = await apiGetPage<Property>('/v1/properties/mine', nextCursor, token);
+            if (mountedRef.current) {
+                // Deduplicate properties by property_id
+                const uniqueProperties = Array.from(
+                    new Map([...propertiesRef.current, ...page.items].map(property => [property.property_id, property])).values()
+                );
+                propertiesRef.current = uniqueProperties;
+                setProperties(uniqueProperties);
+                setNextCursor(page.next_cursor);
+            }
+        } catch (err) {
+            console.error('Error fetching host properties:', err);
+            if (mountedRef.current) {
+                setError(err as Error);
+            }
+        } finally {
+            if (mountedRef.current) {
+                setLoadingMore(false);
+            }
+        }
+    }, [nextCursor, loadingMore]);
+
     const validateToken = (token: string): boolean => {
         try {
             const decoded = jwtDecode<JWTPayload>(token);
@@ -97,6 +135,7 @@ export function useMyProperties() {
         if (!isAuthenticated || userRole !== 'host') {
             setProperties([]);
             propertiesRef.current = [];
+            setNextCursor(null);
             setLoading(false);
             return;
         }
@@ -111,5 +150,5 @@ export function useMyProperties() {
 
     }, [isAuthenticated, userRole, fetchMyProperties]);
   
-    return { properties, loading, error, refetch: fetchMyProperties };
+    return { properties, loading, error, refetch: fetchMyProperties, hasMore: nextCursor !== null, loadingMore, loadMore };
 } 
\ No newline at end of file
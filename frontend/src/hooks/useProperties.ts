@@ -1,6 +1,6 @@
 'use client';
-import { apiGet } from '@/lib/api';
-import { useState, useEffect } from 'react';
+import { apiGetPage } from '@/lib/api';
+import { useState, useEffect, useCallback } from 'react';
 
 type Property = {
     property_id: number;
@@ -14,7 +14,9 @@ type Property = {
 
 export function useProperties() {
     const [properties, setProperties] = useState<Property[]>([]);
+    const [nextCursor, setNextCursor] = useState<string | null>(null);
     const [loading, setLoading] = useState<boolean>(true);
+    const [loadingMore, setLoadingMore] = useState<boolean>(false);
     const [error, setError] = useState<Error | null>(null);
   
     useEffect(() => {
@@ -24,8 +26,10 @@ export function useProperties() {
           if (!token) {
             throw new Error('Not authenticated');
           }
-          const data = await apiGet<Property[]>('/v1/properties', token);
-          setProperties(data);
+          // first page only, the next ones are fetched on demand by loadMore
+          const page = await apiGetPage<Property>('/v1/properties', null, token);
+          setProperties(page.items);
+          setNextCursor(page.next_cursor);
         } catch (err) {
           setError(err as Error);
         } finally {
@@ -34,7 +38,27 @@ export function useProperties() {
       }
       fetchProperties();
     }, []);
+
+    const loadMore = useCallback(async () => {
+      if (!nextCursor || loadingMore) {
+        return;
+      }
+      setLoadingMore(true);
+      try {
+        const token = localStorage.getItem('token');
+        if (!token) {
+          throw new Error('Not authenticated');
+        }
+        const page = await apiGetPage<Property>('/v1/properties', nextCursor, token);
+        setProperties(current => [...current, ...page.items]);
+        setNextCursor(page.next_cursor);
+      } catch (err) {
+        setError(err as Error);
+      } finally {
+        setLoadingMore(false);
+      }
+    }, [nextCursor, loadingMore]);
   
-    return { properties, loading, error };
+    return { properties, loading, error, hasMore: nextCursor !== null, loadingMore, loadMore };
   }
   
\ No newline at end of file
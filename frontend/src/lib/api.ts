@@ -69,6 +69,21 @@ export async function apiGet<T>(endpoint: string, token?: string): Promise<T> {
   return handleResponse(response);
 }
 
+export type Page<T> = {
+  items: T[];
+  next_cursor: string | null;
+};
+
+/**
+ * Paginated GET request: one page of a keyset-paginated list,
+ * the one after `cursor` when given (pass `next_cursor` back to get the following page)
+ */
+export async function apiGetPage<T>(endpoint: string, cursor?: string | null, token?: string): Promise<Page<T>> {
+  const separator = endpoint.includes('?') ? '&' : '?';
+  const url = cursor ? `${endpoint}${separator}cursor=${encodeURIComponent(cursor)}` : endpoint;
+  return apiGet<Page<T>>(url, token);
+}
+
 /**
  * Generic POST request
  */